@@ -0,0 +1,453 @@
+"""
+Micro-benchmarks of constructing library components and calling their actions.
+
+Builds every class in hwcomponents_library.__all__ with representative parameters at
+several scales (e.g., DAC resolutions of 4, 8, and 12 bits, SmartBufferSRAM sizes from
+1 Kb to 1 Mb, and JiaZeroComparators with 16 to 1024 comparators), and times each
+constructor and each action separately. Each case reports the time of its first call,
+which includes filling the library's caches, and the median and minimum time of the
+calls that follow.
+
+By default, the CACTI and NeuroSim backends are replaced by the local stubs in this
+file, so the benchmarks run offline, don't depend on the installed plugins, and time
+only this library's code. The stubs' costs are placeholders; use the real backends to
+time components end to end.
+
+Usage, from the repository root:
+
+    python benchmarks/components.py                       # every class
+    python benchmarks/components.py SmartBufferSRAM IsaacADC
+    python benchmarks/components.py --backends real       # CACTI and NeuroSim
+    python benchmarks/components.py --json > before.json
+    python benchmarks/components.py --compare before.json # exit 1 on slowdowns
+"""
+
+import argparse
+import inspect
+import json
+import logging
+import math
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Iterator
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import hwcomponents_library  # noqa: E402
+from hwcomponents import ActionCost, ComponentModel, action  # noqa: E402
+from hwcomponents_library.library._backends import replaced  # noqa: E402
+
+# Allowed slowdown of the median time before a case counts as a regression, as for
+# the import benchmark
+TIME_TOLERANCE = 0.5
+TIME_SLACK_S = 5e-6
+
+# Parameters used by every class that takes them
+COMMON = dict(
+    tech_node=32e-9,
+    width=64,
+    depth=None,
+    size=None,
+    resolution=8,
+    rows=64,
+    voltage=0.9,
+    cycle_period=2e-9,
+    adder_width=16,
+    multiplier_width=8,
+    n_bits=8,
+    scaling="conservative",
+)
+
+# Parameters of individual classes. Callables compute a parameter from the others.
+OVERRIDES = {
+    "IsaacEDRAM": dict(size=65536),
+    "AtomlayerEDRAM": dict(size=65536),
+    "NewtonEDRAM": dict(size=65536),
+    "RaaamEDRAM": dict(size=65536),
+    "AtomlayerRegisterLadder": dict(size=1024),
+    "AtomlayerInputBufferTransfers": dict(size=1024),
+    "TimelyInputOutputBuffer": dict(size=8192),
+    "SmartBufferSRAM": dict(size=65536),
+    "JiaZeroComparator": dict(n_comparators=64, voltage=0.85),
+    "NeurramShiftAdd": dict(voltage=1.5),
+    "NeurramVariablePrecisionADC": dict(voltage=1.5),
+    "NeurramAnalogSample": dict(voltage=1.5),
+    "NeurramAnalogIntegrator": dict(voltage=1.5),
+    "C2CMultiplier": dict(
+        unit_capacitance=1e-15,
+        # A triangular distribution of operand A
+        a_hist=lambda p: [
+            1 + min(i, 2 ** p["resolution"] - 1 - i)
+            for i in range(2 ** p["resolution"])
+        ],
+        b_bit_distribution=lambda p: [0.5] * p["resolution"],
+        tech_node=22e-9,
+    ),
+    "C2CLadderDAC": dict(unit_capacitance=1e-15, load_capacitance=1e-15),
+    "R2RLadderDAC": dict(unit_resistance=1e4, load_capacitance=1e-15),
+    "DualSidedR2RLadderDAC": dict(unit_resistance=1e4),
+    "Capacitor": dict(capacitance=1e-14),
+    "Wire": dict(length=1e-5),
+    "RaellaOutputCenterOffsetCorrect": dict(n_bits_per_output=8, n_center_entries=64),
+    "RaellaInputBuffer": dict(speculation_enabled=True, entry_bits=8, size=4096),
+    "RaellaFlagRegister": dict(n_flags=128, speculation_enabled=True),
+    "RaellaQuantEDRAM": dict(size=65536, width=16),
+    "ColonnadeCimLogicInputPort": dict(voltage=0.8, n_instances=4),
+    "ColonnadeCimLogic": dict(width=8),
+    "ColonnadeRegister": dict(width=8),
+}
+OVERRIDES["C2CMultiplierPortB"] = OVERRIDES["C2CMultiplier"]
+for _dac in ("C2CLadderDAC", "R2RLadderDAC", "DualSidedR2RLadderDAC"):
+    # A roughly normal distribution of DAC codes
+    OVERRIDES[_dac]["hist"] = lambda p: [
+        math.exp(-(((i / 2 ** p["resolution"] - 0.5) * 4) ** 2))
+        for i in range(2 ** p["resolution"])
+    ]
+
+# The values that each class is benchmarked at of the first of these parameters that it
+# takes, or of the parameter in SCALED_BY
+SCALES = {
+    "n_comparators": [16, 128, 1024],
+    "resolution": [4, 8, 12],
+    "size": [2**10, 2**15, 2**20],
+    "n_flags": [16, 128, 1024],
+    "width": [8, 32, 128],
+    "rows": [16, 64, 256],
+}
+SCALED_BY = {"AladdinRegister": "width"}
+
+# Arguments of actions that take them
+ACTION_ARGS = {
+    "raise_voltage_to": dict(target_voltage=0.3),
+    "switch": dict(value_probabilities=[1, 2, 3, 4, 5, 4, 3, 2, 1]),
+}
+
+
+# Stub backends. Their costs scale plausibly with their parameters, but are
+# placeholders.
+class _StubNeuroSim(ComponentModel):
+    """A NeuroSim component whose actions each cost a fixed energy per bit."""
+
+    energy_per_bit = 1e-15
+    area_per_bit = 1e-12
+
+    def __init__(
+        self,
+        tech_node: float,
+        cycle_period: float,
+        n_bits: int = 1,
+        n_adder_tree_inputs: int = 1,
+        n_instances: int = 1,
+    ):
+        self.n_bits = n_bits * n_adder_tree_inputs * n_instances
+        self.cycle_period = cycle_period
+        self._node_scale = (tech_node / 22e-9) ** 2
+        super().__init__(
+            area=self.area_per_bit * self.n_bits * self._node_scale,
+            leak_power=1e-9 * self.n_bits * self._node_scale,
+        )
+
+    def _cost(self) -> ActionCost:
+        return ActionCost(
+            energy=self.energy_per_bit * self.n_bits * self._node_scale,
+            latency=self.cycle_period,
+            throughput=1 / self.cycle_period,
+        )
+
+    @action
+    def read(self) -> ActionCost:
+        return self._cost()
+
+    @action
+    def write(self) -> ActionCost:
+        return self._cost()
+
+    @action
+    def compute(self) -> ActionCost:
+        return self._cost()
+
+    @action
+    def add(self) -> ActionCost:
+        return self._cost()
+
+    @action
+    def update(self) -> ActionCost:
+        return self._cost()
+
+    @action
+    def convert(self) -> ActionCost:
+        return self._cost()
+
+
+class StubFlipFlop(_StubNeuroSim):
+    energy_per_bit = 2e-15
+    area_per_bit = 5e-12
+
+
+class StubNOTGate(_StubNeuroSim):
+    energy_per_bit = 1e-16
+    area_per_bit = 1e-13
+
+
+class StubAdder(_StubNeuroSim):
+    energy_per_bit = 5e-15
+    area_per_bit = 1e-11
+
+
+class StubAdderTree(_StubNeuroSim):
+    energy_per_bit = 5e-15
+    area_per_bit = 1e-11
+
+
+class StubSRAM(ComponentModel):
+    """
+    An SRAM that resolves its width, depth, and size as CACTI's does, with costs that
+    scale with the square root of its size.
+    """
+
+    def __init__(
+        self,
+        tech_node: float,
+        width: int | None = None,
+        depth: int | None = None,
+        size: int | None = None,
+        n_rw_ports: int = 1,
+        n_banks: int = 1,
+    ):
+        if width is None:
+            if size is None:
+                raise ValueError("Either width or size must be provided.")
+            if depth is None:
+                width = max(16, math.ceil(math.sqrt(size)))
+            else:
+                width = size / depth
+        if depth is None:
+            depth = size / width
+        self.width = width
+        self.depth = depth
+        self.size = width * depth
+        self.n_rw_ports = n_rw_ports
+        self.n_banks = n_banks
+        node_scale = (tech_node / 22e-9) ** 2
+        self._energy = 1e-14 * width * math.sqrt(depth) * node_scale
+        super().__init__(
+            area=1e-13 * self.size * n_rw_ports * node_scale,
+            leak_power=1e-12 * self.size * node_scale,
+        )
+
+    @action(bits_per_action="width")
+    def read(self) -> ActionCost:
+        return ActionCost(
+            energy=self._energy, latency=1e-9, throughput=self.width / 1e-9
+        )
+
+    @action(bits_per_action="width")
+    def write(self) -> ActionCost:
+        return ActionCost(
+            energy=self._energy * 1.2, latency=1e-9, throughput=self.width / 1e-9
+        )
+
+
+STUBS = dict(
+    SRAM=StubSRAM,
+    FlipFlop=StubFlipFlop,
+    NOTGate=StubNOTGate,
+    Adder=StubAdder,
+    AdderTree=StubAdderTree,
+)
+
+
+def cases(names: list[str]) -> Iterator[tuple[str, str, type, dict]]:
+    """
+    Yields the benchmark cases of each class.
+
+    Parameters
+    ----------
+    names: list[str]
+        The names of the classes.
+
+    Returns
+    -------
+    Iterator[tuple[str, str, type, dict]]
+        The class name, a label of the scale, the class, and the constructor parameters
+        of each case.
+    """
+    for name in names:
+        cls = getattr(hwcomponents_library, name)
+        parameters = list(inspect.signature(cls.__init__).parameters)[1:]
+        defaults = {**COMMON, **OVERRIDES.get(name, {})}
+        scale = SCALED_BY.get(name, next((s for s in SCALES if s in parameters), None))
+        for value in SCALES[scale] if scale else [None]:
+            kwargs = {k: v for k, v in defaults.items() if k in parameters}
+            if scale:
+                kwargs[scale] = value
+            kwargs = {k: v(kwargs) if callable(v) else v for k, v in kwargs.items()}
+            yield name, f"{scale}={value}" if scale else "", cls, kwargs
+
+
+def time_calls(function: Callable, min_time: float, min_calls: int) -> dict:
+    """
+    Calls a function until it has run for `min_time` seconds and at least `min_calls`
+    times after the first call, and summarizes the times of the calls.
+
+    Returns
+    -------
+    dict
+        The time of the first call, and the number of calls that followed and their
+        median and minimum time, in seconds.
+    """
+    start = perf_counter()
+    function()
+    first = perf_counter() - start
+
+    times = []
+    deadline = perf_counter() + min_time
+    while len(times) < min_calls or perf_counter() < deadline:
+        start = perf_counter()
+        function()
+        times.append(perf_counter() - start)
+    return {
+        "first_s": first,
+        "median_s": statistics.median(times),
+        "min_s": min(times),
+        "calls": len(times),
+    }
+
+
+def _error(e: Exception) -> str:
+    return f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"
+
+
+def run(names: list[str], min_time: float, min_calls: int) -> dict[str, dict]:
+    """
+    Runs the benchmarks of the given classes.
+
+    Returns
+    -------
+    dict[str, dict]
+        The timings of each constructor and action, keyed by
+        "<class>[<scale>].<action>", where the action of constructors is "__init__".
+        Cases that failed have an "error" instead.
+    """
+    results = {}
+    for name, label, cls, kwargs in cases(names):
+        prefix = f"{name}[{label}]" if label else name
+        try:
+            results[f"{prefix}.__init__"] = time_calls(
+                lambda: cls(**kwargs), min_time, min_calls
+            )
+            component = cls(**kwargs)
+        except Exception as e:
+            results[f"{prefix}.__init__"] = {"error": _error(e)}
+            continue
+        for action_name in sorted(cls.get_action_names()):
+            function = getattr(component, action_name)
+            args = ACTION_ARGS.get(action_name, {})
+            try:
+                results[f"{prefix}.{action_name}"] = time_calls(
+                    lambda: function(**args), min_time, min_calls
+                )
+            except Exception as e:
+                results[f"{prefix}.{action_name}"] = {"error": _error(e)}
+    return results
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """Returns a description of every case that became slower than in `baseline`."""
+    problems = []
+    for case, r in current.items():
+        b = baseline.get(case)
+        if b is None or "median_s" not in b:
+            continue
+        if "median_s" not in r:
+            problems.append(f"{case}: failed, {r['error']}")
+            continue
+        limit = b["median_s"] * (1 + TIME_TOLERANCE) + TIME_SLACK_S
+        if r["median_s"] > limit:
+            problems.append(
+                f"{case}: took {r['median_s'] * 1e6:.1f}us, baseline "
+                f"{b['median_s'] * 1e6:.1f}us (limit {limit * 1e6:.1f}us)"
+            )
+    return problems
+
+
+def _main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "classes",
+        nargs="*",
+        help="Classes to benchmark. Defaults to every class in __all__.",
+    )
+    parser.add_argument(
+        "--backends",
+        choices=["stub", "real"],
+        default="stub",
+        help="Whether to use the stub or the installed CACTI and NeuroSim backends.",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="Seconds to spend calling each constructor and action.",
+    )
+    parser.add_argument(
+        "--min-calls",
+        type=int,
+        default=5,
+        help="Calls of each constructor and action after the first.",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="Results of an earlier --json run. Exits with an error on slowdowns.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    args = parser.parse_args()
+
+    names = args.classes or list(hwcomponents_library.__all__)
+    unknown = [n for n in names if n not in hwcomponents_library.__all__]
+    if unknown:
+        parser.error(f"Unknown classes: {', '.join(unknown)}")
+
+    # Components log every scaling step. Time the models, not the log handlers.
+    logging.disable(logging.CRITICAL)
+    if args.backends == "stub":
+        with replaced(**STUBS):
+            results = run(names, args.min_time, args.min_calls)
+    else:
+        results = run(names, args.min_time, args.min_calls)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'case':<64}{'first (us)':>12}{'median (us)':>13}{'min (us)':>11}")
+        for case, r in results.items():
+            if "error" in r:
+                print(f"{case:<64}  {r['error']}")
+                continue
+            print(
+                f"{case:<64}{r['first_s'] * 1e6:>12.1f}{r['median_s'] * 1e6:>13.1f}"
+                f"{r['min_s'] * 1e6:>11.1f}"
+            )
+
+    failed = [case for case, r in results.items() if "error" in r]
+    problems = []
+    if args.compare:
+        problems = compare(results, json.loads(args.compare.read_text()))
+    if problems:
+        print("\nRegressions against the baseline:", file=sys.stderr)
+        for p in problems:
+            print(f"  {p}", file=sys.stderr)
+    if failed:
+        print(f"\n{len(failed)} cases failed.", file=sys.stderr)
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    _main()
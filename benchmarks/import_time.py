@@ -0,0 +1,193 @@
+"""
+Cold-import benchmark for hwcomponents_library.
+
+Imports hwcomponents_library and each library module in a fresh interpreter and
+records the wall time of the import, the peak resident set size of the process, and
+the third-party packages that the import pulled in. Results are compared against
+the committed baseline in import_baseline.json; the script exits with an error if an
+import became slower, grew in memory, or started importing a new third-party
+package (e.g., an estimator plugin like hwcomponents_cacti landing on the import
+path of every component).
+
+Usage, from the repository root:
+
+    python benchmarks/import_time.py                     # compare to the baseline
+    python benchmarks/import_time.py --update-baseline   # re-record the baseline
+    python benchmarks/import_time.py hwcomponents_library.library.isaac
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "import_baseline.json"
+PACKAGE = "hwcomponents_library"
+
+# Allowed slowdown before a measurement counts as a regression. Relative tolerances
+# absorb machine-to-machine noise; absolute slack keeps tiny imports from flapping.
+WALL_TOLERANCE = 0.5
+WALL_SLACK_S = 0.02
+RSS_TOLERANCE = 0.2
+RSS_SLACK_KIB = 2048
+
+_PROBE = """
+import json, resource, sys, time
+
+before = set(sys.modules)
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+import {module}
+wall_s = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+# ru_maxrss is in bytes on macOS and in KiB elsewhere
+scale = 1024 if sys.platform == "darwin" else 1
+new = {{m.split(".")[0] for m in set(sys.modules) - before}}
+third_party = sorted(
+    m
+    for m in new
+    if m not in sys.stdlib_module_names
+    and m not in sys.builtin_module_names
+    and not m.startswith("_")
+    and m != "{package}"
+)
+print(json.dumps({{
+    "wall_s": wall_s,
+    "peak_rss_kib": rss // scale,
+    "rss_delta_kib": (rss - rss_before) // scale,
+    "third_party": third_party,
+}}))
+"""
+
+
+def default_targets() -> list[str]:
+    """Returns the package and every public module in hwcomponents_library.library."""
+    library = REPO_ROOT / PACKAGE / "library"
+    modules = sorted(
+        p.stem for p in library.glob("*.py") if not p.stem.startswith("_")
+    )
+    return [PACKAGE] + [f"{PACKAGE}.library.{m}" for m in modules]
+
+
+def measure(module: str, repeat: int) -> dict:
+    """
+    Imports a module in `repeat` fresh interpreters and summarizes the results.
+
+    Parameters
+    ----------
+    module: str
+        The module to import.
+    repeat: int
+        The number of fresh interpreters to import the module in.
+
+    Returns
+    -------
+    dict
+        Median wall time, median peak RSS, and the union of third-party packages.
+    """
+    runs = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, package=PACKAGE)],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+        runs.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+    return {
+        "wall_s": statistics.median(r["wall_s"] for r in runs),
+        "peak_rss_kib": int(statistics.median(r["peak_rss_kib"] for r in runs)),
+        "rss_delta_kib": int(statistics.median(r["rss_delta_kib"] for r in runs)),
+        "third_party": sorted(set().union(*(r["third_party"] for r in runs))),
+    }
+
+
+def compare(module: str, current: dict, baseline: dict | None) -> list[str]:
+    """Returns a description of every regression of `current` against `baseline`."""
+    if baseline is None:
+        return []
+    problems = []
+    wall_limit = baseline["wall_s"] * (1 + WALL_TOLERANCE) + WALL_SLACK_S
+    if current["wall_s"] > wall_limit:
+        problems.append(
+            f"{module}: import took {current['wall_s']:.3f}s, baseline "
+            f"{baseline['wall_s']:.3f}s (limit {wall_limit:.3f}s)"
+        )
+    rss_limit = baseline["rss_delta_kib"] * (1 + RSS_TOLERANCE) + RSS_SLACK_KIB
+    if current["rss_delta_kib"] > rss_limit:
+        problems.append(
+            f"{module}: import grew RSS by {current['rss_delta_kib']} KiB, baseline "
+            f"{baseline['rss_delta_kib']} KiB (limit {rss_limit:.0f} KiB)"
+        )
+    new_packages = sorted(set(current["third_party"]) - set(baseline["third_party"]))
+    if new_packages:
+        problems.append(
+            f"{module}: now imports third-party packages not in the baseline: "
+            f"{', '.join(new_packages)}"
+        )
+    return problems
+
+
+def _main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "targets",
+        nargs="*",
+        help="Modules to import. Defaults to the package and every library module.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Fresh interpreters per module. The median is reported.",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help=f"Write the measurements to {BASELINE_PATH.name}.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the measurements as JSON."
+    )
+    args = parser.parse_args()
+
+    targets = args.targets or default_targets()
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+
+    results = {}
+    problems = []
+    if not args.json:
+        print(f"{'module':<48}{'wall (ms)':>10}{'RSS+ (KiB)':>12}  third-party")
+    for module in targets:
+        results[module] = measure(module, args.repeat)
+        r = results[module]
+        if not args.json:
+            print(
+                f"{module:<48}{r['wall_s'] * 1e3:>10.1f}{r['rss_delta_kib']:>12}  "
+                f"{', '.join(r['third_party']) or '-'}"
+            )
+        problems += compare(module, r, baseline.get(module))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+    if args.update_baseline:
+        baseline.update(results)
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Wrote {BASELINE_PATH}")
+    elif problems:
+        print("\nRegressions against the baseline:", file=sys.stderr)
+        for p in problems:
+            print(f"  {p}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    _main()
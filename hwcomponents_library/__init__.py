@@ -1,113 +1,174 @@
-from hwcomponents_library.library.aladdin import *
-from hwcomponents_library.library.atomlayer import *
-from hwcomponents_library.library.brahms import *
-from hwcomponents_library.library.dummy import *
-from hwcomponents_library.library.forms import *
-from hwcomponents_library.library.isaac import *
-from hwcomponents_library.library.jia import *
-from hwcomponents_library.library.misc import *
-from hwcomponents_library.library.newton import *
-from hwcomponents_library.library.raella import *
-from hwcomponents_library.library.timely import *
-from hwcomponents_library.library.neurram import *
-from hwcomponents_library.library.albireo import *
-from hwcomponents_library.library.colonnade import *
-from hwcomponents_library.library.c2c_multiplier import *
-from hwcomponents_library.library.dac_c2c_r2r import *
+import importlib
+from typing import TYPE_CHECKING
 
+from hwcomponents_library.families import FAMILIES, selected_families
+
+if TYPE_CHECKING:
+    from hwcomponents_library.library.aladdin import *
+    from hwcomponents_library.library.atomlayer import *
+    from hwcomponents_library.library.brahms import *
+    from hwcomponents_library.library.dummy import *
+    from hwcomponents_library.library.forms import *
+    from hwcomponents_library.library.isaac import *
+    from hwcomponents_library.library.jia import *
+    from hwcomponents_library.library.misc import *
+    from hwcomponents_library.library.newton import *
+    from hwcomponents_library.library.raella import *
+    from hwcomponents_library.library.timely import *
+    from hwcomponents_library.library.neurram import *
+    from hwcomponents_library.library.albireo import *
+    from hwcomponents_library.library.colonnade import *
+    from hwcomponents_library.library.c2c_multiplier import *
+    from hwcomponents_library.library.dac_c2c_r2r import *
+
+# Each library module is imported the first time one of its components is accessed.
+# This keeps `import hwcomponents_library` cheap and avoids pulling in estimator
+# plugins (CACTI, NeuroSim) that a given job does not use.
+_EXPORTS: dict[str, list[str]] = {
+    "aladdin": [
+        "AladdinAdder",
+        "AladdinRegister",
+        "AladdinComparator",
+        "AladdinMultiplier",
+        "AladdinCounter",
+        "AladdinIntMAC",
+    ],
+    "atomlayer": [
+        "AtomlayerRegisterLadder",
+        "AtomlayerInputBufferTransfers",
+        "AtomlayerADC",
+        "AtomlayerDAC",
+        "AtomlayerRouter",
+        "AtomlayerEDRAM",
+        "AtomlayerEDRAMBus",
+        "AtomlayerShiftAdd",
+    ],
+    "brahms": [
+        "BrahmsDAC",
+    ],
+    "dummy": [
+        "DummyStorage",
+        "DummyCompute",
+        "DummyMemory",
+        "DummyNetwork",
+    ],
+    "forms": [
+        "FormsADC",
+        "FormsDAC",
+    ],
+    "isaac": [
+        "IsaacEDRAM",
+        "IsaacChip2ChipLink",
+        "IsaacRouterSharedByFour",
+        "IsaacADC",
+        "IsaacRouter",
+        "IsaacShiftAdd",
+        "IsaacEDRAMBus",
+        "IsaacDAC",
+    ],
+    "jia": [
+        "JiaShiftAdd",
+        "JiaZeroComparator",
+        "JiaDatapath",
+    ],
+    "misc": [
+        "RaaamEDRAM",
+        "SmartBufferSRAM",
+        # Moved from accelforge
+        "Capacitor",
+        "Wire",
+    ],
+    "newton": [
+        "NewtonADC",
+        "NewtonDAC",
+        "NewtonRouter",
+        "NewtonEDRAM",
+        "NewtonEDRAMBus",
+        "NewtonShiftAdd",
+    ],
+    "raella": [
+        "RaellaQuantMultiplier",
+        # Moved from accelforge
+        "RaellaOutputCenterOffsetCorrect",
+        "RaellaInputBuffer",
+        "RaellaFlagRegister",
+        "RaellaQuantEDRAM",
+    ],
+    "timely": [
+        "TimelyIAdder",
+        "TimelyPSubBuf",
+        "TimelyDTC",
+        "TimelyTDC",
+        "TimelyXSubBuf",
+        "TimelyChargingComparator",
+        "TimelyInputOutputBuffer",
+        "TimelyChip2ChipLink",
+    ],
+    "neurram": [
+        "NeurramShiftAdd",
+        "NeurramVariablePrecisionADC",
+        "NeurramAnalogSample",
+        "NeurramAnalogIntegrator",
+    ],
+    "albireo": [
+        "AlbireoTIA",
+        "AlbireoDAC",
+        "AlbireoMachZehnderModulator",
+        "AlbireoMicroRingResonator",
+        "AlbireoDoubleMicroRingResonator",
+        "AlbireoPhotodiode",
+        "AlbireoArrayedWaveguideGrating",
+        "AlbireoStarCoupler",
+        "AlbireoLaser",
+    ],
+    "colonnade": [
+        "ColonnadeCimLogic",
+        "ColonnadeCimLogicInputPort",
+        "ColonnadeRegister",
+    ],
+    "c2c_multiplier": [
+        "C2CMultiplier",
+        "C2CMultiplierPortB",
+    ],
+    "dac_c2c_r2r": [
+        "C2CLadderDAC",
+        "R2RLadderDAC",
+        "DualSidedR2RLadderDAC",
+    ],
+}
+
+_NAME_TO_MODULE: dict[str, str] = {
+    name: f"hwcomponents_library.library.{module}"
+    for module, names in _EXPORTS.items()
+    for name in names
+}
+
+# Only advertise the models of the families selected by HWCOMPONENTS_LIBRARY_FAMILIES
+# (all families if unset). Models of other families can still be imported by name.
+_selected_families = selected_families()
+_selected_modules = {
+    module
+    for family, modules in FAMILIES.items()
+    if _selected_families is None or family in _selected_families
+    for module in modules
+}
 __all__ = [
-    # From aladdin
-    "AladdinAdder",
-    "AladdinRegister",
-    "AladdinComparator",
-    "AladdinMultiplier",
-    "AladdinCounter",
-    "AladdinIntMAC",
-    # From atomlayer
-    "AtomlayerRegisterLadder",
-    "AtomlayerInputBufferTransfers",
-    "AtomlayerADC",
-    "AtomlayerDAC",
-    "AtomlayerRouter",
-    "AtomlayerEDRAM",
-    "AtomlayerEDRAMBus",
-    "AtomlayerShiftAdd",
-    # From brahms
-    "BrahmsDAC",
-    # From dummy
-    "DummyStorage",
-    "DummyCompute",
-    "DummyMemory",
-    "DummyNetwork",
-    # From forms
-    "FormsADC",
-    "FormsDAC",
-    # From isaac
-    "IsaacEDRAM",
-    "IsaacChip2ChipLink",
-    "IsaacRouterSharedByFour",
-    "IsaacADC",
-    "IsaacRouter",
-    "IsaacShiftAdd",
-    "IsaacEDRAMBus",
-    "IsaacDAC",
-    # From jia
-    "JiaShiftAdd",
-    "JiaZeroGate",
-    "JiaDatapath",
-    # From misc
-    "RaaamEDRAM",
-    "SmartBufferSRAM",
-    # From newton
-    "NewtonADC",
-    "NewtonDAC",
-    "NewtonRouter",
-    "NewtonEDRAM",
-    "NewtonEDRAMBus",
-    "NewtonShiftAdd",
-    # From raella
-    "RaellaQuantMultiplier",
-    # From timely
-    "TimelyIAdder",
-    "TimelyPSubBuf",
-    "TimelyDTC",
-    "TimelyTDC",
-    "TimelyXSubBuf",
-    "TimelyChargingComparator",
-    "TimelyInputOutputBuffer",
-    "TimelyChip2ChipLink",
-    # From wan
-    "NeurramShiftAdd",
-    "NeurramVariablePrecisionADC",
-    "NeurramAnalogSample",
-    "NeurramAnalogIntegrator",
-    # From albireo
-    "AlbireoTIA",
-    "AlbireoDAC",
-    "AlbireoMachZehnderModulator",
-    "AlbireoMicroRingResonator",
-    "AlbireoDoubleMicroRingResonator",
-    "AlbireoPhotodiode",
-    "AlbireoArrayedWaveguideGrating",
-    "AlbireoStarCoupler",
-    "AlbireoLaser",
-    # From colonnade
-    "ColonnadeCimLogic",
-    "ColonnadeCimLogicInputPort",
-    "ColonnadeRegister",
-    # From c2c_multiplier
-    "C2CMultiplier",
-    "C2CMultiplierPortB",
-    # From dac_c2c_r2r
-    "C2CLadderDAC",
-    "R2RLadderDAC",
-    "DualSidedR2RLadderDAC",
-    # From misc (moved from accelforge)
-    "Capacitor",
-    "Wire",
-    # From raella (moved from accelforge)
-    "RaellaOutputCenterOffsetCorrect",
-    "RaellaInputBuffer",
-    "RaellaFlagRegister",
-    "RaellaQuantEDRAM",
+    name
+    for module, names in _EXPORTS.items()
+    if module in _selected_modules
+    for name in names
 ]
+
+
+def __getattr__(name: str):
+    module = _NAME_TO_MODULE.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
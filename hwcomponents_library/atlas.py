@@ -0,0 +1,516 @@
+"""
+Precomputed cost atlas of the table-driven models.
+
+The atlas stores the area, leak power, and action costs of every table-driven model
+(every model with reference data, see hwcomponents_library.reference) over a dense grid
+of its parameters: tech nodes, widths, depths, resolutions, rows, and voltages. It is
+one binary file that is memory-mapped when read, so many processes on one host share
+one page-cached copy, and looking up a cost doesn't construct any component:
+
+    from hwcomponents_library.atlas import load_atlas
+
+    atlas = load_atlas()
+    atlas.cost("IsaacADC", "convert", tech_node=45e-9, resolution=6)
+    atlas.value("IsaacADC", "area", tech_node=45e-9, resolution=6)
+
+Costs between grid points are interpolated one parameter at a time, following the
+scaling functions of hwcomponents.scaling: tech nodes linearly (throughputs
+harmonically), as tech node scaling is piecewise linear between its nodes, and other
+parameters geometrically on a log scale, which is exact for costs that scale as a power
+of the parameter. Lookups match constructed components up to rounding. Parameters
+outside the grid raise an error; construct the component instead.
+
+The atlas is stored in $HWCOMPONENTS_LIBRARY_CACHE_DIR, or ~/.cache/hwcomponents_library
+if that is not set. To build it, or show what it contains, run:
+
+    python -m hwcomponents_library.atlas [--build] [--path PATH] [MODEL ...]
+
+File format: the magic bytes b"HWCATLAS", the format version (uint32), four reserved
+bytes, and the length of the header (uint64), all little-endian; then the header, a
+UTF-8 JSON object; then, aligned to 64 bytes, the data, little-endian float64s. For each
+model, the header gives the parameter of each grid axis, the axis values, the names of
+the columns (as in batch.evaluate), and the byte offset of its data in the data section.
+Each model's data is an array with one dimension per axis and a last dimension for the
+columns, in C order.
+"""
+
+import argparse
+import json
+import math
+import os
+import struct
+import sys
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+
+import numpy as np
+from hwcomponents import ActionCost
+from hwcomponents.scaling.techscaling import TECH_NODES
+
+from hwcomponents_library.cacti_cache import CACHE_DIR_ENV_VAR
+
+ATLAS_VERSION = 1
+_MAGIC = b"HWCATLAS"
+_PREAMBLE = struct.Struct("<8sIIQ")
+_ALIGNMENT = 64
+_FILE_NAME = "cost_atlas.bin"
+
+# The grid of each parameter. The value of each parameter in a model's reference design
+# is added to the model's grid, so that lookups of the reference point are exact.
+GRIDS: dict[str, list[float]] = {
+    "tech_node": sorted(TECH_NODES),
+    "width": [2**i for i in range(17)],
+    "width_a": [2**i for i in range(17)],
+    "width_b": [2**i for i in range(17)],
+    "depth": [2**i for i in range(21)],
+    "rows": [2**i for i in range(13)],
+    "resolution": list(range(1, 17)),
+    "voltage": [round(0.5 + 0.1 * i, 1) for i in range(16)],
+}
+
+# Parameters whose axes are interpolated linearly rather than on a log scale. Tech node
+# scaling is piecewise linear between the nodes of hwcomponents.scaling.
+_LINEAR_AXES = frozenset({"tech_node"})
+
+# Parameters that set other parameters instead of having their own axis.
+# AladdinMultiplier(width=w) is AladdinMultiplier(width_a=w, width_b=w).
+_ALIASES: dict[str, dict[str, list[str]]] = {
+    "AladdinMultiplier": {"width": ["width_a", "width_b"]},
+}
+
+
+def _default_path() -> Path:
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if cache_dir is None:
+        cache_dir = Path.home() / ".cache" / "hwcomponents_library"
+    return Path(cache_dir) / _FILE_NAME
+
+
+def _library_version() -> str:
+    try:
+        return metadata.version("hwcomponents_library")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _table_driven_models() -> list[str]:
+    from hwcomponents_library.manifest import load_manifest, load_model
+    from hwcomponents_library.reference import reference_model
+
+    models = []
+    for name in sorted(load_manifest()["models"]):
+        try:
+            reference_model(load_model(name))
+        except ValueError:
+            continue
+        models.append(name)
+    return models
+
+
+def _build_model(name: str) -> tuple[dict, np.ndarray]:
+    from hwcomponents_library.batch import evaluate
+    from hwcomponents_library.manifest import load_model
+    from hwcomponents_library.reference import reference_model
+
+    model = load_model(name)
+    reference = reference_model(model)
+    defaults = dict(zip(reference.parameters, reference.defaults))
+    aliases = _ALIASES.get(name, {})
+    parameters = [p for p in reference.parameters if p not in aliases]
+    axes = [sorted(set(GRIDS[p]) | {defaults[p]}) for p in parameters]
+
+    grid = np.meshgrid(*axes, indexing="ij")
+    table = {p: g.ravel() for p, g in zip(parameters, grid)}
+    costs = evaluate(model, table)
+    columns = list(costs)
+    data = np.stack([costs[c] for c in columns], axis=-1)
+    entry = {
+        "parameters": parameters,
+        "axes": axes,
+        "reference": [defaults[p] for p in parameters],
+        # Whether each reference value was added to the grid
+        "added": [defaults[p] not in GRIDS[p] for p in parameters],
+        "aliases": aliases,
+        "columns": columns,
+    }
+    return entry, data.reshape(*(len(a) for a in axes), len(columns))
+
+
+def build_atlas(
+    path: Path | str | None = None, models: list[str] | None = None
+) -> Path:
+    """
+    Evaluates the models over their parameter grids and writes the atlas. The file is
+    replaced atomically, so processes that have the previous atlas mapped keep reading
+    it.
+
+    Parameters
+    ----------
+    path: Path | str | None
+        The file to write. Defaults to the atlas in the cache directory.
+    models: list[str] | None
+        The names of the model classes to include. Defaults to every table-driven model.
+
+    Returns
+    -------
+    Path
+        The file written.
+    """
+    path = Path(path) if path is not None else _default_path()
+    if models is None:
+        models = _table_driven_models()
+
+    entries, blocks, offset = {}, [], 0
+    for name in models:
+        entry, data = _build_model(name)
+        entry["offset"] = offset
+        entries[name] = entry
+        blocks.append(data)
+        offset += data.nbytes
+
+    header = json.dumps(
+        {
+            "version": ATLAS_VERSION,
+            "library_version": _library_version(),
+            "models": entries,
+        }
+    ).encode()
+    start = _PREAMBLE.size + len(header)
+    padding = -start % _ALIGNMENT
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_PREAMBLE.pack(_MAGIC, ATLAS_VERSION, 0, len(header)))
+        f.write(header)
+        f.write(b"\0" * padding)
+        for data in blocks:
+            f.write(np.ascontiguousarray(data, dtype="<f8").tobytes())
+    os.replace(tmp_path, path)
+    load_atlas.cache_clear()
+    return path
+
+
+def _position(axis: list[float], value: float, log: bool) -> tuple[int, int, float]:
+    """
+    Returns the grid points around a value on an axis and the value's position between
+    them, from 0 to 1.
+    """
+    if value < axis[0] or value > axis[-1]:
+        raise ValueError
+    i = int(np.searchsorted(axis, value))
+    if axis[i] == value:
+        return i, i, 0.0
+    low, high = axis[i - 1], axis[i]
+    if log and low > 0:
+        return i - 1, i, math.log(value / low) / math.log(high / low)
+    return i - 1, i, (value - low) / (high - low)
+
+
+def _blend(
+    low: np.ndarray, high: np.ndarray, t: float, linear: bool, harmonic: np.ndarray
+) -> np.ndarray:
+    """
+    Interpolates between the values at two grid points, at position t between them.
+    Values are interpolated linearly on linear axes, except those marked harmonic, whose
+    reciprocals are, and geometrically on log axes. Values that are not positive are
+    interpolated linearly, and values that are infinite at either point are infinite.
+    """
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        result = (1 - t) * low + t * high
+        positive = (low > 0) & (high > 0)
+        if linear:
+            reciprocal = 1 / ((1 - t) / low + t / high)
+            result = np.where(harmonic & positive, reciprocal, result)
+        else:
+            geometric = low ** (1 - t) * high**t
+            result = np.where(positive, geometric, result)
+    return np.where(np.isinf(low) | np.isinf(high), np.inf, result)
+
+
+class Atlas:
+    """
+    A memory-mapped cost atlas.
+
+    Parameters
+    ----------
+    path: Path | str
+        The atlas file.
+
+    Attributes
+    ----------
+    path: Path
+        The atlas file.
+    library_version: str
+        The version of hwcomponents_library that built the atlas.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            preamble = f.read(_PREAMBLE.size)
+            if len(preamble) < _PREAMBLE.size:
+                raise ValueError(f"{self.path} is not a cost atlas.")
+            magic, version, _, header_length = _PREAMBLE.unpack(preamble)
+            if magic != _MAGIC:
+                raise ValueError(f"{self.path} is not a cost atlas.")
+            if version != ATLAS_VERSION:
+                raise ValueError(
+                    f"{self.path} is a version {version} cost atlas, but version "
+                    f"{ATLAS_VERSION} is required. Rebuild it with `python -m "
+                    f"hwcomponents_library.atlas --build`."
+                )
+            header = json.loads(f.read(header_length))
+        start = _PREAMBLE.size + header_length
+        start += -start % _ALIGNMENT
+
+        self.library_version: str = header["library_version"]
+        self._entries: dict[str, dict] = header["models"]
+        self._data: dict[str, np.ndarray] = {}
+        data = np.empty(0)
+        if os.path.getsize(self.path) > start:
+            data = np.memmap(self.path, dtype="<f8", mode="r", offset=start)
+        for name, entry in self._entries.items():
+            shape = (*(len(a) for a in entry["axes"]), len(entry["columns"]))
+            first = entry["offset"] // 8
+            self._data[name] = data[first : first + math.prod(shape)].reshape(shape)
+            entry["column_index"] = {c: i for i, c in enumerate(entry["columns"])}
+            entry["harmonic"] = np.array(
+                [c.endswith(".throughput") for c in entry["columns"]]
+            )
+            # ComponentModel.scale doesn't scale at the reference value, so costs may
+            # jump there (e.g., tech node scaling from a node between those of
+            # hwcomponents.scaling). If the reference value was added to the grid,
+            # other values are interpolated between the other grid points.
+            entry["interpolation"] = []
+            for axis, reference, added in zip(
+                entry["axes"], entry["reference"], entry["added"]
+            ):
+                index = axis.index(reference)
+                others = list(range(len(axis)))
+                if added and 0 < index < len(axis) - 1:
+                    others.remove(index)
+                points = [axis[i] for i in others]
+                entry["interpolation"].append((index, points, others))
+
+    @property
+    def models(self) -> list[str]:
+        """The names of the model classes in the atlas."""
+        return list(self._entries)
+
+    def parameters(self, model: type | str) -> dict[str, list[float]]:
+        """
+        Returns the grid of each parameter of a model.
+
+        Parameters
+        ----------
+        model: type | str
+            The model class or its name.
+
+        Returns
+        -------
+        dict[str, list[float]]
+            The grid values of each parameter.
+        """
+        entry = self._entry(model)
+        return dict(zip(entry["parameters"], entry["axes"]))
+
+    def columns(self, model: type | str) -> list[str]:
+        """
+        Returns the columns stored for a model: "area", "leak_power", and
+        "<action>.energy", "<action>.latency", and "<action>.throughput" for each
+        action that can be called without arguments.
+
+        Parameters
+        ----------
+        model: type | str
+            The model class or its name.
+
+        Returns
+        -------
+        list[str]
+            The column names.
+        """
+        return list(self._entry(model)["columns"])
+
+    def _entry(self, model: type | str) -> dict:
+        name = model if isinstance(model, str) else model.__name__
+        entry = self._entries.get(name)
+        if entry is None:
+            raise ValueError(
+                f"{name} is not in the cost atlas {self.path}. Models in the atlas "
+                f"are: {', '.join(self._entries)}"
+            )
+        return entry
+
+    def value(self, model: type | str, column: str, **parameters) -> float:
+        """
+        Looks up one column of a model, interpolating between grid points.
+
+        Parameters
+        ----------
+        model: type | str
+            The model class or its name.
+        column: str
+            The column, e.g., "area" or "convert.energy" (see `columns`).
+        parameters
+            The constructor parameters. Parameters that are not given take the value of
+            the model's reference design.
+
+        Returns
+        -------
+        float
+            The value of the column.
+        """
+        name = model if isinstance(model, str) else model.__name__
+        entry = self._entry(name)
+        index = entry["column_index"].get(column)
+        if index is None:
+            raise ValueError(
+                f"{name} has no column {column} in the cost atlas. Its columns are: "
+                f"{', '.join(entry['columns'])}"
+            )
+        return float(self._interpolate(name, entry, parameters)[index])
+
+    def cost(self, model: type | str, action: str, **parameters) -> ActionCost:
+        """
+        Looks up the cost of one action of a model, interpolating between grid points.
+
+        Parameters
+        ----------
+        model: type | str
+            The model class or its name.
+        action: str
+            The name of the action.
+        parameters
+            The constructor parameters. Parameters that are not given take the value of
+            the model's reference design.
+
+        Returns
+        -------
+        ActionCost
+            The energy, latency, and throughput of the action.
+        """
+        name = model if isinstance(model, str) else model.__name__
+        entry = self._entry(name)
+        index = entry["column_index"]
+        if f"{action}.energy" not in index:
+            actions = sorted(
+                {c.rsplit(".", 1)[0] for c in entry["columns"] if "." in c}
+            )
+            raise ValueError(
+                f"{name} has no action {action} in the cost atlas. Its actions are: "
+                f"{', '.join(actions)}"
+            )
+        values = self._interpolate(name, entry, parameters)
+        return ActionCost(
+            energy=float(values[index[f"{action}.energy"]]),
+            latency=float(values[index[f"{action}.latency"]]),
+            throughput=float(values[index[f"{action}.throughput"]]),
+        )
+
+    def _interpolate(self, name: str, entry: dict, parameters: dict) -> np.ndarray:
+        parameters = dict(parameters)
+        for alias, targets in entry["aliases"].items():
+            value = parameters.pop(alias, None)
+            if value is not None:
+                parameters.update({target: value for target in targets})
+        unknown = set(parameters) - set(entry["parameters"])
+        if unknown:
+            raise ValueError(
+                f"The cost atlas has no grid over {', '.join(sorted(unknown))} for "
+                f"{name}. Its parameters are: {', '.join(entry['parameters'])}"
+            )
+
+        modes = [(p in _LINEAR_AXES, entry["harmonic"]) for p in entry["parameters"]]
+        positions = []
+        for parameter, axis, reference, (index, points, indices) in zip(
+            entry["parameters"],
+            entry["axes"],
+            entry["reference"],
+            entry["interpolation"],
+        ):
+            value = parameters.get(parameter)
+            if value is None or value == reference:
+                positions.append((index, index, 0.0))
+                continue
+            try:
+                i, j, t = _position(points, value, parameter not in _LINEAR_AXES)
+            except ValueError:
+                raise ValueError(
+                    f"{parameter}={value} is outside the cost atlas grid for {name} "
+                    f"([{axis[0]}, {axis[-1]}]). Construct the component instead."
+                ) from None
+            positions.append((indices[i], indices[j], t))
+
+        block = np.array(self._data[name][np.ix_(*([i, j] for i, j, _ in positions))])
+        # Interpolate one axis at a time, last to first. As each cost is a product of
+        # per-parameter scales, this is exact if each axis is.
+        for axis in reversed(range(len(positions))):
+            _, _, t = positions[axis]
+            low, high = block.take(0, axis), block.take(1, axis)
+            block = low if t == 0 else _blend(low, high, t, *modes[axis])
+        return block
+
+
+@lru_cache(maxsize=None)
+def load_atlas(path: Path | str | None = None) -> Atlas:
+    """
+    Opens the cost atlas. Each file is mapped once per process.
+
+    Parameters
+    ----------
+    path: Path | str | None
+        The atlas file. Defaults to the atlas in the cache directory.
+
+    Returns
+    -------
+    Atlas
+        The atlas.
+    """
+    path = Path(path) if path is not None else _default_path()
+    if not path.exists():
+        raise FileNotFoundError(
+            f"No cost atlas at {path}. Build it with `python -m "
+            f"hwcomponents_library.atlas --build`."
+        )
+    return Atlas(path)
+
+
+def _main():
+    parser = argparse.ArgumentParser(
+        prog="python -m hwcomponents_library.atlas",
+        description="Build or show the precomputed cost atlas of the table-driven "
+        "models.",
+    )
+    parser.add_argument("--build", action="store_true", help="Build the atlas.")
+    parser.add_argument(
+        "--path", default=None, help="The atlas file. Defaults to the cache directory."
+    )
+    parser.add_argument(
+        "models",
+        nargs="*",
+        help="The models to include when building. Defaults to every table-driven "
+        "model.",
+    )
+    args = parser.parse_args()
+
+    if args.build:
+        path = build_atlas(args.path, args.models or None)
+        print(f"Wrote {path}")
+    try:
+        atlas = load_atlas(args.path)
+    except FileNotFoundError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    print(f"path: {atlas.path}")
+    print(f"library_version: {atlas.library_version}")
+    print(f"size: {os.path.getsize(atlas.path)} bytes")
+    for name in atlas.models:
+        grid = ", ".join(f"{p}: {len(a)}" for p, a in atlas.parameters(name).items())
+        print(f"{name}: {grid}")
+
+
+if __name__ == "__main__":
+    _main()
@@ -1,10 +1,399 @@
+import inspect
+import sys
+import threading
+from abc import ABCMeta
+from collections import OrderedDict, namedtuple
+from functools import lru_cache, wraps
+from numbers import Number
+from types import MappingProxyType
+
 from hwcomponents import ComponentModel, action, ActionCost
+from hwcomponents.model import _apply_scale_func
 from hwcomponents.scaling import *
+from hwcomponents_library.reference import COSTS, reference_model
+
+FlyweightCacheInfo = namedtuple(
+    "FlyweightCacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+# Attributes that actions and logging update on every instance, including cached ones
+_MUTABLE_ATTRIBUTES = frozenset(
+    {
+        "_energy_used",
+        "_latency_used",
+        "_throughput_used",
+        "_currently_calling_action",
+        "_logger",
+    }
+)
+
+FrozenCost = namedtuple("FrozenCost", ["energy", "latency", "throughput"])
+
+_UNCACHEABLE = object()
+_SIMPLE_TYPES = frozenset({int, float, str, bool, type(None)})
+
+# Set by hwcomponents_library.profiling while it is enabled. The per-instance stand-ins
+# for actions (see _frozen_action and _broadcast_action) bypass the class attributes
+# that profiling wraps, so they report their calls to it through this hook instead:
+# _action_hook(component, name, call, *args, **kwargs) returns call(*args, **kwargs).
+_action_hook = None
+
+
+def _canonicalize(value):
+    """
+    Returns a hashable key for a constructor argument, or _UNCACHEABLE. Equal numbers
+    map to the same key regardless of type (e.g., 256, 256.0, and numpy.int64(256)).
+    """
+    if type(value) in _SIMPLE_TYPES:
+        return value
+    if isinstance(value, (str, bool)):
+        return value
+    if isinstance(value, Number):
+        item = getattr(value, "item", None)
+        return item() if callable(item) else value
+    if isinstance(value, (list, tuple)):
+        items = tuple(_canonicalize(v) for v in value)
+        return _UNCACHEABLE if _UNCACHEABLE in items else items
+    if isinstance(value, dict):
+        items = tuple(sorted((k, _canonicalize(v)) for k, v in value.items()))
+        return _UNCACHEABLE if any(v is _UNCACHEABLE for _, v in items) else items
+    return _UNCACHEABLE
+
+
+@lru_cache(maxsize=None)
+def _init_parameters(cls: type) -> tuple[tuple[str, ...], dict] | None:
+    """
+    Returns the names of the constructor's parameters (excluding self) and their
+    defaults, or None if the constructor takes *args or **kwargs.
+    """
+    parameters = list(inspect.signature(cls.__init__).parameters.values())[1:]
+    if any(
+        p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD, p.POSITIONAL_ONLY)
+        for p in parameters
+    ):
+        return None
+    defaults = {p.name: p.default for p in parameters if p.default is not p.empty}
+    return tuple(p.name for p in parameters), defaults
+
+
+def _inside_component_init() -> bool:
+    """
+    Returns whether the caller is (indirectly) running in the __init__ of a
+    ComponentModel. Subcomponents built there are always built fresh and kept private,
+    because their parent may rescale them.
+    """
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_code.co_name == "__init__" and isinstance(
+            frame.f_locals.get("self"), ComponentModel
+        ):
+            return True
+        frame = frame.f_back
+    return False
+
+
+class _FlyweightCache:
+    def __init__(self):
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class _FlyweightMeta(ABCMeta):
+    """
+    Serves constructor calls of classes with a flyweight cache enabled from the cache.
+    """
+
+    _caches: dict[type, _FlyweightCache] = {}
+
+    def __call__(cls, *args, **kwargs):
+        maxsize = cls._flyweight_cache_size
+        if not maxsize or _inside_component_init():
+            return super().__call__(*args, **kwargs)
+
+        key = cls._flyweight_key(args, kwargs)
+        if key is None:
+            return super().__call__(*args, **kwargs)
+
+        cache = _FlyweightMeta._caches.setdefault(cls, _FlyweightCache())
+        with cache.lock:
+            instance = cache.entries.get(key)
+            if instance is not None:
+                cache.entries.move_to_end(key)
+                cache.hits += 1
+        if instance is not None:
+            instance.logger.info("Reusing cached %s with %s", cls.__name__, kwargs)
+            return instance
+
+        instance = super().__call__(*args, **kwargs)
+        instance._freeze()
+        with cache.lock:
+            cache.misses += 1
+            # Another thread may have built the same instance; keep the first one
+            instance = cache.entries.setdefault(key, instance)
+            cache.entries.move_to_end(key)
+            while len(cache.entries) > maxsize:
+                cache.entries.popitem(last=False)
+                cache.evictions += 1
+        return instance
+
+    def _flyweight_key(cls, args: tuple, kwargs: dict) -> tuple | None:
+        parameters = _init_parameters(cls)
+        if parameters is None:
+            return None
+        names, defaults = parameters
+        if len(args) > len(names):
+            return None  # Let the constructor raise its own error
+        arguments = dict(zip(names, args))
+        for name, value in kwargs.items():
+            if name in arguments or name not in names:
+                return None
+            arguments[name] = value
+        key = []
+        for name in names:
+            if name in arguments:
+                value = _canonicalize(arguments[name])
+            elif name in defaults:
+                value = _canonicalize(defaults[name])
+            else:
+                return None
+            if value is _UNCACHEABLE:
+                return None
+            key.append(value)
+        return (cls, tuple(key))
+
+
+def _is_array(value) -> bool:
+    """Returns whether a value is a NumPy array with at least one dimension."""
+    # No array can exist unless NumPy was imported, so don't import it here
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray) and value.ndim > 0
+
+
+def _minimum(a, b):
+    """Returns the elementwise minimum of two numbers or arrays."""
+    if _is_array(a) or _is_array(b):
+        return sys.modules["numpy"].minimum(a, b)
+    return min(a, b)
+
+
+class _ComparableArray:
+    """
+    Wraps a value so that it can be compared and hashed even if it is an array, as
+    ComponentModel.resolve_multiple_ways_to_calculate_value puts its results in a set.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other) -> bool:
+        numpy = sys.modules["numpy"]
+        return isinstance(other, _ComparableArray) and bool(
+            numpy.array_equal(self.value, other.value)
+        )
+
+    def __hash__(self) -> int:
+        return hash(getattr(self.value, "shape", ()))
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+
+def _comparable_result(func):
+    def compute(**kwargs):
+        value = func(**kwargs)
+        return None if value is None else _ComparableArray(value)
+
+    return compute
+
+
+@lru_cache(maxsize=None)
+def _takes_no_arguments(function) -> bool:
+    """Returns whether a method can be called with no arguments besides self."""
+    parameters = list(inspect.signature(function).parameters.values())[1:]
+    return all(
+        p.default is not p.empty or p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD)
+        for p in parameters
+    )
+
+
+def _bits_per_action(action):
+    """
+    Returns the bits_per_action argument that an @action was declared with: an
+    attribute name, a number, or None. Wrappers of the action (e.g., for profiling) are
+    followed through their __wrapped__ attribute.
+    """
+    while action is not None:
+        nonlocals = inspect.getclosurevars(action).nonlocals
+        if "bits_per_action" in nonlocals:
+            return nonlocals["bits_per_action"]
+        action = getattr(action, "__wrapped__", None)
+    return None
+
 
+def _frozen_action(component: ComponentModel, method, cost: FrozenCost):
+    """
+    Returns a stand-in for a bound action that returns a stored cost. Like the @action
+    wrapper, it adds the cost to the component's used energy and latency so that a
+    parent component still accounts for it. Calls with arguments, and calls nested in
+    another action of the component, run the action itself.
+    """
+    state = component.__dict__
+    name = method.__name__
+    energy, latency, throughput = cost
 
-class LibraryEstimatorClassBase(ComponentModel):
+    def call(*args, **kwargs):
+        if args or kwargs or state.get("_currently_calling_action"):
+            return method(*args, **kwargs)
+        state["_energy_used"] += energy
+        state["_latency_used"] += latency
+        state["_throughput_used"] = _minimum(state["_throughput_used"], throughput)
+        return ActionCost(energy=energy, latency=latency, throughput=throughput)
+
+    @wraps(method)
+    def frozen(*args, **kwargs):
+        if _action_hook is not None:
+            return _action_hook(component, name, call, *args, **kwargs)
+        return call(*args, **kwargs)
+
+    return frozen
+
+
+def _broadcast_action(component: ComponentModel, method, bits_per_action):
+    """
+    Returns a stand-in for a bound action of a component with array-valued scales. It
+    does what the @action wrapper does for a component without subcomponents, but with
+    elementwise arithmetic, as the wrapper compares costs and scales as scalars. Calls
+    nested in another action of the component run the action itself, which returns
+    the unscaled cost.
+    """
+    state = component.__dict__
+    name = method.__name__
+    function = method._original_function
+
+    def call(*args, **kwargs):
+        if state.get("_currently_calling_action"):
+            return method(*args, **kwargs)
+        bits = None
+        if bits_per_action is not None:
+            bits = kwargs.pop("bits_per_action", None)
+        state["_currently_calling_action"] = True
+        try:
+            cost = function(component, *args, **kwargs)
+        finally:
+            state["_currently_calling_action"] = False
+        if not isinstance(cost, ActionCost):
+            raise ValueError(
+                f"@action function {function.__name__} returned an invalid value. "
+                f"Expected an ActionCost, got {cost}."
+            )
+
+        scale = 1
+        if bits is not None:
+            if isinstance(bits_per_action, Number):
+                scale = bits / bits_per_action
+            else:
+                scale = bits / getattr(component, bits_per_action)
+        energy = cost.energy * component.energy_scale * scale
+        latency = cost.latency * component.latency_scale
+        throughput = cost.throughput * component.throughput_scale / scale
+        state["_energy_used"] = state["_energy_used"] + energy
+        state["_latency_used"] = state["_latency_used"] + latency
+        state["_throughput_used"] = _minimum(state["_throughput_used"], throughput)
+        return ActionCost(energy=energy, latency=latency, throughput=throughput)
+
+    @wraps(method)
+    def broadcast(*args, **kwargs):
+        if _action_hook is not None:
+            return _action_hook(component, name, call, *args, **kwargs)
+        return call(*args, **kwargs)
+
+    return broadcast
+
+
+class FreezableMixin:
+    """
+    Lets a ComponentModel be made read-only and have its action costs frozen. Mix in
+    after ComponentModel.
+    """
+
+    def __setattr__(self, name: str, value):
+        if self.__dict__.get("_frozen", False) and name not in _MUTABLE_ATTRIBUTES:
+            raise AttributeError(
+                f"Cannot set {name} on a read-only {self.__class__.__name__}. "
+                f"Instances returned by the flyweight cache are shared, and instances "
+                f"with frozen costs would return stale costs. Construct a new "
+                f"{self.__class__.__name__} (with the flyweight cache disabled via "
+                f"{self.__class__.__name__}.disable_flyweight_cache(), if it is "
+                f"cached) to get an instance that can be modified or rescaled."
+            )
+        super().__setattr__(name, value)
+
+    def _freeze(self):
+        """Makes this instance and its freezable subcomponents read-only."""
+        if self.__dict__.get("_frozen", False):
+            return
+        subcomponents = getattr(self, "subcomponents", None)
+        if subcomponents is not None:
+            for subcomponent in subcomponents:
+                if isinstance(subcomponent, FreezableMixin):
+                    subcomponent._freeze()
+            self.subcomponents = tuple(subcomponents)
+        self._frozen = True
+
+    @property
+    def frozen_costs(self) -> MappingProxyType | None:
+        """
+        The cost of each action, as stored by freeze_costs, or None if the costs are
+        not frozen.
+        """
+        return self.__dict__.get("_frozen_costs")
+
+    def freeze_costs(self):
+        """
+        Evaluates every action that takes no arguments once and stores the results in
+        an immutable table, frozen_costs. Later calls of these actions without
+        arguments return the stored cost directly, skipping the @action machinery
+        (argument handling, scaling, subcomponent accounting, and logging). Calls with
+        arguments, such as bits_per_action, still run the action.
+
+        Rescaling the component afterwards would make the table stale, so the
+        component becomes read-only.
+
+        Returns
+        -------
+        The component itself, so it can be frozen where it is constructed.
+        """
+        if self.frozen_costs is not None:
+            return self
+        costs = {}
+        for name in type(self).get_action_names():
+            function = getattr(type(self), name)._original_function
+            if not _takes_no_arguments(function):
+                continue
+            # Evaluating the costs is not a use of the component
+            used = (self._energy_used, self._latency_used, self._throughput_used)
+            cost = getattr(self, name)()
+            self._energy_used, self._latency_used, self._throughput_used = used
+            costs[name] = FrozenCost(cost.energy, cost.latency, cost.throughput)
+
+        self._freeze()
+        # Set through __dict__, as the component is now read-only
+        self.__dict__["_frozen_costs"] = MappingProxyType(costs)
+        for name, cost in costs.items():
+            self.__dict__[name] = _frozen_action(self, getattr(self, name), cost)
+        return self
+
+
+class LibraryEstimatorClassBase(
+    ComponentModel, FreezableMixin, metaclass=_FlyweightMeta
+):
     priority: float = 0.8
 
+    _flyweight_cache_size: int = 0
+
     @action
     def write(self) -> ActionCost:
         """Default write returns zero energy and latency."""
@@ -14,3 +403,293 @@ class LibraryEstimatorClassBase(ComponentModel):
     def read(self) -> ActionCost:
         """Default read returns zero energy and latency."""
         return ActionCost(energy=0.0, throughput=float("inf"), latency=0.0)
+
+    def _init_from_reference(self, **parameters):
+        """
+        Initializes this component from the reference data of its class (see
+        hwcomponents_library.reference). Its area and leak power are those of the
+        reference design, scaled to the given parameter values along with its action
+        costs, and each parameter that is not None is set as an attribute.
+
+        Parameters
+        ----------
+        parameters
+            The value of each scaled parameter in the reference data. Parameters that
+            are None are not scaled.
+        """
+        reference = reference_model(type(self))
+        if parameters.keys() != set(reference.parameters):
+            raise ValueError(
+                f"{type(self).__name__} must be initialized from its reference data "
+                f"with the parameters {', '.join(reference.parameters)}. Got "
+                f"{', '.join(parameters)}."
+            )
+        super().__init__(leak_power=reference.leak_power, area=reference.area)
+        values = tuple(parameters[name] for name in reference.parameters)
+
+        scales = None
+        # Arrays and strings (e.g., a tech node of "32nm") need scale to broadcast or
+        # parse them
+        if not any(_is_array(v) or isinstance(v, str) for v in values):
+            scales, factors = reference.scales(values)
+        if scales is None:
+            for name, default, value in zip(
+                reference.parameters, reference.defaults, values
+            ):
+                if value is not None:
+                    area, energy, latency, leak_power, throughput = (
+                        reference.functions[name]
+                    )
+                    self.scale(
+                        name,
+                        value,
+                        default,
+                        area_scale_function=area,
+                        energy_scale_function=energy,
+                        latency_scale_function=latency,
+                        leak_power_scale_function=leak_power,
+                        throughput_scale_function=throughput,
+                    )
+        else:
+            (
+                self._area_scale,
+                self._energy_scale,
+                self._latency_scale,
+                self._leak_power_scale,
+                self._throughput_scale,
+            ) = scales
+            for i, c, factor in factors:
+                self.logger.info(
+                    f"Scaled {reference.parameters[i]} from {reference.defaults[i]} "
+                    f"to {values[i]}: {COSTS[c]}_scale multiplied by {factor}"
+                )
+
+        for name, value in parameters.items():
+            if value is not None:
+                setattr(self, name, value)
+
+    def _reference_cost(self, action: str) -> ActionCost:
+        """
+        Returns the cost of an action of the reference design, before scaling, from
+        the reference data of this component's class.
+        """
+        energy, latency, throughput = (
+            reference_model(type(self)).actions[action].cost(self)
+        )
+        return ActionCost(energy=energy, latency=latency, throughput=throughput)
+
+    def scale(
+        self,
+        key: str,
+        target,
+        default: float,
+        area_scale_function=None,
+        energy_scale_function=None,
+        latency_scale_function=None,
+        leak_power_scale_function=None,
+        throughput_scale_function=None,
+        include_subcomponents: bool = True,
+    ):
+        """
+        Scales this model's area, energy, latency, leak power, and throughput to the
+        given target, as ComponentModel.scale does. The target may also be a NumPy
+        array, in which case the scales become arrays: one component then models a
+        grid of parameter values, and its area, leak power, and the energy, latency,
+        and throughput of its actions are arrays, broadcast across the array-valued
+        parameters with NumPy's broadcasting rules. For example,
+        IsaacADC(tech_node=np.array([[65e-9], [32e-9]]), resolution=np.arange(4, 13))
+        returns 2x9 arrays. Elements equal to the default are not scaled, and each
+        scaling function is called once per distinct element.
+
+        Array-valued parameters are only supported on components without
+        subcomponents.
+
+        Parameters
+        ----------
+        key: str
+            The name of the parameter to scale. Used for logging.
+        target: float | numpy.ndarray
+            The target value or values of the parameter.
+        default: float
+            The value the parameter is scaled from.
+        area_scale_function, energy_scale_function, latency_scale_function,
+        leak_power_scale_function, throughput_scale_function
+            The functions (or tuples of composed functions) to scale each cost with.
+            None if the cost should not be scaled.
+        include_subcomponents: bool
+            Whether to also scale the subcomponents by the same factors.
+
+        Returns
+        -------
+        The target.
+        """
+        if not _is_array(target):
+            return super().scale(
+                key,
+                target,
+                default,
+                area_scale_function=area_scale_function,
+                energy_scale_function=energy_scale_function,
+                latency_scale_function=latency_scale_function,
+                leak_power_scale_function=leak_power_scale_function,
+                throughput_scale_function=throughput_scale_function,
+                include_subcomponents=include_subcomponents,
+            )
+        if self.subcomponents:
+            raise ValueError(
+                f"{self._component_name()}.{key} is an array, but array-valued "
+                f"parameters are only supported on components without subcomponents. "
+                f"Construct one {self._component_name()} per value instead."
+            )
+        numpy = sys.modules["numpy"]
+        self._init_logger(self._component_name())
+        values, inverse = numpy.unique(target, return_inverse=True)
+        for attr, scale_method, callfunc in [
+            ("area_scale", self.scale_area, area_scale_function),
+            ("energy_scale", self.scale_energy, energy_scale_function),
+            ("latency_scale", self.scale_latency, latency_scale_function),
+            ("leak_power_scale", self.scale_leak_power, leak_power_scale_function),
+            ("throughput_scale", self.scale_throughput, throughput_scale_function),
+        ]:
+            if callfunc is None:
+                continue
+            factors = numpy.array(
+                [
+                    1.0 if v == default else _apply_scale_func(callfunc, v, default)
+                    for v in values.tolist()
+                ],
+                dtype=float,
+            )
+            scale_method(factors[inverse.ravel()].reshape(target.shape))
+            self.logger.info(
+                f"Scaled {key} from {default} to {target}: {attr} multiplied by "
+                f"{factors} for the values {values}"
+            )
+        self._broadcast_actions()
+        return target
+
+    def resolve_multiple_ways_to_calculate_value(self, name: str, *args):
+        """
+        Parses multiple possible ways to set an attribute, as
+        ComponentModel.resolve_multiple_ways_to_calculate_value does, also accepting
+        array-valued arguments. Array results must be equal elementwise.
+        """
+        if not any(_is_array(v) for _, _, kwargs in args for v in kwargs.values()):
+            return super().resolve_multiple_ways_to_calculate_value(name, *args)
+        args = [(fname, _comparable_result(f), kwargs) for fname, f, kwargs in args]
+        return super().resolve_multiple_ways_to_calculate_value(name, *args).value
+
+    def assert_int(self, name: str, value):
+        """
+        Checks that a value is an integer and returns it as one, as
+        ComponentModel.assert_int does. Arrays are checked elementwise and returned as
+        integer arrays.
+        """
+        if not _is_array(value):
+            return super().assert_int(name, value)
+        numpy = sys.modules["numpy"]
+        if not numpy.issubdtype(value.dtype, numpy.number) or not numpy.all(
+            value == numpy.round(value)
+        ):
+            raise ValueError(f"{name} must be an integer. Got {value}.")
+        return value.astype(int)
+
+    def _broadcast_actions(self):
+        """
+        Replaces the actions of this component with ones that support array-valued
+        scales, once.
+        """
+        if self.__dict__.get("_broadcasting", False):
+            return
+        for name in type(self).get_action_names():
+            bits_per_action = _bits_per_action(getattr(type(self), name))
+            self.__dict__[name] = _broadcast_action(
+                self, getattr(self, name), bits_per_action
+            )
+        self._broadcasting = True
+
+    @classmethod
+    def enable_flyweight_cache(cls, maxsize: int = 1024):
+        """
+        Enables the flyweight cache for this class and its subclasses. Constructing a
+        component with the same arguments as a cached instance returns the cached
+        instance instead of building a new one. Cached instances are shared, so they
+        are read-only: scaling them or setting their attributes raises an
+        AttributeError. Each class keeps its own cache, and the least recently used
+        instances are evicted once a cache holds more than `maxsize` instances.
+
+        Arguments are matched after binding them to the constructor's signature and
+        applying defaults, so positional, keyword, and defaulted arguments with the
+        same values share an instance, as do equal numbers of different types.
+        Constructions with arguments that are not numbers, strings, or lists, tuples,
+        or dicts of them are never cached.
+
+        Parameters
+        ----------
+        maxsize: int
+            The maximum number of instances to cache per class.
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}.")
+        cls._set_flyweight_cache_size(maxsize)
+        for cached_cls, cache in _FlyweightMeta._caches.items():
+            if issubclass(cached_cls, cls):
+                with cache.lock:
+                    while len(cache.entries) > maxsize:
+                        cache.entries.popitem(last=False)
+                        cache.evictions += 1
+
+    @classmethod
+    def disable_flyweight_cache(cls):
+        """
+        Disables the flyweight cache for this class and its subclasses and drops their
+        cached instances.
+        """
+        cls._set_flyweight_cache_size(0)
+        cls.clear_flyweight_cache()
+
+    @classmethod
+    def _set_flyweight_cache_size(cls, maxsize: int):
+        # Subclasses with their own size inherit this one instead
+        pending = list(cls.__subclasses__())
+        while pending:
+            subclass = pending.pop()
+            if "_flyweight_cache_size" in subclass.__dict__:
+                del subclass._flyweight_cache_size
+            pending.extend(subclass.__subclasses__())
+        cls._flyweight_cache_size = maxsize
+
+    @classmethod
+    def clear_flyweight_cache(cls):
+        """
+        Drops the cached instances of this class and its subclasses and resets their
+        hit, miss, and eviction counters.
+        """
+        for cached_cls in list(_FlyweightMeta._caches):
+            if issubclass(cached_cls, cls):
+                with _FlyweightMeta._caches[cached_cls].lock:
+                    _FlyweightMeta._caches[cached_cls] = _FlyweightCache()
+
+    @classmethod
+    def flyweight_cache_info(cls) -> FlyweightCacheInfo:
+        """
+        Returns the statistics of the flyweight caches of this class and its
+        subclasses, summed over classes.
+
+        Returns
+        -------
+        FlyweightCacheInfo
+            The hits, misses, and evictions of the caches, the maximum number of
+            instances cached per class, and the number of instances currently cached.
+        """
+        hits = misses = evictions = currsize = 0
+        for cached_cls, cache in list(_FlyweightMeta._caches.items()):
+            if issubclass(cached_cls, cls):
+                with cache.lock:
+                    hits += cache.hits
+                    misses += cache.misses
+                    evictions += cache.evictions
+                    currsize += len(cache.entries)
+        return FlyweightCacheInfo(
+            hits, misses, evictions, cls._flyweight_cache_size, currsize
+        )
@@ -0,0 +1,202 @@
+"""
+Columnar evaluation of library models.
+
+`evaluate` takes a model and a table of constructor parameters, one column per
+parameter and one row per component, and returns a table of the components' area, leak
+power, and the energy, latency, and throughput of each of their actions:
+
+    from hwcomponents_library import batch
+
+    costs = batch.evaluate(
+        "IsaacADC",
+        {"tech_node": [65e-9, 32e-9, 32e-9], "resolution": [8, 8, 10]},
+    )
+    costs["area"], costs["convert.energy"]
+
+Identical rows are evaluated once. Table-driven models evaluate every distinct row with
+one component with array-valued parameters (see LibraryEstimatorClassBase.scale).
+Models that can't take arrays, such as those backed by CACTI or NeuroSim, are
+constructed once per distinct row instead.
+"""
+
+from numbers import Number
+
+import numpy as np
+
+from hwcomponents import ComponentModel
+from hwcomponents_library.base import LibraryEstimatorClassBase, _takes_no_arguments
+
+
+def _resolve_model(class_or_name: type | str) -> type:
+    if not isinstance(class_or_name, str):
+        return class_or_name
+    from hwcomponents_library.manifest import find_components, load_manifest, load_model
+
+    if class_or_name in load_manifest()["models"]:
+        return load_model(class_or_name)
+    found = find_components(class_or_name)
+    if not found:
+        raise ValueError(
+            f"{class_or_name} is neither a model nor a component name in "
+            f"hwcomponents_library."
+        )
+    return load_model(found[0]["class_name"])
+
+
+def _column(values) -> np.ndarray:
+    try:
+        column = np.asarray(values)
+        if column.ndim <= 1:
+            return column
+    except ValueError:
+        pass
+    # List-valued parameters, such as histograms, have one list per row. They're kept
+    # as tuples so that rows can be compared.
+    column = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        column[i] = tuple(value) if isinstance(value, list) else value
+    return column
+
+
+def _columns(table) -> dict[str, np.ndarray]:
+    """Returns the columns of a dict of arrays, pandas DataFrame, or Arrow table."""
+    if hasattr(table, "column_names"):  # pyarrow.Table or pyarrow.RecordBatch
+        columns = {n: table.column(n).to_numpy() for n in table.column_names}
+    elif hasattr(table, "columns") and hasattr(table, "to_numpy"):  # DataFrame
+        columns = {n: table[n].to_numpy() for n in table.columns}
+    else:
+        columns = {n: _column(v) for n, v in dict(table).items()}
+
+    lengths = {len(c) for c in columns.values() if c.ndim > 0}
+    if len(lengths) > 1:
+        raise ValueError(
+            f"All columns of the table must have the same length. Got columns of "
+            f"lengths {', '.join(f'{n}: {len(c)}' for n, c in columns.items())}."
+        )
+    n_rows = lengths.pop() if lengths else 1
+    return {n: np.broadcast_to(c, (n_rows,)) for n, c in columns.items()}
+
+
+def _default_actions(model: type) -> list[str]:
+    """Returns the actions of a model that can be called without arguments."""
+    return [
+        name
+        for name in sorted(model.get_action_names())
+        if _takes_no_arguments(getattr(model, name)._original_function)
+    ]
+
+
+def _cost_names(actions: list[str]) -> list[str]:
+    """Returns the names of the cost columns of the given actions, as _costs does."""
+    costs = ("energy", "latency", "throughput")
+    return ["area", "leak_power"] + [f"{a}.{c}" for a in actions for c in costs]
+
+
+def _costs(component: ComponentModel, actions: list[str]) -> dict:
+    costs = {"area": component.area, "leak_power": component.leak_power}
+    for name in actions:
+        cost = getattr(component, name)()
+        costs[f"{name}.energy"] = cost.energy
+        costs[f"{name}.latency"] = cost.latency
+        costs[f"{name}.throughput"] = cost.throughput
+    return costs
+
+
+def _evaluate_vectorized(model: type, rows: list[tuple], names: list[str], actions):
+    """
+    Evaluates the rows with one component with array-valued parameters. Returns None if
+    the model can't be evaluated this way.
+    """
+    if not issubclass(model, LibraryEstimatorClassBase):
+        return None
+    kwargs = {}
+    for i, name in enumerate(names):
+        values = [row[i] for row in rows]
+        if all(v == values[0] for v in values):
+            kwargs[name] = values[0]
+        elif all(isinstance(v, Number) for v in values):
+            kwargs[name] = np.asarray(values)
+        else:
+            return None
+    try:
+        costs = _costs(model(**kwargs), actions)
+        return {
+            k: np.broadcast_to(np.asarray(v, dtype=float), (len(rows),))
+            for k, v in costs.items()
+        }
+    except (TypeError, ValueError):
+        # An array that the model can't broadcast, e.g., a parameter that is used in a
+        # condition, or a model with subcomponents. These are constructed row by row
+        # instead, which reports errors that are not due to the arrays.
+        return None
+
+
+def _evaluate_rows(model: type, rows: list[tuple], names: list[str], actions):
+    results = []
+    for row in rows:
+        kwargs = dict(zip(names, row))
+        try:
+            component = model(**kwargs)
+        except Exception as e:
+            raise ValueError(
+                f"Could not construct {model.__name__} with {kwargs}: {e}"
+            ) from e
+        results.append(_costs(component, actions))
+    return {k: np.array([r[k] for r in results], dtype=float) for k in results[0]}
+
+
+def evaluate(
+    class_or_name: type | str,
+    table,
+    actions: list[str] | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Evaluates a model for every row of a table of constructor parameters.
+
+    Parameters
+    ----------
+    class_or_name: type | str
+        The model class, or the name of a model or component in this library. A
+        component name resolves to the highest-priority model that implements it.
+    table: dict | pandas.DataFrame | pyarrow.Table
+        The constructor parameters, one column per parameter. Parameters that are not
+        columns take their default values. Scalars are used for every row.
+    actions: list[str] | None
+        The actions to evaluate. Defaults to every action that can be called without
+        arguments.
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        One column per cost, each with one entry per row of the table: "area",
+        "leak_power", and "<action>.energy", "<action>.latency", and
+        "<action>.throughput" for each action. The dict can be passed to
+        pandas.DataFrame or pyarrow.table as is.
+    """
+    model = _resolve_model(class_or_name)
+    columns = _columns(table)
+    if actions is None:
+        actions = _default_actions(model)
+
+    # Evaluate each distinct row once
+    names = list(columns)
+    if names:
+        index: dict[tuple, int] = {}
+        inverse = np.fromiter(
+            (
+                index.setdefault(row, len(index))
+                for row in zip(*(columns[n].tolist() for n in names))
+            ),
+            dtype=np.intp,
+            count=len(columns[names[0]]),
+        )
+        rows = list(index)
+    else:
+        rows, inverse = [()], np.zeros(1, dtype=np.intp)
+    if not rows:
+        return {name: np.empty(0, dtype=float) for name in _cost_names(actions)}
+
+    costs = _evaluate_vectorized(model, rows, names, actions)
+    if costs is None:
+        costs = _evaluate_rows(model, rows, names, actions)
+    return {name: column[inverse] for name, column in costs.items()}
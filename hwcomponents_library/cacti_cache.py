@@ -0,0 +1,390 @@
+"""
+Persistent cache of CACTI SRAM results.
+
+SmartBufferSRAM builds its SRAM through this cache. The results of each CACTI
+evaluation (read and write energy, leak power, area, cycle period, and access time) are
+stored in an SQLite database keyed on the SRAM's resolved size, width, depth, tech node,
+number of ports, and number of banks, so sweeps that revisit the same buffers only run
+CACTI once, across processes and across runs. SQLite handles concurrent readers and
+writers, so many sweep workers can share one cache.
+
+Entries are tagged with the installed hwcomponents-cacti version, and entries from other
+versions are dropped when the cache is opened. The cache holds at most `max_entries`
+entries; the least recently used entries are dropped beyond that.
+
+The cache is stored in $HWCOMPONENTS_LIBRARY_CACHE_DIR, or ~/.cache/hwcomponents_library
+if that is not set. Setting HWCOMPONENTS_LIBRARY_CACTI_CACHE=0 disables it. To inspect
+or clear it, run:
+
+    python -m hwcomponents_library.cacti_cache [--clear]
+
+Components built on the cache pickle like those built on CACTI directly. `--check`
+verifies that a SmartBufferSRAM survives a pickle round trip.
+"""
+
+import argparse
+import logging
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+
+CACHE_DIR_ENV_VAR = "HWCOMPONENTS_LIBRARY_CACHE_DIR"
+ENABLED_ENV_VAR = "HWCOMPONENTS_LIBRARY_CACTI_CACHE"
+DEFAULT_MAX_ENTRIES = 65536
+_FILE_NAME = "cacti_sram.sqlite"
+_SCHEMA_VERSION = 1
+
+# The values returned by CACTI for one SRAM, in the order that
+# hwcomponents_cacti's _Memory._interp_tech_node returns them
+_VALUES = (
+    "read_energy",
+    "write_energy",
+    "leak_power",
+    "area",
+    "cycle_period",
+    "access_time",
+)
+_KEY = (
+    "cache_type",
+    "size",
+    "width",
+    "depth",
+    "tech_node",
+    "n_rw_ports",
+    "n_banks",
+    "associativity",
+    "tag_size",
+)
+
+_logger = logging.getLogger(__name__)
+
+
+def _default_path() -> Path:
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if cache_dir is None:
+        cache_dir = Path.home() / ".cache" / "hwcomponents_library"
+    return Path(cache_dir) / _FILE_NAME
+
+
+@lru_cache(maxsize=1)
+def _cacti_version() -> str:
+    try:
+        return metadata.version("hwcomponents-cacti")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class _CactiCache:
+    def __init__(self):
+        self.path: Path = _default_path()
+        self.max_entries: int = DEFAULT_MAX_ENTRIES
+        self.enabled: bool = os.environ.get(ENABLED_ENV_VAR, "1") != "0"
+        self.lock = threading.Lock()
+        # Least recently used first
+        self.memo: OrderedDict[tuple, tuple] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._connection: sqlite3.Connection | None = None
+        self._connection_pid: int | None = None
+
+    def connection(self) -> sqlite3.Connection | None:
+        """Opens the database, once per process. Returns None if it can't be used."""
+        if self._connection is not None and self._connection_pid == os.getpid():
+            return self._connection
+        self._connection = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=60, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            columns = ", ".join(
+                f"{k} {'TEXT' if k == 'cache_type' else 'REAL'}" for k in _KEY
+            )
+            values = ", ".join(f"{v} REAL" for v in _VALUES)
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS sram_v{_SCHEMA_VERSION} ("
+                f"cacti_version TEXT, {columns}, {values}, last_used REAL, "
+                f"PRIMARY KEY (cacti_version, {', '.join(_KEY)}))"
+            )
+            connection.execute(
+                f"DELETE FROM sram_v{_SCHEMA_VERSION} WHERE cacti_version != ?",
+                (_cacti_version(),),
+            )
+        except sqlite3.Error as e:
+            _logger.warning(
+                f"Could not open the CACTI cache at {self.path}: {e}. CACTI results "
+                f"will not be saved across runs."
+            )
+            return None
+        self._connection = connection
+        self._connection_pid = os.getpid()
+        return connection
+
+    def _memoize(self, key: tuple, values: tuple):
+        self.memo[key] = values
+        self.memo.move_to_end(key)
+        while len(self.memo) > self.max_entries:
+            self.memo.popitem(last=False)
+
+    def get(self, key: tuple) -> tuple | None:
+        with self.lock:
+            values = self.memo.get(key)
+            if values is not None:
+                self.memo.move_to_end(key)
+                self.hits += 1
+                return values
+            connection = self.connection()
+            if connection is None:
+                return None
+            try:
+                row = connection.execute(
+                    f"SELECT {', '.join(_VALUES)} FROM sram_v{_SCHEMA_VERSION} "
+                    f"WHERE cacti_version = ? AND "
+                    f"{' AND '.join(f'{k} = ?' for k in _KEY)}",
+                    (_cacti_version(), *key),
+                ).fetchone()
+                if row is not None:
+                    connection.execute(
+                        f"UPDATE sram_v{_SCHEMA_VERSION} SET last_used = ? "
+                        f"WHERE cacti_version = ? AND "
+                        f"{' AND '.join(f'{k} = ?' for k in _KEY)}",
+                        (time.time(), _cacti_version(), *key),
+                    )
+            except sqlite3.Error as e:
+                _logger.warning(f"Could not read from the CACTI cache: {e}")
+                return None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            values = tuple(row)
+            self._memoize(key, values)
+            return values
+
+    def put(self, key: tuple, values: tuple):
+        with self.lock:
+            self._memoize(key, values)
+            connection = self.connection()
+            if connection is None:
+                return
+            table = f"sram_v{_SCHEMA_VERSION}"
+            try:
+                connection.execute(
+                    f"INSERT OR REPLACE INTO {table} VALUES "
+                    f"({', '.join('?' * (len(_KEY) + len(_VALUES) + 2))})",
+                    (_cacti_version(), *key, *values, time.time()),
+                )
+                (count,) = connection.execute(
+                    f"SELECT COUNT(*) FROM {table}"
+                ).fetchone()
+                if count > self.max_entries:
+                    connection.execute(
+                        f"DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM {table} "
+                        f"ORDER BY last_used LIMIT ?)",
+                        (count - self.max_entries,),
+                    )
+            except sqlite3.Error as e:
+                _logger.warning(f"Could not write to the CACTI cache: {e}")
+
+
+_CACHE = _CactiCache()
+
+
+def configure(
+    path: Path | str | None = None,
+    max_entries: int | None = None,
+    enabled: bool | None = None,
+):
+    """
+    Configures the CACTI cache for this process. Arguments that are None are left
+    unchanged.
+
+    Parameters
+    ----------
+    path: Path | str | None
+        The SQLite database to store results in.
+    max_entries: int | None
+        The maximum number of SRAMs to keep. The least recently used are dropped.
+    enabled: bool | None
+        Whether to use the cache. If False, every SRAM runs CACTI.
+    """
+    with _CACHE.lock:
+        if path is not None and Path(path) != _CACHE.path:
+            _CACHE.path = Path(path)
+            _CACHE.memo.clear()
+            _CACHE._connection = None
+        if max_entries is not None:
+            if max_entries < 1:
+                raise ValueError(f"max_entries must be at least 1, got {max_entries}.")
+            _CACHE.max_entries = max_entries
+            while len(_CACHE.memo) > max_entries:
+                _CACHE.memo.popitem(last=False)
+        if enabled is not None:
+            _CACHE.enabled = enabled
+
+
+def clear():
+    """Drops every cached result, on disk and in memory."""
+    with _CACHE.lock:
+        _CACHE.memo.clear()
+        _CACHE.hits = _CACHE.misses = 0
+        connection = _CACHE.connection()
+        if connection is not None:
+            connection.execute(f"DELETE FROM sram_v{_SCHEMA_VERSION}")
+
+
+def info() -> dict:
+    """
+    Returns the location, size, and hit statistics of the CACTI cache.
+
+    Returns
+    -------
+    dict
+        The cache path, whether it is enabled, the installed CACTI version, the number
+        of entries on disk, the entry limit, and the hits and misses in this process.
+    """
+    with _CACHE.lock:
+        connection = _CACHE.connection() if _CACHE.enabled else None
+        entries = None
+        if connection is not None:
+            (entries,) = connection.execute(
+                f"SELECT COUNT(*) FROM sram_v{_SCHEMA_VERSION}"
+            ).fetchone()
+        return {
+            "path": str(_CACHE.path),
+            "enabled": _CACHE.enabled,
+            "cacti_version": _cacti_version(),
+            "entries": entries,
+            "max_entries": _CACHE.max_entries,
+            "hits": _CACHE.hits,
+            "misses": _CACHE.misses,
+        }
+
+
+@lru_cache(maxsize=None)
+def _cached_sram_class() -> type:
+    from hwcomponents_library.library._backends import SRAM as _SRAMBackend
+
+    SRAM = _SRAMBackend.resolve()
+
+    class CachedSRAM(SRAM):
+        def _interp_tech_node(self):
+            if not _CACHE.enabled:
+                return super()._interp_tech_node()
+            key = (self.cache_type, *(float(getattr(self, k)) for k in _KEY[1:]))
+            values = _CACHE.get(key)
+            if values is not None:
+                self.logger.info(f"Using cached CACTI results for {self.size} bits")
+                return values
+            values = tuple(super()._interp_tech_node())
+            _CACHE.put(key, values)
+            return values
+
+    # Keep the logger and printed names of the wrapped class. The qualified name is
+    # what pickle looks up, through the module __getattr__ below.
+    CachedSRAM.__name__ = SRAM.__name__
+    CachedSRAM.__qualname__ = "CachedSRAM"
+    return CachedSRAM
+
+
+def __getattr__(name: str):
+    # Resolves CachedSRAM on first use, so that components built on cached_sram pickle
+    # without importing CACTI when this module is imported
+    if name == "CachedSRAM":
+        return _cached_sram_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def cached_sram(**kwargs):
+    """
+    Constructs a hwcomponents_cacti SRAM, reusing cached CACTI results if this SRAM has
+    been evaluated before.
+
+    Parameters
+    ----------
+    kwargs
+        The arguments of hwcomponents_cacti.SRAM.
+
+    Returns
+    -------
+    hwcomponents_cacti.SRAM
+        The SRAM.
+    """
+    return _cached_sram_class()(**kwargs)
+
+
+def check_pickle() -> list[str]:
+    """
+    Pickles and unpickles a SmartBufferSRAM, which builds its SRAM through the cache,
+    and compares the costs of the copy to those of the original.
+
+    Returns
+    -------
+    list[str]
+        A description of each problem. Empty if the round trip succeeded.
+    """
+    from hwcomponents_library import SmartBufferSRAM
+
+    buffer = SmartBufferSRAM(tech_node=45e-9, width=64, size=2**16)
+    try:
+        copy = pickle.loads(pickle.dumps(buffer))
+    except Exception as e:
+        return [f"SmartBufferSRAM does not pickle: {type(e).__name__}: {e}"]
+
+    problems = []
+    if type(copy.sram) is not type(buffer.sram):
+        problems.append(
+            f"The SRAM of an unpickled SmartBufferSRAM is a {type(copy.sram)}, "
+            f"expected {type(buffer.sram)}."
+        )
+    def costs(b) -> tuple:
+        r, w = b.read(), b.write()
+        return (
+            b.area,
+            b.leak_power,
+            (r.energy, r.latency, r.throughput),
+            (w.energy, w.latency, w.throughput),
+        )
+
+    expected, got = costs(buffer), costs(copy)
+    for name, e, g in zip(("area", "leak_power", "read", "write"), expected, got):
+        if e != g:
+            problems.append(f"SmartBufferSRAM {name} changed from {e} to {g}.")
+    return problems
+
+
+def _main():
+    parser = argparse.ArgumentParser(
+        prog="python -m hwcomponents_library.cacti_cache",
+        description="Show or clear the persistent cache of CACTI SRAM results.",
+    )
+    parser.add_argument("--clear", action="store_true", help="Clear the cache.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with an error if a SmartBufferSRAM built on the cache does not "
+        "survive a pickle round trip.",
+    )
+    args = parser.parse_args()
+    if args.clear:
+        clear()
+    if args.check:
+        problems = check_pickle()
+        for p in problems:
+            print(p, file=sys.stderr)
+        if problems:
+            sys.exit(1)
+    for k, v in info().items():
+        print(f"{k}: {v}")
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,126 @@
+"""
+Model families. Each family groups the library modules that model one published work
+(or closely related works that share components), and is registered as an entry point
+in the "hwcomponents_library.families" group so that hosts can discover the families
+from package metadata without importing any of them.
+
+Each family has a module in this package that exports only that family's models.
+Importing `hwcomponents_library.families.albireo`, for example, imports only
+`hwcomponents_library.library.albireo`.
+
+Setting the HWCOMPONENTS_LIBRARY_FAMILIES environment variable to a comma-separated
+list of families limits the models that `hwcomponents_library` advertises (through
+`__all__` and `dir()`) to those families, so model discovery in hwcomponents only
+imports the modules of the selected families. Families registered by other
+distributions may be selected as well; unknown families are ignored with a warning.
+"""
+
+import logging
+import os
+from importlib import import_module
+from types import ModuleType
+
+ENTRY_POINT_GROUP = "hwcomponents_library.families"
+FAMILIES_ENV_VAR = "HWCOMPONENTS_LIBRARY_FAMILIES"
+
+_logger = logging.getLogger(__name__)
+
+FAMILIES: dict[str, list[str]] = {
+    "aladdin": ["aladdin"],
+    "albireo": ["albireo"],
+    "brahms": ["brahms"],
+    "colonnade": ["colonnade"],
+    "dummy": ["dummy"],
+    "isaac": ["isaac", "newton", "atomlayer", "forms"],
+    "jia": ["jia"],
+    "ladder": ["dac_c2c_r2r", "c2c_multiplier"],
+    "misc": ["misc"],
+    "neurram": ["neurram"],
+    "raella": ["raella"],
+    "timely": ["timely"],
+}
+"""Maps each family in this library to the library modules that it contains."""
+
+
+def discover_families() -> dict[str, str]:
+    """
+    Lists the registered families from package metadata, without importing them.
+    Families registered by other distributions in the same entry point group are
+    included. If this library is not installed (e.g., running from a source checkout),
+    its own families are listed from FAMILIES.
+
+    Returns
+    -------
+    dict[str, str]
+        Maps each family name to the module that exports its models.
+    """
+    from importlib.metadata import entry_points
+
+    families = {name: f"{__name__}.{name}" for name in FAMILIES}
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        families[entry_point.name] = entry_point.value
+    return families
+
+
+def selected_families() -> list[str] | None:
+    """
+    Returns the families selected by the HWCOMPONENTS_LIBRARY_FAMILIES environment
+    variable, or None if it is not set. Families that are not registered (see
+    `discover_families`) are left out with a warning.
+
+    Returns
+    -------
+    list[str] | None
+        The selected family names.
+    """
+    selected = os.environ.get(FAMILIES_ENV_VAR, "").strip()
+    if not selected:
+        return None
+    families = [f.strip() for f in selected.split(",") if f.strip()]
+    available = discover_families()
+    unknown = [f for f in families if f not in available]
+    if unknown:
+        _logger.warning(
+            f"Ignoring unknown families in {FAMILIES_ENV_VAR}: {', '.join(unknown)}. "
+            f"Available families are: {', '.join(sorted(available))}"
+        )
+    return [f for f in families if f in available]
+
+
+def load_family(name: str) -> ModuleType:
+    """
+    Imports a family and returns the module that exports its models.
+
+    Parameters
+    ----------
+    name: str
+        The name of the family.
+
+    Returns
+    -------
+    ModuleType
+        The module that exports the family's models.
+    """
+    families = discover_families()
+    if name not in families:
+        raise ValueError(
+            f"Unknown family {name}. Available families are: "
+            f"{', '.join(sorted(families))}"
+        )
+    return import_module(families[name])
+
+
+def _export(namespace: dict, family: str) -> list[str]:
+    """
+    Imports the modules of a family into a family module's namespace and returns the
+    exported names for its __all__.
+    """
+    from hwcomponents_library import _EXPORTS
+
+    exported = []
+    for module_name in FAMILIES[family]:
+        module = import_module(f"hwcomponents_library.library.{module_name}")
+        for name in _EXPORTS[module_name]:
+            namespace[name] = getattr(module, name)
+            exported.append(name)
+    return exported
@@ -0,0 +1,5 @@
+"""Components from Aladdin (Shao et al., ISCA 2014)."""
+
+from hwcomponents_library.families import _export
+
+__all__ = _export(globals(), "aladdin")
@@ -0,0 +1,5 @@
+"""Photonic components from Albireo (Shiflett et al., ISCA 2021)."""
+
+from hwcomponents_library.families import _export
+
+__all__ = _export(globals(), "albireo")
@@ -0,0 +1,5 @@
+"""Components from BRAHMS (Song et al., DAC 2021)."""
+
+from hwcomponents_library.families import _export
+
+__all__ = _export(globals(), "brahms")
@@ -0,0 +1,5 @@
+"""Digital CiM components from Colonnade."""
+
+from hwcomponents_library.families import _export
+
+__all__ = _export(globals(), "colonnade")
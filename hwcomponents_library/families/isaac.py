@@ -0,0 +1,6 @@
+"""Components from ISAAC (Shafiee et al., ISCA 2016) and the works that reuse them:
+Newton, AtomLayer, and FORMS."""
+
+from hwcomponents_library.families import _export
+
+__all__ = _export(globals(), "isaac")
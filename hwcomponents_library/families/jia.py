@@ -0,0 +1,5 @@
+"""Components from Jia et al. (JSSC 2020)."""
+
+from hwcomponents_library.families import _export
+
+__all__ = _export(globals(), "jia")
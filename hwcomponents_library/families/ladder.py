@@ -0,0 +1,5 @@
+"""C-2C and R-2R ladder DACs and the C-2C ladder multiplier."""
+
+from hwcomponents_library.families import _export
+
+__all__ = _export(globals(), "ladder")
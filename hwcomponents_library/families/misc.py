@@ -0,0 +1,5 @@
+"""Capacitors, wires, the RAAAM eDRAM, and the CACTI-backed smart buffer SRAM."""
+
+from hwcomponents_library.families import _export
+
+__all__ = _export(globals(), "misc")
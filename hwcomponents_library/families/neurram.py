@@ -0,0 +1,5 @@
+"""Components from NeuRRAM (Wan et al., Nature 2022)."""
+
+from hwcomponents_library.families import _export
+
+__all__ = _export(globals(), "neurram")
@@ -0,0 +1,5 @@
+"""Components from RAELLA."""
+
+from hwcomponents_library.families import _export
+
+__all__ = _export(globals(), "raella")
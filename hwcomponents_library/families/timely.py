@@ -0,0 +1,5 @@
+"""Components from TIMELY (Li et al., ISCA 2020)."""
+
+from hwcomponents_library.families import _export
+
+__all__ = _export(globals(), "timely")
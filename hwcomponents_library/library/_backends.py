@@ -0,0 +1,108 @@
+"""
+Estimator plugins that some library components build on. Each backend is imported the
+first time a component that needs it is constructed, so importing the library (and
+using purely table-driven components) never imports CACTI or NeuroSim, and a missing
+plugin only raises an error when a component that needs it is used.
+
+Backends can be replaced, e.g., by local stubs so that components can be constructed
+offline and deterministically, as the benchmarks do:
+
+    with replaced(SRAM=StubSRAM, FlipFlop=StubFlipFlop):
+        buffer = SmartBufferSRAM(tech_node=45e-9, width=64, size=2**16)
+"""
+
+from contextlib import contextmanager
+from importlib import import_module
+from typing import Any
+
+
+class _Backend:
+    """
+    A class from an estimator plugin, resolved on first use. Calling this object
+    constructs an instance of the resolved class.
+
+    Parameters
+    ----------
+    module: str
+        The module that defines the class.
+    name: str
+        The name of the class.
+    distribution: str
+        The pip distribution that provides the module. Used for error messages.
+    """
+
+    def __init__(self, module: str, name: str, distribution: str):
+        self.module = module
+        self.name = name
+        self.distribution = distribution
+        self._resolved: type | None = None
+
+    def resolve(self) -> type:
+        """
+        Imports and returns the backend class.
+
+        Returns
+        -------
+        type
+            The backend class.
+        """
+        if self._resolved is None:
+            try:
+                module = import_module(self.module)
+            except ImportError as e:
+                raise ImportError(
+                    f"{self.name} from {self.module} is required by this component, "
+                    f"but {self.module} could not be imported. Install it with "
+                    f"`pip install {self.distribution}`."
+                ) from e
+            self._resolved = getattr(module, self.name)
+        return self._resolved
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<backend {self.module}.{self.name}>"
+
+
+SRAM = _Backend("hwcomponents_cacti", "SRAM", "hwcomponents-cacti")
+FlipFlop = _Backend("hwcomponents_neurosim", "FlipFlop", "hwcomponents-neurosim")
+NOTGate = _Backend("hwcomponents_neurosim", "NOTGate", "hwcomponents-neurosim")
+AdderTree = _Backend("hwcomponents_neurosim", "AdderTree", "hwcomponents-neurosim")
+Adder = _Backend("hwcomponents_neurosim", "Adder", "hwcomponents-neurosim")
+
+
+@contextmanager
+def replaced(**classes: type):
+    """
+    Replaces backend classes for the duration of a with block. Components constructed
+    in the block build on the given classes instead of the estimator plugins.
+    Components are cached in a few places (e.g., the flyweight cache and the shared
+    C2CMultiplier cores), so replace backends before constructing any components.
+
+    Parameters
+    ----------
+    classes
+        The replacement class of each backend, by backend name, e.g., SRAM or FlipFlop.
+    """
+    from hwcomponents_library.cacti_cache import _cached_sram_class
+
+    backends = {name: globals().get(name) for name in classes}
+    unknown = [name for name, b in backends.items() if not isinstance(b, _Backend)]
+    if unknown:
+        known = [n for n, b in globals().items() if isinstance(b, _Backend)]
+        raise ValueError(
+            f"Unknown backends: {', '.join(unknown)}. Backends are: {', '.join(known)}."
+        )
+
+    previous = {name: b._resolved for name, b in backends.items()}
+    try:
+        for name, cls in classes.items():
+            backends[name]._resolved = cls
+        # The CACTI cache subclasses the SRAM backend
+        _cached_sram_class.cache_clear()
+        yield
+    finally:
+        for name, cls in previous.items():
+            backends[name]._resolved = cls
+        _cached_sram_class.cache_clear()
@@ -1,4 +1,3 @@
-import math
 from typing import List
 
 
@@ -27,25 +26,18 @@ def bit_distribution_2_hist(
     bit_distribution: List[float], zero_prob: float = None
 ) -> List[float]:
     """Converts a bit distribution to a value distribution."""
-    hist = [1] * 2 ** len(bit_distribution)
-    for value in range(2 ** len(bit_distribution)):
-        bits = value2bits(value, len(bit_distribution))
-        for i, prob in enumerate(bit_distribution):
-            hist[value] *= prob if bits[i] else 1 - prob
+    # Imported here so that modules using only the list helpers don't import numpy
+    from hwcomponents_library.library._bit_statistics import (
+        bit_distribution_2_hist_array,
+    )
 
-    if zero_prob is not None:
-        set_element_rescale_sum_to_1(hist, 0, zero_prob)
-    return rescale_sum_to_1(hist)
+    return bit_distribution_2_hist_array(bit_distribution, zero_prob).tolist()
 
 
 def hist_2_bit_distribution(hist: List[float]) -> List[float]:
     """Converts a value distribution to a bit distribution."""
-    sum_hist = sum(hist)
-    hist = [i / sum_hist for i in hist]
+    from hwcomponents_library.library._bit_statistics import (
+        hist_2_bit_distribution_array,
+    )
 
-    bit_distribution = [0] * math.ceil(math.log(len(hist), 2))
-    for value in range(len(hist)):
-        for i, bit in enumerate(value2bits(value, len(bit_distribution))):
-            bit_distribution[i] += hist[value] * bit
-
-    return bit_distribution
+    return hist_2_bit_distribution_array(hist).tolist()
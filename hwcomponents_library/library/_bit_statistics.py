@@ -0,0 +1,56 @@
+"""
+NumPy implementations of the bit statistics in _bit_functions. Value distributions are
+built as Kronecker products of per-bit Bernoulli distributions, and bit distributions
+are recovered with a cached matrix of the bits of every value, so neither loops over
+values in Python.
+"""
+
+import math
+from functools import lru_cache, reduce
+from typing import List
+
+import numpy as np
+
+
+@lru_cache(maxsize=64)
+def bit_planes(n_values: int, resolution: int) -> np.ndarray:
+    """
+    Returns an (n_values, resolution) matrix whose row v holds the bits of v, most
+    significant bit first, as value2bits(v, resolution) would. The matrix is cached
+    and read-only.
+    """
+    values = np.arange(n_values, dtype=np.int64)[:, None]
+    shifts = np.arange(resolution - 1, -1, -1, dtype=np.int64)[None, :]
+    planes = ((values >> shifts) & 1).astype(np.float64)
+    planes.flags.writeable = False
+    return planes
+
+
+def bit_distribution_2_hist_array(
+    bit_distribution: List[float] | np.ndarray, zero_prob: float = None
+) -> np.ndarray:
+    """
+    Converts a bit distribution to a value distribution. The value distribution is the
+    Kronecker product of the per-bit Bernoulli distributions [1 - p, p], most
+    significant bit first.
+    """
+    probs = np.asarray(bit_distribution, dtype=np.float64)
+    hist = reduce(np.kron, ([1 - p, p] for p in probs), np.ones(1))
+    if zero_prob is not None:
+        hist[0] = zero_prob
+    return hist / hist.sum()
+
+
+def bit_probabilities(hist: List[float] | np.ndarray, resolution: int) -> np.ndarray:
+    """
+    Returns the probability that each bit, most significant first, is set for values
+    drawn from a histogram. The histogram is used as-is, without normalization.
+    """
+    hist = np.asarray(hist, dtype=np.float64)
+    return hist @ bit_planes(len(hist), resolution)
+
+
+def hist_2_bit_distribution_array(hist: List[float] | np.ndarray) -> np.ndarray:
+    """Converts a value distribution to a bit distribution."""
+    hist = np.asarray(hist, dtype=np.float64)
+    return bit_probabilities(hist / hist.sum(), math.ceil(math.log(len(hist), 2)))
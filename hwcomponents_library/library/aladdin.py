@@ -11,15 +11,9 @@
 """
 
 from hwcomponents_library.base import LibraryEstimatorClassBase
-from hwcomponents.scaling import *
 from hwcomponents import action, ActionCost
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,width|datawidth,energy,area,action
-# 40nm,1e-9,32,0.21,2.78E+02,add|read
-# 40nm,1e-9,32,0.0024,2.78E+02,leak
-# 40nm,1e-9,32,0,2.78E+02,update|write
 class AladdinAdder(LibraryEstimatorClassBase):
     """
     An adder from the Aladdin paper. Adds two values.
@@ -43,27 +37,7 @@ class AladdinAdder(LibraryEstimatorClassBase):
     priority = 0.1
 
     def __init__(self, tech_node: float, width: int):
-        super().__init__(leak_power=2.40e-6, area=278.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            40e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.width: int = self.scale(
-            "width",
-            width,
-            32,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width)
 
     @action
     def add(self) -> ActionCost:
@@ -74,7 +48,7 @@ class AladdinAdder(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.21e-12, throughput=1 / 1e-9, latency=1e-9)
+        return self._reference_cost("add")
 
     @action
     def read(self) -> ActionCost:
@@ -85,14 +59,9 @@ class AladdinAdder(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.21e-12, throughput=1 / 1e-9, latency=1e-9)
+        return self._reference_cost("read")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,width|datawidth,dynamic energy(pJ),area(um^2),action
-# 40nm,1e-9,1,0.009,5.98E+00,read
-# 40nm,1e-9,1,0,5.98E+00,write
-# 40nm,1e-9,1,0,5.98E+00,leak|update
 class AladdinRegister(LibraryEstimatorClassBase):
     """
     A register from the Aladdin paper. Stores a value.
@@ -122,27 +91,7 @@ class AladdinRegister(LibraryEstimatorClassBase):
             raise ValueError("Width and size must be the same if both are provided.")
         elif width is None and size is None:
             raise ValueError("Either width or size must be provided.")
-        super().__init__(leak_power=0.0, area=5.98e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            40e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.width: int = self.scale(
-            "width",
-            width,
-            1,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width)
         self.size = self.width
 
     @action(bits_per_action="width")
@@ -159,7 +108,7 @@ class AladdinRegister(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.009e-12, throughput=float("inf"), latency=0)
+        return self._reference_cost("read")
 
     @action(bits_per_action="width")
     def write(self) -> ActionCost:
@@ -175,14 +124,9 @@ class AladdinRegister(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.009e-12, throughput=1 / 1e-9, latency=1e-9)
+        return self._reference_cost("write")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,width|datawidth,energy(pJ),area(um^2),action
-# 40nm,1e-9,32,0.02947,71,compare|read
-# 40nm,1e-9,32,2.51E-05,71,leak
-# 40nm,1e-9,32,0,71,update|write
 class AladdinComparator(LibraryEstimatorClassBase):
     """
     A comparator from the Aladdin paper. Tells whether one value is greater than
@@ -200,27 +144,7 @@ class AladdinComparator(LibraryEstimatorClassBase):
     priority = 0.1
 
     def __init__(self, tech_node: float, width: int = 32):
-        super().__init__(leak_power=2.51e-8, area=71.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            40e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.width: int = self.scale(
-            "width",
-            width,
-            32,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width)
 
     @action
     def compare(self) -> ActionCost:
@@ -231,7 +155,7 @@ class AladdinComparator(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.02947e-12, throughput=1 / 1e-9, latency=1e-9)
+        return self._reference_cost("compare")
 
     @action
     def read(self) -> ActionCost:
@@ -242,14 +166,9 @@ class AladdinComparator(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.02947e-12, throughput=1 / 1e-9, latency=1e-9)
+        return self._reference_cost("read")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,width|datawidth,width_a|datawidth_a,width_b|datawidth_b,energy(pJ),area(um^2),action
-# 40nm,1e-9,32,32,32,12.68,6350,multiply|read
-# 40nm,1e-9,32,32,32,0.08,6350,leak
-# 40nm,1e-9,32,32,32,0,6350,update|write
 class AladdinMultiplier(LibraryEstimatorClassBase):
     """
     A integer multiplier from the Aladdin paper. Multiplies two values.
@@ -277,17 +196,6 @@ class AladdinMultiplier(LibraryEstimatorClassBase):
         width_a: int = None,
         width_b: int = None,
     ):
-        super().__init__(leak_power=8.00e-5, area=6350.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            40e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
         if width is not None and (width_a is not None or width_b is not None):
             raise ValueError(
                 "width and (width_a or width_b) cannot both be set. Either set width "
@@ -296,40 +204,14 @@ class AladdinMultiplier(LibraryEstimatorClassBase):
         if width is None and (width_a is None or width_b is None):
             raise ValueError("Either width or (width_a and width_b) must be set.")
 
+        # Only width or width_a and width_b are set, and the others are not scaled
+        self._init_from_reference(
+            tech_node=tech_node, width=width, width_a=width_a, width_b=width_b
+        )
         if width is not None:
-            self.width: int = self.scale(
-                "width",
-                width,
-                32,
-                area_scale_function=quadratic,
-                energy_scale_function=quadratic,
-                latency_scale_function=noscale,
-                throughput_scale_function=noscale,
-                leak_power_scale_function=quadratic,
-            )
             self.width_a = width
             self.width_b = width
         else:
-            self.width_a: int = self.scale(
-                "width_a",
-                width_a,
-                32,
-                area_scale_function=linear,
-                energy_scale_function=linear,
-                latency_scale_function=noscale,
-                throughput_scale_function=noscale,
-                leak_power_scale_function=linear,
-            )
-            self.width_b: int = self.scale(
-                "width_b",
-                width_b,
-                32,
-                area_scale_function=linear,
-                energy_scale_function=linear,
-                latency_scale_function=noscale,
-                throughput_scale_function=noscale,
-                leak_power_scale_function=linear,
-            )
             self.width = (self.width_a + self.width_b) / 2
 
     @action
@@ -341,7 +223,7 @@ class AladdinMultiplier(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=12.68e-12, throughput=1 / 1e-9, latency=1e-9)
+        return self._reference_cost("multiply")
 
     @action
     def read(self) -> ActionCost:
@@ -352,14 +234,9 @@ class AladdinMultiplier(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=12.68e-12, throughput=1 / 1e-9, latency=1e-9)
+        return self._reference_cost("read")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,width|datawidth,energy(pJ),area(um^2),action
-# 40nm,1e-9,32,0.25074,495.5,count|read
-# 40nm,1e-9,32,0.0003213,495.5,leak
-# 40nm,1e-9,32,0,495.5,update|write
 class AladdinCounter(LibraryEstimatorClassBase):
     """
     A counter from the Aladdin paper. Increments a stored value.
@@ -376,27 +253,7 @@ class AladdinCounter(LibraryEstimatorClassBase):
     priority = 0.1
 
     def __init__(self, tech_node: float, width: int = 32):
-        super().__init__(leak_power=3.21e-7, area=495.5e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            40e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.width: int = self.scale(
-            "width",
-            width,
-            32,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width)
 
     @action
     def count(self) -> ActionCost:
@@ -407,7 +264,7 @@ class AladdinCounter(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.25074e-12, throughput=1 / 1e-9, latency=1e-9)
+        return self._reference_cost("count")
 
     @action
     def read(self) -> ActionCost:
@@ -418,7 +275,7 @@ class AladdinCounter(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.25074e-12, throughput=1 / 1e-9, latency=1e-9)
+        return self._reference_cost("read")
 
 
 class AladdinIntMAC(LibraryEstimatorClassBase):
@@ -26,10 +26,16 @@ The 'scaling' parameter selects between three technology projections:
   - 'conservative': pessimistic scaling
   - 'moderate': moderate scaling
   - 'aggressive': optimistic scaling
+
+The tech node may be a NumPy array, in which case the area of the component is an
+array of the area at each tech node.
 """
 
+import sys
+
 from hwcomponents import ComponentModel, action, ActionCost
 from hwcomponents.scaling import tech_node_area
+from hwcomponents_library.base import FreezableMixin, _is_array
 
 
 def _scale_val(scaling, conservative, moderate, aggressive):
@@ -40,7 +46,20 @@ def _scale_val(scaling, conservative, moderate, aggressive):
     }[scaling]
 
 
-class AlbireoTIA(ComponentModel):
+def _area_scale(tech_node):
+    """
+    Returns the area scale from the 7nm reference design to the given tech node. If
+    the tech node is a NumPy array, returns an array of the scale of each element.
+    """
+    if not _is_array(tech_node):
+        return tech_node_area(tech_node, 7e-9)
+    numpy = sys.modules["numpy"]
+    values, inverse = numpy.unique(tech_node, return_inverse=True)
+    scales = numpy.array([tech_node_area(v, 7e-9) for v in values.tolist()])
+    return scales[inverse.ravel()].reshape(tech_node.shape)
+
+
+class AlbireoTIA(ComponentModel, FreezableMixin):
     """
     Transimpedance amplifier (TIA) from the Albireo photonic accelerator. Converts
     analog photocurrent from photodiodes to voltage that can be read by an ADC.
@@ -66,7 +85,7 @@ class AlbireoTIA(ComponentModel):
     ):
         self._energy = _scale_val(scaling, 0.625e-12, 0.3125e-12, 0.045e-12)
         self.cycle_period = float(cycle_period)
-        area_scale = tech_node_area(tech_node, 7e-9)
+        area_scale = _area_scale(tech_node)
         super().__init__(area=2769e-12 * area_scale, leak_power=0)
 
     @action
@@ -85,7 +104,7 @@ class AlbireoTIA(ComponentModel):
         )
 
 
-class AlbireoDAC(ComponentModel):
+class AlbireoDAC(ComponentModel, FreezableMixin):
     """
     Digital-to-analog converter (DAC) from the Albireo photonic accelerator.
 
@@ -104,7 +123,7 @@ class AlbireoDAC(ComponentModel):
 
     def __init__(self, tech_node: float, scaling: str = "conservative"):
         self._energy = _scale_val(scaling, 5.2e-12, 2.6e-12, 0.325e-12)
-        area_scale = tech_node_area(tech_node, 7e-9)
+        area_scale = _area_scale(tech_node)
         super().__init__(area=153e-12 * area_scale, leak_power=0)
 
     @action
@@ -119,7 +138,7 @@ class AlbireoDAC(ComponentModel):
         return ActionCost(energy=self._energy, throughput=float("inf"), latency=0)
 
 
-class AlbireoMachZehnderModulator(ComponentModel):
+class AlbireoMachZehnderModulator(ComponentModel, FreezableMixin):
     """
     Mach-Zehnder modulator (MZM) from the Albireo photonic accelerator. Modulates laser
     light with an electrical input/weight signal. Zero active energy; consumes static
@@ -138,7 +157,7 @@ class AlbireoMachZehnderModulator(ComponentModel):
 
     def __init__(self, tech_node: float, scaling: str = "conservative"):
         leak = _scale_val(scaling, 11.3e-3, 1.41e-3, 0.565e-3)
-        area_scale = tech_node_area(tech_node, 7e-9)
+        area_scale = _area_scale(tech_node)
         super().__init__(area=15066e-12 * area_scale, leak_power=leak)
 
     @action
@@ -153,7 +172,7 @@ class AlbireoMachZehnderModulator(ComponentModel):
         return ActionCost(energy=0, throughput=float("inf"), latency=0)
 
 
-class AlbireoMicroRingResonator(ComponentModel):
+class AlbireoMicroRingResonator(ComponentModel, FreezableMixin):
     """
     Micro-ring resonator (MRR) from the Albireo photonic accelerator. Routes specific
     wavelengths of light based from one path to another. Zero active energy; consumes
@@ -172,7 +191,7 @@ class AlbireoMicroRingResonator(ComponentModel):
 
     def __init__(self, tech_node: float, scaling: str = "conservative"):
         leak = _scale_val(scaling, 3.1e-3, 0.388e-3, 0.155e-3)
-        area_scale = tech_node_area(tech_node, 7e-9)
+        area_scale = _area_scale(tech_node)
         super().__init__(area=410e-12 * area_scale, leak_power=leak)
 
     @action
@@ -187,7 +206,7 @@ class AlbireoMicroRingResonator(ComponentModel):
         return ActionCost(energy=0, throughput=float("inf"), latency=0)
 
 
-class AlbireoDoubleMicroRingResonator(ComponentModel):
+class AlbireoDoubleMicroRingResonator(ComponentModel, FreezableMixin):
     """
     Double micro-ring resonator from the Albireo photonic accelerator. Each MAC site
     uses two MRRs (one for positive and one for negative). Area and leak power are both
@@ -206,7 +225,7 @@ class AlbireoDoubleMicroRingResonator(ComponentModel):
 
     def __init__(self, tech_node: float, scaling: str = "conservative"):
         leak = 2 * _scale_val(scaling, 3.1e-3, 0.388e-3, 0.155e-3)
-        area_scale = tech_node_area(tech_node, 7e-9)
+        area_scale = _area_scale(tech_node)
         super().__init__(area=820e-12 * area_scale, leak_power=leak)
 
     @action
@@ -221,7 +240,7 @@ class AlbireoDoubleMicroRingResonator(ComponentModel):
         return ActionCost(energy=0, throughput=float("inf"), latency=0)
 
 
-class AlbireoPhotodiode(ComponentModel):
+class AlbireoPhotodiode(ComponentModel, FreezableMixin):
     """
     Photodiode from the Albireo photonic accelerator.
 
@@ -246,7 +265,7 @@ class AlbireoPhotodiode(ComponentModel):
         cycle_period: float = 1e-9,
     ):
         self.cycle_period = float(cycle_period)
-        area_scale = tech_node_area(tech_node, 7e-9)
+        area_scale = _area_scale(tech_node)
         super().__init__(area=1.846e-9 * area_scale, leak_power=0)
 
     @action
@@ -263,7 +282,7 @@ class AlbireoPhotodiode(ComponentModel):
         )
 
 
-class AlbireoArrayedWaveguideGrating(ComponentModel):
+class AlbireoArrayedWaveguideGrating(ComponentModel, FreezableMixin):
     """
     Arrayed waveguide grating (AWG) from the Albireo photonic accelerator.
 
@@ -284,7 +303,7 @@ class AlbireoArrayedWaveguideGrating(ComponentModel):
     priority = 0.5
 
     def __init__(self, tech_node: float):
-        area_scale = tech_node_area(tech_node, 7e-9)
+        area_scale = _area_scale(tech_node)
         super().__init__(area=1108089e-12 * area_scale, leak_power=0)
 
     @action
@@ -299,7 +318,7 @@ class AlbireoArrayedWaveguideGrating(ComponentModel):
         return ActionCost(energy=0, throughput=float("inf"), latency=0)
 
 
-class AlbireoStarCoupler(ComponentModel):
+class AlbireoStarCoupler(ComponentModel, FreezableMixin):
     """
     Star coupler from the Albireo photonic accelerator.
 
@@ -320,7 +339,7 @@ class AlbireoStarCoupler(ComponentModel):
     priority = 0.5
 
     def __init__(self, tech_node: float):
-        area_scale = tech_node_area(tech_node, 7e-9)
+        area_scale = _area_scale(tech_node)
         super().__init__(area=262500e-12 * area_scale, leak_power=0)
 
     @action
@@ -335,7 +354,7 @@ class AlbireoStarCoupler(ComponentModel):
         return ActionCost(energy=0, throughput=float("inf"), latency=0)
 
 
-class AlbireoLaser(ComponentModel):
+class AlbireoLaser(ComponentModel, FreezableMixin):
     """
     Laser (driver) from the Albireo photonic accelerator.
 
@@ -361,7 +380,7 @@ class AlbireoLaser(ComponentModel):
 
     def __init__(self, tech_node: float, scaling: str = "conservative"):
         leak = _scale_val(scaling, 1.94e-3, 0.0743e-3, 0.0614e-3)
-        area_scale = tech_node_area(tech_node, 7e-9)
+        area_scale = _area_scale(tech_node)
         super().__init__(area=6153e-12 * area_scale, leak_power=leak)
 
     @action
@@ -11,7 +11,6 @@
 """
 
 from hwcomponents_library.base import LibraryEstimatorClassBase
-from hwcomponents.scaling import *
 from hwcomponents import action, ActionCost
 from .isaac import IsaacADC
 from .isaac import IsaacDAC
@@ -21,13 +20,6 @@ from .isaac import IsaacRouter
 from .isaac import IsaacShiftAdd
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,width|datawidth,depth,energy,area,action
-# 32nm,1e-9,16,128,0.083,1620,read|write,energy in pJ;  area in um^2;
-# 32nm,1e-9,16,128,0,1620,update|leak
-# # 1 read, 1 write per DAC activation
-# # Reported power = 0.39 / 4 x DAC
-# # 0.166015625 / 2 = 0.083
 class AtomlayerRegisterLadder(LibraryEstimatorClassBase):
     """
     A register ladder from the AtomLayer paper. Is a series of registers that shift
@@ -65,37 +57,7 @@ class AtomlayerRegisterLadder(LibraryEstimatorClassBase):
             ),
         )
 
-        super().__init__(leak_power=0.0, area=1620.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            32e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.width: int = self.scale(
-            "width",
-            width,
-            16,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
-        self.depth: int = self.scale(
-            "depth",
-            depth,
-            128,
-            area_scale_function=linear,
-            energy_scale_function=cacti_depth_energy,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=cacti_depth_energy,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width, depth=depth)
         self.size = width * depth
 
     @action(bits_per_action="width")
@@ -112,11 +74,7 @@ class AtomlayerRegisterLadder(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(
-            energy=0.083e-12,
-            throughput=1 / (1e-9 / self.depth),
-            latency=1e-9 / self.depth,
-        )  # All entries can be read in parallel
+        return self._reference_cost("read")
 
     @action(bits_per_action="width")
     def write(self) -> ActionCost:
@@ -132,21 +90,9 @@ class AtomlayerRegisterLadder(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.083e-12, throughput=1 / 1e-9, latency=1e-9)
-
-
-# Original CSV contents:
-# tech_node,global_cycle_period,width|datawidth,depth,energy,area,action
-# 32nm,1e-9,16,128,6.46,2100,read, energy in pJ;  area in um^2;
-# 32nm,1e-9,16,128,0,2100,write|update|leak
-# # Power calculation for input buffers:
-# # Power * Time / (Reads+Writes) = Energy per read/write
-# # (1.24e-3 W) power * (16 * 100e-9s time/MAC / 1.2) / (128+128 reads+writes)
-# # (1.24e-3) * (16 * 100e-9 / 1.2) / (128+128) * 1e12
-# # Now for the transfers calculation, we also mark write energy = 0 so we don't
-# # double charge for writes with the actual buffers. Only charge for reads when
-# # another
-# # buffer reads from the inter-buffer transfer network.
+        return self._reference_cost("write")
+
+
 class AtomlayerInputBufferTransfers(LibraryEstimatorClassBase):
     """
     This component measures transfer energy between input buffers in the AtomLayer
@@ -184,37 +130,7 @@ class AtomlayerInputBufferTransfers(LibraryEstimatorClassBase):
             ),
         )
 
-        super().__init__(leak_power=0.0, area=2100.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            32e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.width: int = self.scale(
-            "width",
-            width,
-            16,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
-        self.depth: int = self.scale(
-            "depth",
-            depth,
-            128,
-            area_scale_function=linear,
-            energy_scale_function=cacti_depth_energy,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=cacti_depth_energy,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width, depth=depth)
         self.size = width * depth
 
     @action(bits_per_action="width")
@@ -231,7 +147,7 @@ class AtomlayerInputBufferTransfers(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=6.46e-12, throughput=float("inf"), latency=0.0)
+        return self._reference_cost("read")
 
     @action(bits_per_action="width")
     def transfer(self) -> ActionCost:
@@ -247,7 +163,7 @@ class AtomlayerInputBufferTransfers(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=6.46e-12, throughput=float("inf"), latency=0.0)
+        return self._reference_cost("transfer")
 
 
 class AtomlayerADC(IsaacADC):
@@ -1,9 +1,75 @@
+from functools import lru_cache
+
 from hwcomponents.scaling import linear
-from hwcomponents_neurosim import NOTGate
+from hwcomponents_library.library._backends import NOTGate
 from hwcomponents import ComponentModel, action, ActionCost
 from hwcomponents_library.library.misc import Capacitor
 
 
+class _C2CMultiplierCore:
+    """
+    The analog state shared by the two ports of a C2C multiplier: the capacitors, the
+    inverter, the operand statistics, and the unscaled area and leak power.
+    """
+
+    def __init__(
+        self,
+        voltage: float,
+        unit_capacitance: float,
+        a_hist: tuple[float, ...],
+        b_bit_distribution: tuple[float, ...],
+        tech_node: str,
+    ):
+        self.unit_cap = Capacitor(
+            capacitance=unit_capacitance,
+            voltage=voltage,
+            tech_node=tech_node,
+        )
+        self.unit2_cap = Capacitor(
+            capacitance=unit_capacitance * 2,
+            voltage=voltage,
+            tech_node=tech_node,
+        )
+        self.inverter = NOTGate(tech_node=tech_node, cycle_period=1e-9)
+
+        a_rms = (sum(i**2 * p for i, p in enumerate(a_hist)) / sum(a_hist)) ** 0.5
+        self.a_rms = a_rms * voltage / (len(a_hist) - 1)
+
+        if not all(0 <= p <= 1 for p in b_bit_distribution):
+            raise ValueError("Bit probabilities must be between 0 and 1")
+        self.b_lo2hi_probability = sum(p * (1 - p) for p in b_bit_distribution) / len(
+            b_bit_distribution
+        )
+
+        # Pass gates are 2 transistors, 100F^2 each
+        control_pass_gate_area = 2 * tech_node**2 * 100
+        cap_area = self.unit_cap.area + self.unit2_cap.area
+        inverter_area = self.inverter.area
+        self.area = cap_area + inverter_area + control_pass_gate_area
+
+        # Assume pass gates don't leak
+        inverter_leak = self.inverter.leak_power
+        cap_leak = self.unit_cap.leak_power + self.unit2_cap.leak_power
+        self.leak_power = cap_leak + inverter_leak
+
+
+@lru_cache(maxsize=256)
+def _multiplier_core(
+    voltage: float,
+    unit_capacitance: float,
+    a_hist: tuple[float, ...],
+    b_bit_distribution: tuple[float, ...],
+    tech_node: str,
+) -> _C2CMultiplierCore:
+    """
+    Returns the core for the given operands, built once and shared by every port
+    constructed with them.
+    """
+    return _C2CMultiplierCore(
+        voltage, unit_capacitance, a_hist, b_bit_distribution, tech_node
+    )
+
+
 class C2CMultiplier(ComponentModel):
     """
     The C2C multiplier looks like the following:
@@ -26,8 +92,10 @@ class C2CMultiplier(ComponentModel):
     B bit goes 0->1, and the corresponding capacitor is charged
 
     USAGE: In your architecture, initialize a both a C2CMultiplier and a
-    C2CMultiplierPortB. Have the "a" port process the analog operand and have the "b"
-    port process the digital operand.
+    C2CMultiplierPortB, or build both with C2CMultiplier.build_pair. Have the "a" port
+    process the analog operand and have the "b" port process the digital operand. Ports
+    built with the same arguments share one set of capacitors, inverter, and operand
+    statistics, which is built once.
 
     The C2CMultiplier component has area and leak power accounted for. The
     C2CMultiplierPortB component does not have any area or leak power!
@@ -67,40 +135,22 @@ class C2CMultiplier(ComponentModel):
         self.b_bit_distribution = b_bit_distribution
         self.tech_node = tech_node
 
-        self.unit_cap = Capacitor(
-            capacitance=unit_capacitance,
-            voltage=voltage,
-            tech_node=tech_node,
-        )
-        self.unit2_cap = Capacitor(
-            capacitance=unit_capacitance * 2,
-            voltage=voltage,
-            tech_node=tech_node,
-        )
-        self.inverter = NOTGate(tech_node=self.tech_node, cycle_period=1e-9)
-
-        a_rms = (sum(i**2 * p for i, p in enumerate(a_hist)) / sum(a_hist)) ** 0.5
-        self.a_rms = a_rms * voltage / (len(a_hist) - 1)
-
-        if not all(0 <= p <= 1 for p in b_bit_distribution):
-            raise ValueError("Bit probabilities must be between 0 and 1")
-        self.b_lo2hi_probability = sum(p * (1 - p) for p in b_bit_distribution) / len(
-            b_bit_distribution
+        # The capacitors, inverter, and operand statistics are shared with the other
+        # port of this multiplier
+        core = _multiplier_core(
+            voltage,
+            unit_capacitance,
+            tuple(a_hist),
+            tuple(b_bit_distribution),
+            tech_node,
         )
+        self.unit_cap = core.unit_cap
+        self.unit2_cap = core.unit2_cap
+        self.inverter = core.inverter
+        self.a_rms = core.a_rms
+        self.b_lo2hi_probability = core.b_lo2hi_probability
 
-        # Pass gates are 2 transistors, 100F^2 each
-        control_pass_gate_area = 2 * self.tech_node**2 * 100
-        cap_area = self.unit_cap.area + self.unit2_cap.area
-        inverter_area = self.inverter.area
-
-        # Assume pass gates don't leak
-        inverter_leak = self.inverter.leak_power
-        cap_leak = self.unit_cap.leak_power + self.unit2_cap.leak_power
-
-        super().__init__(
-            area=cap_area + inverter_area + control_pass_gate_area,
-            leak_power=cap_leak + inverter_leak,
-        )
+        super().__init__(area=core.area, leak_power=core.leak_power)
 
         self.resolution: float = self.scale(
             "resolution",
@@ -112,6 +162,34 @@ class C2CMultiplier(ComponentModel):
             leak_power_scale_function=linear,
         )
 
+    @classmethod
+    def build_pair(
+        cls,
+        resolution: int,
+        voltage: float,
+        unit_capacitance: float,
+        a_hist: list[float],
+        b_bit_distribution: list[float],
+        tech_node: str,
+    ) -> tuple["C2CMultiplier", "C2CMultiplierPortB"]:
+        """
+        Builds both ports of a C2C multiplier on one shared analog core. The
+        parameters are those of C2CMultiplier.
+
+        Returns
+        -------
+        tuple[C2CMultiplier, C2CMultiplierPortB]: The analog (A) and digital (B) ports.
+        """
+        kwargs = dict(
+            resolution=resolution,
+            voltage=voltage,
+            unit_capacitance=unit_capacitance,
+            a_hist=a_hist,
+            b_bit_distribution=b_bit_distribution,
+            tech_node=tech_node,
+        )
+        return C2CMultiplier(**kwargs), C2CMultiplierPortB(**kwargs)
+
     @action
     def switch_a(self):
         """
@@ -193,8 +271,10 @@ class C2CMultiplierPortB(C2CMultiplier):
     B bit goes 0->1, and the corresponding capacitor is charged
 
     USAGE: In your architecture, initialize a both a C2CMultiplier and a
-    C2CMultiplierPortB. Have the "a" port process the analog operand and have the "b"
-    port process the digital operand.
+    C2CMultiplierPortB, or build both with C2CMultiplier.build_pair. Have the "a" port
+    process the analog operand and have the "b" port process the digital operand. Ports
+    built with the same arguments share one set of capacitors, inverter, and operand
+    statistics, which is built once.
 
     The C2CMultiplier component has area and leak power accounted for. The
     C2CMultiplierPortB component does not have any area or leak power!
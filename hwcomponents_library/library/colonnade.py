@@ -1,6 +1,6 @@
 from hwcomponents.model import ComponentModel, action
 from hwcomponents import ActionCost
-from hwcomponents_neurosim.main import (
+from hwcomponents_library.library._backends import (
     Adder as _NeuroSimAdder,
     FlipFlop as _NeuroSimFlipFlop,
 )
@@ -1,25 +1,275 @@
 import math
+import threading
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
 
+import numpy as np
 from hwcomponents.scaling import linear
-from hwcomponents_neurosim import FlipFlop
+from hwcomponents_library.library._backends import FlipFlop
+from hwcomponents_library.library._bit_statistics import bit_planes, bit_probabilities
 from hwcomponents_library.library.misc import Capacitor
-from typing import List
+from typing import Callable, List
 
 from hwcomponents import ComponentModel, action, ActionCost
 
 
-def value2bits(value: int, resolution: int) -> List[int]:
-    """Converts a value to a list of bits."""
-    return [int(i) for i in bin(value)[2:].zfill(resolution)]
+@lru_cache(maxsize=32)
+def _ladder_response(resolution: int) -> np.ndarray:
+    """
+    Returns the response matrix of a ladder with `resolution` nodes. The ladder is
+    linear, so the node voltages for an input code are voltage * response @ bits, with
+    the bits most significant first and the nodes ordered as returned by
+    _X2XLadderDAC.solve_for_voltage_at_each_node. The ladder is solved once per
+    resolution; the supply voltage only scales the result.
+    """
+    # The tridiagonal ladder matrix described in solve_for_voltage_at_each_node, with
+    # the LSB node first
+    matrix = np.diag(np.full(resolution, 5.0))
+    matrix += np.diag(np.full(resolution - 1, -2.0), 1)
+    matrix += np.diag(np.full(resolution - 1, -2.0), -1)
+    matrix[0, 0] = 4
+    if resolution > 1:
+        matrix[-1, -1] = 3
+    response = np.linalg.inv(matrix)[::-1, ::-1].copy()
+    response.flags.writeable = False
+    return response
+
+
+def _solve_code_energies(resolution: int, voltage: float, unit_x: float) -> np.ndarray:
+    """
+    Returns the energy (or power, if unit_x is a conductance) to convert each input
+    value of a ladder DAC, indexed by input value. The node voltages for all input values
+    come from one product of their bits with the ladder's response matrix.
+    """
+    bits = bit_planes(2**resolution, resolution)
+    node_voltages = voltage * (bits @ _ladder_response(resolution).T)
+    current = ((voltage - node_voltages) * bits).sum(axis=1)
+    energies = current * voltage * unit_x
+    assert (energies >= 0).all()
+    energies.flags.writeable = False
+    return energies
+
+
+def _prefix_bit_moments(ends: np.ndarray, resolution: int) -> tuple:
+    """
+    For each end x, returns sum(b_j(c) * b_k(c)) and sum(c * b_j(c) * b_k(c)) over the
+    input values 0 <= c < x, as two (len(ends), resolution, resolution) arrays with the
+    bits least significant first. [0, x) is split into one aligned block per set bit of
+    x. In each block the high bits are fixed and the low bits take every value once, so
+    the sums have closed forms and no input value is enumerated.
+    """
+    ends = np.asarray(ends, dtype=np.int64)
+    positions = np.arange(resolution)
+    diagonal = np.eye(resolution, dtype=bool)
+    counts = np.zeros((len(ends), resolution, resolution))
+    sums = np.zeros((len(ends), resolution, resolution))
+    prefix = np.zeros(len(ends), dtype=np.int64)
+    for t in range(resolution, -1, -1):
+        in_block = ((ends >> t) & 1).astype(float)
+        # Probability that each bit is 1 in the block [prefix, prefix + 2**t)
+        fixed_bits = ((prefix[:, None] >> positions) & 1).astype(float)
+        p = np.where(positions >= t, fixed_bits, 0.5)
+        both = np.where(diagonal, p[:, :, None], p[:, :, None] * p[:, None, :])
+        # Sum of the free bits' weights that the pair forces to 1
+        free_weight = np.where(positions < t, 2.0**positions, 0)
+        forced = np.where(
+            diagonal, free_weight[:, None], free_weight[:, None] + free_weight
+        )
+        n = in_block[:, None, None] * 2.0**t * both
+        mean = prefix[:, None, None] + (2.0**t - 1) / 2 + forced / 2
+        counts += n
+        sums += n * mean
+        prefix += (ends >> t & 1) << t
+    return counts, sums
+
+
+def _resampled_bit_moments(hist: List[float], resolution: int) -> np.ndarray:
+    """
+    Returns E[b b^T] over the input values, with the bits most significant first,
+    for the distribution that _X2XLadderDAC._resampled_hist resamples `hist` to. Its
+    diagonal holds the probability that each bit is 1.
+
+    The resampled histogram is linear in the input value between the points that
+    `hist` maps to, so its moments are sums of closed-form prefix moments at those
+    points: O(len(hist) * resolution^3) work instead of O(2^resolution * resolution).
+    Requires 2 <= len(hist) <= 2^resolution and resolution < 63.
+    """
+    n_values, n_bins = 2**resolution, len(hist)
+    idx0 = n_bins // 2
+    pruned = np.array(hist, dtype=float)
+    pruned[0] = pruned[idx0] = 0
+
+    # Segment s holds the input values with loc = i / n_values * (n_bins - 1) in
+    # [s, s + 1), where the resampled weight is a + b * i
+    segments = np.arange(n_bins - 1)
+    ends = [-(-s * n_values // (n_bins - 1)) for s in range(n_bins)]
+    slope = pruned[1:] - pruned[:-1]
+    a = pruned[:-1] - segments * slope
+    b = slope * (n_bins - 1) / n_values
+    counts, sums = _prefix_bit_moments(ends, resolution)
+    moments = np.einsum("s,sjk->jk", a, counts[1:] - counts[:-1])
+    moments += np.einsum("s,sjk->jk", b, sums[1:] - sums[:-1])
+    lo, hi = np.array(ends[:-1], dtype=float), np.array(ends[1:], dtype=float)
+    total = float(a @ (hi - lo) + b @ ((hi * (hi - 1) - lo * (lo - 1)) / 2))
+
+    # The minimum and middle values are mapped exactly, not interpolated. The minimum
+    # has no bits set and interpolates to zero; the middle has only the MSB set.
+    loc = (n_values // 2) / n_values * (n_bins - 1)
+    porp = loc - math.floor(loc)
+    interpolated = pruned[math.floor(loc)] * (1 - porp) + pruned[math.ceil(loc)] * porp
+    middle = hist[idx0] * n_values / n_bins
+    moments[-1, -1] += middle - interpolated
+    total += middle - interpolated + hist[0] * n_values / n_bins
+    return moments[::-1, ::-1] / total
+
+
+def _solve_tridiagonal(
+    off_diagonal: np.ndarray, diagonal: np.ndarray, rhs: np.ndarray
+) -> np.ndarray:
+    """
+    Solves a batch of symmetric tridiagonal systems with the Thomas algorithm.
+
+    Parameters
+    ----------
+    off_diagonal: np.ndarray
+        (batch, n - 1) entries above (and below) the diagonal.
+    diagonal: np.ndarray
+        (batch, n) diagonal entries.
+    rhs: np.ndarray
+        (batch, n, k) right-hand sides.
+
+    Returns
+    -------
+    np.ndarray: (batch, n, k) solutions.
+    """
+    n = diagonal.shape[1]
+    upper = np.empty_like(diagonal)
+    solution = np.empty(rhs.shape)
+    pivot = diagonal[:, 0]
+    upper[:, 0] = off_diagonal[:, 0] / pivot if n > 1 else 0
+    solution[:, 0] = rhs[:, 0] / pivot[:, None]
+    for i in range(1, n):
+        pivot = diagonal[:, i] - off_diagonal[:, i - 1] * upper[:, i - 1]
+        if i < n - 1:
+            upper[:, i] = off_diagonal[:, i] / pivot
+        solution[:, i] = (
+            rhs[:, i] - off_diagonal[:, i - 1, None] * solution[:, i - 1]
+        ) / pivot[:, None]
+    for i in range(n - 2, -1, -1):
+        solution[:, i] -= upper[:, i, None] * solution[:, i + 1]
+    return solution
+
+
+@lru_cache(maxsize=64)
+def _resampling_operator(n_bins: int, resolution: int) -> tuple:
+    """
+    Returns the sparse operator that resamples a histogram with `n_bins` bins to the
+    2^resolution input values of a ladder DAC. Each input value is interpolated from
+    the two nearest bins if there are fewer bins than input values, and is the sum of
+    the bins it covers otherwise. The minimum and middle input values are mapped
+    exactly from the first and middle bins, which the other input values don't use.
+
+    Returns
+    -------
+    tuple: (rows, columns, weights) of the interpolated entries, in the order they are
+    summed, then (rows, columns, divisor) of the exactly mapped entries.
+    """
+    n_values = 2**resolution
+    idx0, new_idx0 = n_bins // 2, n_values // 2
+    width_scale = n_bins / n_values
+    values = np.arange(n_values)
+    values = values[(values != 0) & (values != new_idx0)]
+    loc = values / n_values * (n_bins - 1)
+    start = np.floor(loc).astype(np.int64)
+    if width_scale > 1:
+        end = np.minimum(np.ceil(start + width_scale), n_bins - 1).astype(np.int64)
+        counts = np.maximum(end - start, 0)
+        rows = np.repeat(values, counts)
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        columns = np.repeat(start, counts) + np.arange(len(rows)) - first
+        weights = np.ones(len(rows))
+    else:
+        porp = loc - start
+        rows = np.repeat(values, 2)
+        columns = np.stack([start, np.ceil(loc).astype(np.int64)], axis=1).ravel()
+        weights = np.stack([1 - porp, porp], axis=1).ravel()
+    # The exactly mapped bins are zeroed before interpolating
+    used = (columns != 0) & (columns != idx0)
+    rows, columns, weights = rows[used], columns[used], weights[used]
+
+    # If the middle bin is the first bin, it has already been zeroed
+    exact_rows = np.array([0, new_idx0])
+    exact_columns = np.array([0, idx0])
+    divisor = np.array([1.0, 1.0 if idx0 else np.inf]) * min(width_scale, 1)
+    operator = (rows, columns, weights, exact_rows, exact_columns, divisor)
+    for array in operator:
+        array.flags.writeable = False
+    return operator
+
+
+LadderMismatchResult = namedtuple(
+    "LadderMismatchResult", ["energy", "inl", "dnl", "latency"]
+)
+
+
+LadderCacheInfo = namedtuple(
+    "LadderCacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+
+class _CodeEnergyCache:
+    """
+    A bounded, thread-safe LRU cache of per-input-value energy vectors, shared by all
+    ladder DACs in the process. DACs that differ only in their histogram, load, or
+    cycle period share an entry.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        with self.lock:
+            energies = self.entries.get(key)
+            if energies is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return energies
+            self.misses += 1
+        energies = compute()
+        with self.lock:
+            # Another thread may have solved the same ladder; keep the first one
+            energies = self.entries.setdefault(key, energies)
+            self.entries.move_to_end(key)
+            self._evict()
+        return energies
+
+    def _evict(self):
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+
+_CODE_ENERGY_CACHE = _CodeEnergyCache(maxsize=128)
 
 
 class _X2XLadderDAC(ComponentModel):
     """
     Base class for X2X Ladder DACs. This class is not intended to be instantiated
     directly. Use a subclass.
+
+    DACs with a resolution above `max_enumerated_resolution` compute their expected
+    energy from the moments of the input bits instead of from the energy of every input
+    value, so their cost grows polynomially, not exponentially, with resolution. The
+    two methods agree to floating-point rounding (see _expected_energy_from_moments).
     """
 
     priority = 0.5
+    max_enumerated_resolution: int = 12
 
     def __init__(
         self,
@@ -160,34 +410,75 @@ class _X2XLadderDAC(ComponentModel):
             the voltage farthest from the output, and the last element is the voltage
             immediately before the output.
         """
-        # Reverse input_value_bits to get the MSB on the right side of the circuit,
-        # closest to the output
-        input_value_bits = value2bits(input_value, self.resolution)[::-1]
-
-        lhs = [i * self.voltage for i in input_value_bits]
-        matrix_values = [[0, 4, -2]]
-        for i in range(len(lhs) - 2):
-            matrix_values.append([-2, 5, -2])
-        matrix_values.append([-2, 3, 0])
-
-        for i in range(len(lhs) - 2, -1, -1):
-            mult = matrix_values[i][2] / matrix_values[i + 1][1]
-            matrix_values[i][1] -= matrix_values[i + 1][0] * mult
-            matrix_values[i][2] -= matrix_values[i + 1][1] * mult
-            lhs[i] -= lhs[i + 1] * mult
-            lhs[i] /= matrix_values[i][1]
-            matrix_values[i] = [j / matrix_values[i][1] for j in matrix_values[i]]
-
-        for i in range(0, len(lhs) - 1):
-            mult = matrix_values[i + 1][0] / matrix_values[i][1]
-            matrix_values[i + 1][0] -= matrix_values[i][1] * mult
-            matrix_values[i + 1][1] -= matrix_values[i][2] * mult
-            lhs[i + 1] -= lhs[i] * mult
-
-        lhs = [l / matrix_values[i][1] for i, l in enumerate(lhs)]
-
-        # Un-reverse the bits
-        return lhs[::-1]
+        bits = bit_planes(2**self.resolution, self.resolution)[input_value]
+        return (self.voltage * (_ladder_response(self.resolution) @ bits)).tolist()
+
+    def _code_energies_or_powers(self) -> np.ndarray:
+        """
+        Returns the energy or power to convert each input value to an analog voltage,
+        depending on whether unit_x is a capacitance or a resistance. Results are
+        shared through a process-wide cache keyed on (kind, resolution, voltage,
+        unit_x).
+
+        Returns
+        -------
+        np.ndarray: Energy in Joules for each input value, indexed by input value
+        """
+        key = (self._kind, self.resolution, float(self.voltage), float(self._unit_x))
+        return _CODE_ENERGY_CACHE.get(
+            key,
+            lambda: _solve_code_energies(self.resolution, self.voltage, self._unit_x),
+        )
+
+    @classmethod
+    def ladder_cache_info(cls) -> LadderCacheInfo:
+        """
+        Returns the statistics of the process-wide cache of per-input-value energies,
+        which is shared by all ladder DACs.
+
+        Returns
+        -------
+        LadderCacheInfo
+            The hits, misses, and evictions of the cache, its maximum size, and the
+            number of solved ladders it currently holds.
+        """
+        cache = _CODE_ENERGY_CACHE
+        with cache.lock:
+            return LadderCacheInfo(
+                cache.hits,
+                cache.misses,
+                cache.evictions,
+                cache.maxsize,
+                len(cache.entries),
+            )
+
+    @classmethod
+    def set_ladder_cache_size(cls, maxsize: int):
+        """
+        Sets the maximum number of solved ladders kept in the process-wide cache. Each
+        entry holds 2^resolution floats.
+
+        Parameters
+        ----------
+        maxsize: int
+            The maximum number of entries. The least recently used are evicted.
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}.")
+        with _CODE_ENERGY_CACHE.lock:
+            _CODE_ENERGY_CACHE.maxsize = maxsize
+            _CODE_ENERGY_CACHE._evict()
+
+    @classmethod
+    def clear_ladder_cache(cls):
+        """
+        Drops all entries of the process-wide cache and resets its statistics.
+        """
+        with _CODE_ENERGY_CACHE.lock:
+            _CODE_ENERGY_CACHE.entries.clear()
+            _CODE_ENERGY_CACHE.hits = 0
+            _CODE_ENERGY_CACHE.misses = 0
+            _CODE_ENERGY_CACHE.evictions = 0
 
     def _input_value_to_analog_energy_or_power(self, input_value: int) -> float:
         """
@@ -203,14 +494,169 @@ class _X2XLadderDAC(ComponentModel):
         -------
         float: Energy in Joules
         """
-        input_value_bits = value2bits(input_value, self.resolution)
-        node_voltages = self.solve_for_voltage_at_each_node(input_value)
-        current = 0
-        for i, bit in enumerate(input_value_bits):
-            current += (self.voltage - node_voltages[i]) * (bit != 0)
-        energy = current * self.voltage * self._unit_x
-        assert energy >= 0
-        return energy
+        return float(self._code_energies_or_powers()[input_value])
+
+    def _resampled_hist(self) -> np.ndarray:
+        """
+        Returns the probability of each input value, resampled from the histogram with
+        the operator from _resampling_operator.
+        """
+        hist = np.asarray(self.hist, dtype=float)
+        rows, columns, weights, exact_rows, exact_columns, divisor = (
+            _resampling_operator(len(hist), self.resolution)
+        )
+        newhist = np.bincount(
+            rows, weights=hist[columns] * weights, minlength=2**self.resolution
+        ).astype(float, copy=False)
+        newhist[exact_rows] = hist[exact_columns] / divisor
+        # Summed in order, as Python's sum would, so results don't depend on numpy's
+        # summation order
+        return newhist / sum(newhist.tolist())
+
+    def _expected_energy_from_codes(self) -> tuple[float, List[float]]:
+        """
+        Returns the expected energy or power to convert an input value and the
+        probability that each bit is 1, most significant first, by resampling the
+        histogram to every input value and weighting the energy of each.
+        """
+        newhist = self._resampled_hist()
+        energy = float(np.dot(self._code_energies_or_powers(), newhist))
+        energy /= sum(newhist.tolist())
+        return energy, bit_probabilities(newhist, self.resolution).tolist()
+
+    def _expected_energy_from_moments(self) -> tuple[float, List[float]]:
+        """
+        Returns the same values as _expected_energy_from_codes without enumerating the
+        input values. The ladder is linear, so the energy of an input value with bits b
+        is voltage^2 * unit_x * (sum(b) - b^T R b), where R is the ladder's response
+        matrix. Its expectation only needs the first and second moments of the bits,
+        which _resampled_bit_moments computes in closed form from the histogram.
+
+        The result is exact up to floating-point rounding: no independence between bits
+        is assumed and the histogram is resampled the same way. Against
+        _expected_energy_from_codes, the relative error of the energy and the absolute
+        error of the bit probabilities are below 1e-12 for resolutions up to 14.
+        """
+        moments = _resampled_bit_moments(self.hist, self.resolution)
+        probabilities = np.diag(moments)
+        response = _ladder_response(self.resolution)
+        energy = self.voltage**2 * self._unit_x
+        energy *= probabilities.sum() - (response * moments).sum()
+        return float(energy), probabilities.tolist()
+
+    def _bit_moments(self) -> np.ndarray:
+        """
+        Returns E[b b^T] of the input bits, most significant first, under the
+        resampled histogram.
+        """
+        if 2 <= len(self.hist) <= 2**self.resolution:
+            return _resampled_bit_moments(self.hist, self.resolution)
+        bits = bit_planes(2**self.resolution, self.resolution)
+        return bits.T @ (bits * self._resampled_hist()[:, None])
+
+    def mismatch_analysis(self, mismatch: np.ndarray) -> LadderMismatchResult:
+        """
+        Evaluates this DAC under random mismatch of its ladder elements. The perturbed
+        ladders of all draws are solved together in one batched tridiagonal solve, so
+        10k draws take well under a second at 8 bits.
+
+        Parameters
+        ----------
+        mismatch: np.ndarray
+            (N, 2 * resolution) relative deviations of each ladder element's
+            capacitance (C-2C) or resistance (R-2R) from its nominal value, one row per
+            draw. For example, np.random.default_rng().normal(0, sigma, (N, 2 *
+            resolution)). Columns 0 to resolution - 1 are the elements connecting each
+            input bit to the ladder, most significant bit first. Columns resolution to
+            2 * resolution - 2 are the elements between adjacent nodes, starting at the
+            output. The last column is the termination at the least significant end.
+
+        Returns
+        -------
+        LadderMismatchResult
+            Arrays with one value per draw. energy and latency are those of convert().
+            inl and dnl are the largest integral and differential nonlinearity
+            magnitudes, in LSBs, against the line through the minimum and maximum
+            outputs. The output must settle to within half of its smallest step, so the
+            latency is infinite for draws with a non-monotonic output.
+        """
+        n = self.resolution
+        if n < 2:
+            raise ValueError(
+                f"Mismatch analysis requires a resolution of at least 2, got {n}."
+            )
+        mismatch = np.asarray(mismatch, dtype=float)
+        if mismatch.ndim != 2 or mismatch.shape[1] != 2 * n:
+            raise ValueError(
+                f"mismatch must have shape (N, {2 * n}) for a {n}-bit DAC, got "
+                f"{mismatch.shape}."
+            )
+        # The nominal ladder is solved as the last draw
+        mismatch = np.vstack([mismatch, np.zeros(2 * n)])
+
+        # Admittance of each element relative to a unit element, with the nodes least
+        # significant first as in solve_for_voltage_at_each_node
+        admittance = 1 + mismatch if self._kind == "C2C" else 1 / (1 + mismatch)
+        inputs = admittance[:, n - 1 :: -1]
+        between = 2 * admittance[:, 2 * n - 2 : n - 1 : -1]
+        diagonal = inputs.copy()
+        diagonal[:, :-1] += between
+        diagonal[:, 1:] += between
+        diagonal[:, 0] += admittance[:, -1]
+        # Node voltages are voltage * response @ bits, most significant first
+        rhs = inputs[:, :, None] * np.eye(n)
+        response = _solve_tridiagonal(-between, diagonal, rhs)
+        response = response[:, ::-1, ::-1]
+        inputs = inputs[:, ::-1]
+
+        # Charge drawn by the input elements, as in _solve_code_energies, in
+        # expectation over the input bits
+        moments = self._bit_moments()
+        ladder_energy = inputs @ np.diag(moments)
+        ladder_energy -= np.einsum("si,sij,ij->s", inputs, response, moments)
+        ladder_energy *= self.voltage**2 * self._unit_x
+
+        # Output voltage per unit supply of each bit, least significant first
+        weights = response[:, 0, ::-1]
+        lsb = weights.sum(axis=1) / self._max_value
+        ideal = 2.0 ** np.arange(n) * lsb[:, None]
+        error = weights - ideal
+        # The INL is largest at the input value whose bits all have errors of one sign
+        inl = np.maximum(error.clip(min=0).sum(1), -error.clip(max=0).sum(1))
+        inl /= lsb
+        # The output steps by w_k - sum(w_i for i < k) when bit k turns on and every
+        # lower bit turns off
+        steps = (weights - np.cumsum(weights, axis=1) + weights) / lsb[:, None]
+        dnl = np.abs(steps - 1).max(axis=1)
+
+        # Settling as in _get_latency, with the C-2C ladder's share of the load
+        # capacitance scaled by its output admittance
+        if self.load_resistance == 0:
+            latency = np.full(len(mismatch), float(self.cycle_period))
+        else:
+            capacitance = np.full(len(mismatch), float(self.load_capacitance))
+            if self._kind == "C2C":
+                output_admittance = inputs[:, 0] / response[:, 0, 0]
+                capacitance += (
+                    2 * self._unit_x * (output_admittance / output_admittance[-1] - 1)
+                )
+            smallest_step = steps.min(axis=1)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                settle_to = np.where(smallest_step > 0, smallest_step, 0)
+                hold_time = self.load_resistance * capacitance
+                hold_time *= math.log(2**n / self._max_value) - np.log(
+                    2**0.5 * np.minimum(settle_to, 1) / self._max_value
+                )
+            latency = np.maximum(hold_time, self.cycle_period)
+        if self._kind == "R2R":
+            ladder_energy *= latency
+
+        # Offset the nominal cost of convert() by each draw's change in ladder energy
+        # and latency
+        cost = self.convert()
+        energy = cost.energy + self.energy_scale * (ladder_energy - ladder_energy[-1])
+        latency = cost.latency + self.latency_scale * (latency - latency[-1])
+        return LadderMismatchResult(energy[:-1], inl[:-1], dnl[:-1], latency[:-1])
 
     def _convert_energy(
         self,
@@ -226,41 +672,13 @@ class _X2XLadderDAC(ComponentModel):
             If this is a resistive DAC, energy scales with the latency for which the
             value is held. If no latency is given, energy is returned without scaling.
         """
-        energy = 0
-
-        # This code resizes the histogram into the full distribution of values
-        # that this DAC can produce. It also makes sure to map the 0
-        # probability exactly.
-        newhist = [0] * 2**self.resolution
-        idx0 = len(self.hist) // 2
-        new_idx0 = len(newhist) // 2
-        width_scale = len(self.hist) / len(newhist)
-        prunedhist = [i for i in self.hist]
-        for exact_maps in [(0, 0), (idx0, new_idx0)]:
-            newhist[exact_maps[1]] = prunedhist[exact_maps[0]] / min(width_scale, 1)
-            prunedhist[exact_maps[0]] = 0
-
-        for i in range(len(newhist)):
-            if i == new_idx0 or i == 0:
-                continue
-            loc = i / len(newhist) * (len(prunedhist) - 1)
-            if width_scale > 1:
-                start = math.floor(loc)
-                end = min(math.ceil(start + width_scale), len(prunedhist) - 1)
-                for j in range(start, end):
-                    newhist[i] += prunedhist[j]
-            else:
-                porp = loc - math.floor(loc)
-                newhist[i] += prunedhist[math.floor(loc)] * (1 - porp)
-                newhist[i] += prunedhist[math.ceil(loc)] * porp
-
-        sum_newhist = sum(newhist)
-        newhist = [n / sum_newhist for n in newhist]
-
-        # Calculate the energy
-        for i, p in enumerate(newhist):
-            energy += self._input_value_to_analog_energy_or_power(i) * p
-        energy /= sum(newhist)
+        if (
+            self.resolution > self.max_enumerated_resolution
+            and 2 <= len(self.hist) <= 2**self.resolution
+        ):
+            energy, probabilities = self._expected_energy_from_moments()
+        else:
+            energy, probabilities = self._expected_energy_from_codes()
         assert energy >= 0
 
         # Latency not none ->
@@ -270,11 +688,6 @@ class _X2XLadderDAC(ComponentModel):
 
         # Flip flop energy
         flip_flops_e = self._flip_flops.read().energy
-        probabilities = [0] * self.resolution
-        for value, probability in enumerate(newhist):
-            bits = value2bits(value, self.resolution)
-            for i, b in enumerate(bits):
-                probabilities[i] += probability * b
         lo2hi_probability = sum(p * (1 - p) for p in probabilities)
         flip_flops_e *= lo2hi_probability
         assert flip_flops_e >= 0
@@ -11,18 +11,10 @@
 """
 
 from hwcomponents_library.base import LibraryEstimatorClassBase
-from hwcomponents.scaling import *
 from hwcomponents import action, ActionCost
 from .isaac import IsaacDAC
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,resolution,energy,area,n_instances,action
-# 32nm,1e-9,4,0.22619,284.375,1,convert|read
-# 32nm,1e-9,4,0,284.375,1,update|write|leak
-# # Energy: 15.2*10^-3 W / (2.1*32*10^9 ADC BW) * 10 ^ 12 J->pJ
-# # 15.2*10^-3 / (2.1*32*10^9) * 10 ^ 12
-# # Area: 9100um^2 / 32
 class FormsADC(LibraryEstimatorClassBase):
     """
     The analog-digital-converter (ADC) from the FORMS paper.
@@ -36,27 +28,7 @@ class FormsADC(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float, resolution: int = 4):
-        super().__init__(leak_power=0.0, area=284.375e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            32e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.resolution: int = self.scale(
-            "resolution",
-            resolution,
-            4,
-            area_scale_function=pow_base(2),
-            energy_scale_function=pow_base(2),
-            latency_scale_function=linear,
-            throughput_scale_function=reciprocal,
-            leak_power_scale_function=pow_base(2),
-        )
+        self._init_from_reference(tech_node=tech_node, resolution=resolution)
 
     @action
     def convert(self) -> ActionCost:
@@ -67,7 +39,7 @@ class FormsADC(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds)
         """
-        return ActionCost(energy=0.22619e-12, throughput=2.1e9, latency=1 / 2.1e9)
+        return self._reference_cost("convert")
 
     @action
     def read(self) -> ActionCost:
@@ -78,7 +50,7 @@ class FormsADC(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds)
         """
-        return ActionCost(energy=0.22619e-12, throughput=2.1e9, latency=1 / 2.1e9)
+        return self._reference_cost("read")
 
 
 class FormsDAC(IsaacDAC):
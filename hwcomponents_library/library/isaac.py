@@ -11,19 +11,9 @@
 """
 
 from hwcomponents_library.base import LibraryEstimatorClassBase
-from hwcomponents.scaling import *
 from hwcomponents import action, ActionCost
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,width|datawidth,depth,energy,area,action
-# 32nm,1e-9,256,2048,20.45,83000,read|write|update,energy in pJ;  area in um^2;
-# 32nm,1e-9,256,2048,0,83000,leak
-# # Power * Time / (Reads+Writes) = Energy per read/write
-# # (20.7e-3 / 12 W/IMA) power
-# # (16384 / ((128*8*10^7*1.2) * 100 / 128)) time for DACs/ADCs to consume entire input buffer
-# # (16384 + 2048) * 2 / 256 reads+writes, including IMA<->eDRAM<->network
-# # (20.7e-3 / 12) * (16384 / ((128*8*10^7*1.2) * 100 / 128)) / ((16384 + 2048) * 2 / 256) * 1e12
 class IsaacEDRAM(LibraryEstimatorClassBase):
     """
     The embedded DRAM from the ISAAC paper.
@@ -62,37 +52,7 @@ class IsaacEDRAM(LibraryEstimatorClassBase):
             ),
         )
 
-        super().__init__(leak_power=0.0, area=83000.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            32e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.width: int = self.scale(
-            "width",
-            width,
-            256,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
-        self.depth: int = self.scale(
-            "depth",
-            depth,
-            2048,
-            area_scale_function=linear,
-            energy_scale_function=cacti_depth_energy,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=cacti_depth_energy,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width, depth=depth)
         self.size = width * depth
 
     @action(bits_per_action="width")
@@ -104,11 +64,7 @@ class IsaacEDRAM(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds)
         """
-        return ActionCost(
-            energy=20.45e-12,
-            throughput=1 / (1e-9 / 36864 / self.width),
-            latency=1e-9 / 36864 / self.width,
-        )
+        return self._reference_cost("read")
 
     @action(bits_per_action="width")
     def write(self) -> ActionCost:
@@ -119,17 +75,9 @@ class IsaacEDRAM(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds)
         """
-        return ActionCost(
-            energy=20.45e-12,
-            throughput=1 / (1e-9 / 36864 / self.width),
-            latency=1e-9 / 36864 / self.width,
-        )
+        return self._reference_cost("write")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,width|datawidth,energy,area,action
-# 65nm,1e-9,128,26,23000000,read|write|update
-# 65nm,1e-9,128,0, 23000000,leak
 class IsaacChip2ChipLink(LibraryEstimatorClassBase):
     """
     The chip-to-chip link from the ISAAC paper. This connects multiple chips together.
@@ -143,27 +91,7 @@ class IsaacChip2ChipLink(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float, width: int = 128):
-        super().__init__(leak_power=0.0, area=23000000.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            65e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.width: int = self.scale(
-            "width",
-            width,
-            128,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width)
 
     @action(bits_per_action="width")
     def read(self) -> ActionCost:
@@ -174,11 +102,7 @@ class IsaacChip2ChipLink(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds)
         """
-        return ActionCost(
-            energy=26.0e-12,
-            throughput=6.4 * 8 * 1024 * 1024 * 1024 * self.width,
-            latency=1 / 6.4 / 8 / 1024 / 1024 / 1024 / self.width,
-        )
+        return self._reference_cost("read")
 
     @action(bits_per_action="width")
     def write(self) -> ActionCost:
@@ -189,25 +113,9 @@ class IsaacChip2ChipLink(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds)
         """
-        return ActionCost(
-            energy=26.0e-12,
-            throughput=6.4 * 8 * 1024 * 1024 * 1024 * self.width,
-            latency=1 / 6.4 / 8 / 1024 / 1024 / 1024 / self.width,
-        )
+        return self._reference_cost("write")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,width|datawidth,energy,area,action
-# 32nm,1e-9,256,20.74,37500,read,energy in pJ;  area in um^2;
-# 32nm,1e-9,256,0,37500,leak|update|write
-# # To match the paper where ISAAC shares each of these between 4 tiles. Quarter the area
-# # relative to isaac_router
-# # Assuming router BW = eDRAM BW per tile
-# # Power * Time / (Reads+Writes) = Energy per read/write
-# # (42e-3 / 4 / 12) power
-# # (16384 / ((128*8*10^7*1.2) * 100 / 128)) time for DACs/ADCs to consume entire input buffer
-# # (16384 + 2048) / 256 reads+writes
-# # (42e-3 / 4 / 12) * (16384 / ((128*8*10^7*1.2) * 100 / 128)) / ((16384 + 2048) / 256) * 1e12
 class IsaacRouterSharedByFour(LibraryEstimatorClassBase):
     """
     This is the router from the ISAAC paper. In the paper, it is shared by four tiles,
@@ -215,27 +123,7 @@ class IsaacRouterSharedByFour(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float, width: int = 256):
-        super().__init__(leak_power=0.0, area=37500.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            32e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.width: int = self.scale(
-            "width",
-            width,
-            256,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width)
 
     @action(bits_per_action="width")
     def read(self) -> ActionCost:
@@ -268,7 +156,7 @@ class IsaacRouterSharedByFour(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds)
         """
-        return ActionCost(energy=0.0, throughput=float("inf"), latency=0.0)
+        return self._reference_cost("write")
 
     @action(bits_per_action="width")
     def transfer(self) -> ActionCost:
@@ -284,34 +172,9 @@ class IsaacRouterSharedByFour(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds)
         """
-        return ActionCost(
-            energy=20.74e-12,
-            throughput=1 / (1e-9 / 36864 / 4 / self.width),
-            latency=1e-9 / 36864 / 4 / self.width,
-        )
+        return self._reference_cost("transfer")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,resolution,energy,area,n_instances,action
-# 32nm,1e-9,8,1.666666667,1200,1,convert|read
-# 32nm,1e-9,8,0,1200,1,leak|update|write
-# # Energy: 16*10^-3 W / (1.2*8*10^9 ADC BW) * 10 ^ 12 J->pJ
-# # 16*10^-3 / (1.2*8*10^9) * 10 ^ 12
-# # Area: 9600um^2 / 8
-# # L. Kull et al.," ""A 3.1mW 8b 1.2GS/s single-channel asynchronous SAR ADC
-# # with alternate comparators for enhanced speed in 32nm digital SOI
-# # CMOS",2013,pp. 468-469,doi: 10.1109/ISSCC.2013.6487818.," 2013 IEEE
-# # International Solid-State Circuits Conference Digest of Technical Papers
-# # Below are scaled versions based on M. Saberi, R. Lotfi, K. Mafinezhad, W.
-# # Serdijn et al., “Analysis of Power Consumption and Linearity in Capacitive
-# # Digital-to-Analog Converters used in Successive Approximation ADCs,” 2011.
-# # 32nm,1e-9,4,0.79,361.04,1,convert|read
-# # 32nm,1e-9,5,0.99,476.91,1,convert|read
-# # 32nm,1e-9,6,1.20,626.91,1,convert|read
-# # 32nm,1e-9,7,1.42,845.18,1,convert|read
-# # 32nm,1e-9,8,1.67,1200,1,convert|read
-# # 32nm,1e-9,9,1.969078145,1827.911647,1,convert|read
-# # 32nm,1e-9,10,2.379022742,3002.008032,1,convert|read
 class IsaacADC(LibraryEstimatorClassBase):
     """
     The analog-digital-converter (ADC) from the ISAAC paper.
@@ -325,27 +188,7 @@ class IsaacADC(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float, resolution: int = 8):
-        super().__init__(leak_power=0.0, area=1200.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            32e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.resolution: int = self.scale(
-            "resolution",
-            resolution,
-            8,
-            area_scale_function=pow_base(2),
-            energy_scale_function=pow_base(2),
-            latency_scale_function=linear,
-            throughput_scale_function=reciprocal,
-            leak_power_scale_function=pow_base(2),
-        )
+        self._init_from_reference(tech_node=tech_node, resolution=resolution)
 
     @action
     def convert(self) -> ActionCost:
@@ -356,7 +199,7 @@ class IsaacADC(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds)
         """
-        return ActionCost(energy=1.666666667e-12, throughput=1.2e9, latency=1 / 1.2e9)
+        return self._reference_cost("convert")
 
     @action
     def read(self) -> ActionCost:
@@ -367,20 +210,9 @@ class IsaacADC(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds)
         """
-        return ActionCost(energy=1.666666667e-12, throughput=1.2e9, latency=1 / 1.2e9)
+        return self._reference_cost("read")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,width|datawidth,energy,area,action
-# 32nm,1e-9,256,20.74,150000,read,energy in pJ;  area in um^2;
-# 32nm,1e-9,256,0,150000,leak|update|write
-# # ISAAC shares each of these between 4 tiles
-# # Assuming router BW = eDRAM BW per tile
-# # Power * Time / (Reads+Writes) = Energy per read/write
-# # (42e-3 / 4 / 12) power
-# # (16384 / ((128*8*10^7*1.2) * 100 / 128)) time for DACs/ADCs to consume entire input buffer
-# # (16384 + 2048) / 256 reads+writes
-# # (42e-3 / 4 / 12) * (16384 / ((128*8*10^7*1.2) * 100 / 128)) / ((16384 + 2048) / 256) * 1e12
 class IsaacRouter(LibraryEstimatorClassBase):
     """
     The router from the ISAAC paper. This is the router shared by four tiles in the
@@ -396,27 +228,7 @@ class IsaacRouter(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float, width: int = 256):
-        super().__init__(leak_power=0.0, area=150000.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            32e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.width: int = self.scale(
-            "width",
-            width,
-            256,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width)
 
     @action(bits_per_action="width")
     def read(self) -> ActionCost:
@@ -438,7 +250,7 @@ class IsaacRouter(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.0, throughput=float("inf"), latency=0.0)
+        return self._reference_cost("write")
 
     @action(bits_per_action="width")
     def transfer(self) -> ActionCost:
@@ -454,21 +266,9 @@ class IsaacRouter(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(
-            energy=20.74e-12,
-            throughput=1 / (1e-9 / 36864 / self.width),
-            latency=1e-9 / 36864 / self.width,
-        )
+        return self._reference_cost("transfer")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,width|datawidth,energy,area,action
-# 32nm,1e-9,16,0.021,60,shift_add|read|write,energy in pJ;  area in um^2
-# 32nm,1e-9,16,0.00E+00,60,leak|update
-# # Energy: 16*10^-3 W / (1.2*8*10^9 ADC BW) * 10 ^ 12 J->pJ
-# # Energy: .2e-3 W / (1.2*8*10^9 ADC BW) * 10 ^ 12 J->pJ
-# # .2e-3 / (1.2*8*10^9) * 10 ^ 12
-# # There are 4 of these in an ISAAC IMA
 class IsaacShiftAdd(LibraryEstimatorClassBase):
     """
     The shift-and-add unit from the ISAAC paper. This unit will sum and accumulate
@@ -485,27 +285,7 @@ class IsaacShiftAdd(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float, width: int = 16):
-        super().__init__(leak_power=0.0, area=60.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            32e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.width: int = self.scale(
-            "width",
-            width,
-            16,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width)
 
     @action
     def shift_add(self) -> ActionCost:
@@ -516,9 +296,7 @@ class IsaacShiftAdd(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(
-            energy=0.021e-12, throughput=1 / (1e-9 / 1.2), latency=1e-9 / 1.2
-        )
+        return self._reference_cost("shift_add")
 
     @action
     def read(self) -> ActionCost:
@@ -540,21 +318,9 @@ class IsaacShiftAdd(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.021e-12, throughput=float("inf"), latency=0.0)
-
-
-# Original CSV contents:
-# tech_node,global_cycle_period,width|datawidth,energy,area,action
-# 32nm,1e-9,1,0.054,29.296875,read,energy in pJ;  area in um^2;
-# 32nm,1e-9,1,0,29.296875,leak|update|write,energy in pJ;  area in um^2;
-# # Power * Time / (Reads+Writes) = Energy per read/write
-# # (7e-3 / 12 W/IMA) power
-# # (16384 / ((128*8*10^7*1.2) * 100 / 128)) time for DACs/ADCs to consume entire input buffer
-# # (16384 + 2048) * reads+writes
-# # (7e-3 / 12) * (16384 / ((128*8*10^7*1.2) * 100 / 128)) / ((16384 + 2048)) * 1e12
-# # Assuming bus BW = eDRAM BW
-# # Area reported per IMA. In ISAAC, a bus connects 12 IMAs
-# # Area: 7500 / (Width 256) = 29.296875 um^2 per bit width
+        return self._reference_cost("write")
+
+
 class IsaacEDRAMBus(LibraryEstimatorClassBase):
     """
     The eDRAM bus from the ISAAC paper. This bus connects the eDRAM to the router.
@@ -568,27 +334,7 @@ class IsaacEDRAMBus(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float, width: int = 1):
-        super().__init__(leak_power=0.0, area=29.296875e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            32e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.width: int = self.scale(
-            "width",
-            width,
-            1,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width)
 
     @action(bits_per_action="width")
     def read(self) -> float:
@@ -621,11 +367,7 @@ class IsaacEDRAMBus(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds)
         """
-        return ActionCost(
-            energy=0.054e-12,
-            throughput=1 / (1e-9 / 18432 / self.width),
-            latency=1e-9 / 18432 / self.width,
-        )
+        return self._reference_cost("transfer")
 
     @action(bits_per_action="width")
     def write(self) -> ActionCost:
@@ -642,17 +384,9 @@ class IsaacEDRAMBus(LibraryEstimatorClassBase):
         ActionCost
             The cost of this action.
         """
-        return ActionCost(energy=0.0, throughput=float("inf"), latency=0.0)
+        return self._reference_cost("write")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,resolution,energy,area,rows,action
-# 32nm,1e-9,1,0.41667,0.166015625,1,drive|read
-# 32nm,1e-9,1,0,0.166015625,1,write|leak|update
-# # Energy: 4*10^-3 W / (128*8*10^7*1.2 DAC BW) * 10 ^ 12 J->pJ * 128/100 underutilized due to ADC
-# # 4e-3 / (128 * 8 * 1.2 * 10 ^ 7) * 10 ^ 12 * 128/100
-# # 0.3255 * 8 * 128 * 1.2e9 / 100 * 1e-9
-# # Area: 170um^2 / 128 / 8
 class IsaacDAC(LibraryEstimatorClassBase):
     """
     The digital-analog converter (DAC) from the ISAAC paper.
@@ -666,37 +400,7 @@ class IsaacDAC(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float, resolution: int = 1, rows: int = 1):
-        super().__init__(leak_power=0.0, area=0.166015625e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            32e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.resolution: int = self.scale(
-            "resolution",
-            resolution,
-            1,
-            area_scale_function=pow_base(2),
-            energy_scale_function=pow_base(2),
-            latency_scale_function=linear,
-            throughput_scale_function=reciprocal,
-            leak_power_scale_function=pow_base(2),
-        )
-        self.rows: int = self.scale(
-            "rows",
-            rows,
-            1,
-            area_scale_function=linear,
-            energy_scale_function=noscale,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
+        self._init_from_reference(tech_node=tech_node, resolution=resolution, rows=rows)
 
     @action
     def convert(self) -> ActionCost:
@@ -707,11 +411,7 @@ class IsaacDAC(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds)
         """
-        return ActionCost(
-            energy=0.41667e-12,
-            throughput=1 / (1e-9 / self.rows),
-            latency=1e-9 / self.rows,
-        )
+        return self._reference_cost("convert")
 
     @action
     def read(self) -> ActionCost:
@@ -722,8 +422,4 @@ class IsaacDAC(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds)
         """
-        return ActionCost(
-            energy=0.41667e-12,
-            throughput=1 / (1e-9 / self.rows),
-            latency=1e-9 / self.rows,
-        )
+        return self._reference_cost("read")
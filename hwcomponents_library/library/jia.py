@@ -11,20 +11,14 @@
 """
 
 from hwcomponents_library.base import LibraryEstimatorClassBase
-from hwcomponents.scaling import *
 from hwcomponents import ComponentModel, action
 from math import ceil, log2
 from hwcomponents import ComponentModel, action, ActionCost
 from hwcomponents.scaling import linear, quadratic, reciprocal
 from hwcomponents_library.library.aladdin import AladdinComparator, AladdinCounter
-from hwcomponents_neurosim import FlipFlop, AdderTree
+from hwcomponents_library.library._backends import FlipFlop, AdderTree
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,resolution,voltage,energy,area,action
-# 65nm,      540e-9,              8,         1.2,   2.25,   5000,read
-# 65nm,      540e-9,              8,         1.2,   1.2,    5000,leak
-# 65nm,      540e-9,              8,         1.2,   0,      5000,write|update
 class JiaShiftAdd(LibraryEstimatorClassBase):
     """
     The shift-and-add unit from Jia et al. JSSC 2020. This unit will sum and accumulate
@@ -52,21 +46,10 @@ class JiaShiftAdd(LibraryEstimatorClassBase):
         voltage: float = 1.2,
         cycle_period: float = 540e-9,
     ):
-        super().__init__(leak_power=2.22e-6, area=5000.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            65e-9,
-            tech_node_area,
-            tech_node_energy,
-            tech_node_latency,
-            tech_node_leak,
-        )
-        self.resolution: int = self.scale(
-            "resolution", resolution, 8, pow_base(2), pow_base(2), noscale, pow_base(2)
-        )
-        self.voltage: float = self.scale(
-            "voltage", voltage, 1.2, noscale, quadratic, noscale, quadratic
+        self._init_from_reference(
+            tech_node=tech_node,
+            resolution=resolution,
+            voltage=voltage,
         )
         self.cycle_period: float = cycle_period
 
@@ -79,11 +62,7 @@ class JiaShiftAdd(LibraryEstimatorClassBase):
         -------
         ActionCost: The cost of this action
         """
-        return ActionCost(
-            energy=2.25e-12,
-            latency=self.cycle_period / 8,
-            throughput=8 / self.cycle_period,
-        )
+        return self._reference_cost("shift_and_add")
 
     @action
     def write(self) -> tuple[float, float]:
@@ -108,11 +87,6 @@ class JiaShiftAdd(LibraryEstimatorClassBase):
         return self.shift_and_add()
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,voltage,energy,area,  action
-# 65nm,      540e-9,              1.2,   12,     10535,read
-# 65nm,      540e-9,              1.2,   2.4,    10535,leak
-# 65nm,      540e-9,              1.2,   0,      10535,write|update
 class JiaDatapath(LibraryEstimatorClassBase):
     """
     The datapath in Jia et al. JSSC 2020. This datapath will perform quantization and
@@ -133,19 +107,7 @@ class JiaDatapath(LibraryEstimatorClassBase):
     def __init__(
         self, tech_node: float, voltage: float = 1.2, cycle_period: float = 540e-9
     ):
-        super().__init__(leak_power=4.44e-6, area=10535.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            65e-9,
-            tech_node_area,
-            tech_node_energy,
-            tech_node_latency,
-            tech_node_leak,
-        )
-        self.voltage: float = self.scale(
-            "voltage", voltage, 1.2, noscale, quadratic, noscale, quadratic
-        )
+        self._init_from_reference(tech_node=tech_node, voltage=voltage)
         self.cycle_period: float = cycle_period
 
     @action
@@ -158,11 +120,7 @@ class JiaDatapath(LibraryEstimatorClassBase):
         -------
         ActionCost: The cost of this action
         """
-        return ActionCost(
-            energy=12e-12,
-            latency=self.cycle_period / 8,
-            throughput=8 / self.cycle_period,
-        )
+        return self._reference_cost("process")
 
     @action
     def read(self) -> tuple[float, float]:
@@ -4,7 +4,8 @@ from hwcomponents_library.library._bit_functions import rescale_sum_to_1
 from hwcomponents import ComponentModel, action, ActionCost
 import math
 from hwcomponents.scaling import *
-from hwcomponents_cacti import SRAM
+from hwcomponents_library.library._backends import SRAM
+from hwcomponents_library.cacti_cache import cached_sram
 from hwcomponents_library.base import LibraryEstimatorClassBase
 from hwcomponents_library.library.aladdin import AladdinRegister, AladdinAdder
 
@@ -130,7 +131,8 @@ class Capacitor(ComponentModel):
         ----------
         value_probabilities: List[Number]
             The probabilities of the values to switch to. This is a histogram, assumed
-            to be spaced between 0 and supply_voltage, inclusive.
+            to be spaced between 0 and supply_voltage, inclusive. May be a list or a
+            NumPy array.
         zero_between_values: bool
             Whether to zero the voltage between values.
         supply_voltage: float
@@ -142,20 +144,32 @@ class Capacitor(ComponentModel):
         ActionCost: The cost of this action
         """
         supply_voltage = self.voltage if supply_voltage is None else supply_voltage
-        expected_energy = 0
         value_probabilities = rescale_sum_to_1(value_probabilities)
-        for v0, p0 in enumerate(value_probabilities):
-            for v1, p1 in enumerate(value_probabilities):
-                v0 = 0 if zero_between_values else v0
-                if v1 < v0:
-                    continue
-                e0 = self.raise_voltage_to(
-                    v0 / (len(value_probabilities) - 1) * self.voltage, supply_voltage
-                ).energy
-                e1 = self.raise_voltage_to(
-                    v1 / (len(value_probabilities) - 1) * self.voltage, supply_voltage
-                ).energy
-                expected_energy += (e1 - e0) * p0 * p1
+        max_value = len(value_probabilities) - 1
+        # The highest value is raised to self.voltage
+        assert self.voltage <= supply_voltage, (
+            f"Can not raise voltage to {self.voltage} when supply voltage "
+            f"is {supply_voltage}."
+        )
+
+        # Raising the voltage to value v costs e(v) = v * energy_per_value. The expected
+        # cost of switching from v0 to v1 is the sum of p(v0) * p(v1) * (e(v1) - e(v0))
+        # over v0 <= v1, where v0 is 0 if zero_between_values.
+        if zero_between_values:
+            # Sum of p(v1) * e(v1) (the probabilities of v0 sum to 1)
+            expected_value = sum(v * p for v, p in enumerate(value_probabilities))
+        else:
+            # For each v1, the sum over v0 <= v1 is p(v1) * (v1 * P - S), where P and
+            # S are prefix sums of p(v0) and v0 * p(v0).
+            expected_value = 0
+            prefix_p = prefix_vp = 0
+            for v, p in enumerate(value_probabilities):
+                prefix_p += p
+                prefix_vp += v * p
+                expected_value += p * (v * prefix_p - prefix_vp)
+
+        energy_per_value = self.capacitance * self.voltage / max_value * supply_voltage
+        expected_energy = float(expected_value * energy_per_value)
         return ActionCost(energy=expected_energy, throughput=float("inf"), latency=0)
 
     @action
@@ -225,24 +239,6 @@ class Wire(Capacitor):
 """
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,width|datawidth,depth,energy,area,action
-# 16nm,1e-9,1024,1024,2641.92,131570,read
-# 16nm,1e-9,1024,1024,2519.04,131570,write|update
-# 16nm,1e-9,1024,1024,0.381,131570,leak
-# # Read: 2.58 uW / MHz
-# # Write: 2.46 uW / MHz
-# # Leak + Refresh: (105uw leak) + (276uW refresh) = 381uW
-# # @ARTICLE{9131838,
-# #   author={Giterman, Robert and Shalom, Amir and Burg, Andreas and Fish, Alexander and Teman, Adam},
-# #   journal={IEEE Solid-State Circuits Letters},
-# #   title={A 1-Mbit Fully Logic-Compatible 3T Gain-Cell Embedded DRAM in 16-nm FinFET},
-# #   year={2020},
-# #   volume={3},
-# #   number={},
-# #   pages={110-113},
-# #   keywords={Random access memory;FinFETs;Temperature measurement;Leakage currents;Power demand;Voltage measurement;Embedded DRAM;gain cell (GC);low voltage;retention time;SRAM},
-# #   doi={10.1109/LSSC.2020.3006496}}
 class RaaamEDRAM(LibraryEstimatorClassBase):
     """
     RAAAM EDRAM from Giterman et al. LSSC 2020. This is a MB-class embedded DRAM unit.
@@ -284,37 +280,7 @@ class RaaamEDRAM(LibraryEstimatorClassBase):
             self.size = self.assert_int("size", size)
             depth = self.assert_int("size / width", self.size / width)
 
-        super().__init__(leak_power=3.81e-4, area=131570.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            16e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.width: int = self.scale(
-            "width",
-            width,
-            1024,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
-        depth: int = self.scale(
-            "depth",
-            depth,
-            1024,
-            area_scale_function=linear,
-            energy_scale_function=cacti_depth_energy,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width, depth=depth)
 
     @action(bits_per_action="width")
     def read(self) -> ActionCost:
@@ -330,11 +296,7 @@ class RaaamEDRAM(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(
-            energy=2641.92e-12,
-            throughput=300e6 * self.width,
-            latency=1 / 300e6 / self.width,
-        )
+        return self._reference_cost("read")
 
     @action(bits_per_action="width")
     def write(self) -> ActionCost:
@@ -350,11 +312,7 @@ class RaaamEDRAM(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(
-            energy=2519.04e-12,
-            throughput=300e6 * self.width,
-            latency=1 / 300e6 / self.width,
-        )
+        return self._reference_cost("write")
 
 
 class SmartBufferSRAM(LibraryEstimatorClassBase):
@@ -395,7 +353,7 @@ class SmartBufferSRAM(LibraryEstimatorClassBase):
         n_rw_ports: int = 1,
         n_banks: int = 1,
     ):
-        self.sram: SRAM = SRAM(
+        self.sram: SRAM = cached_sram(
             size=size,
             tech_node=tech_node,
             width=width,
@@ -12,15 +12,9 @@
 """
 
 from hwcomponents_library.base import LibraryEstimatorClassBase
-from hwcomponents.scaling import *
 from hwcomponents import action, ActionCost
 
 
-# Original CSV contents:
-# tech_node,n_repeats,global_cycle_period,resolution, voltage,energy,area,  action
-# 130nm,     1,      1e-6,                8,          1.8,    0.1,   170,  read
-# 130nm,     1,      1e-6,                8,          1.8,    0.1,   170,  write|update
-# 130nm,     1,      1e-6,                8,          1.8,    0.1,   170,  leak
 class NeurramShiftAdd(LibraryEstimatorClassBase):
     """
     The shift-and-add unit from the Wan et al. Nature 2022 paper. This unit will sum and
@@ -44,38 +38,10 @@ class NeurramShiftAdd(LibraryEstimatorClassBase):
         resolution: int = 8,
         voltage: float = 1.8,
     ):
-        super().__init__(
-            leak_power=5.00e-9, area=170.0e-12
-        )  # 130nm digital static power
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            130e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.resolution: int = self.scale(
-            "resolution",
-            resolution,
-            8,
-            area_scale_function=pow_base(2),
-            energy_scale_function=pow_base(2),
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=noscale,
-        )
-        self.voltage: float = self.scale(
-            "voltage",
-            voltage,
-            1.8,
-            area_scale_function=quadratic,
-            energy_scale_function=quadratic,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=quadratic,
+        self._init_from_reference(
+            tech_node=tech_node,
+            resolution=resolution,
+            voltage=voltage,
         )
 
     @action
@@ -109,14 +75,9 @@ class NeurramShiftAdd(LibraryEstimatorClassBase):
         -------
         ActionCost: The cost of this action
         """
-        return ActionCost(energy=0.1e-12, throughput=float("inf"), latency=0.0)
+        return self._reference_cost("shift_and_add")
 
 
-# Original CSV contents:
-# tech_node,n_repeats,global_cycle_period,voltage,energy,area,  action
-# 130nm,     1,      1e-6,                1.8,    0.3,  400,   read
-# 130nm,     1,      1e-6,                1.8,    0,     400,   leak
-# 130nm,     1,      1e-6,                1.8,    0,     400,   write|update
 class NeurramVariablePrecisionADC(LibraryEstimatorClassBase):
     """
     The variable precision ADC from the Wan et al. Nature 2022 paper. This unit will
@@ -131,27 +92,7 @@ class NeurramVariablePrecisionADC(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float, voltage: float = 1.8):
-        super().__init__(leak_power=1e-8, area=400.0e-12)  # 130nm ADC static power
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            130e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.voltage: float = self.scale(
-            "voltage",
-            voltage,
-            1.8,
-            area_scale_function=quadratic,
-            energy_scale_function=quadratic,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=quadratic,
-        )
+        self._init_from_reference(tech_node=tech_node, voltage=voltage)
 
     @action
     def convert(self) -> ActionCost:
@@ -162,7 +103,7 @@ class NeurramVariablePrecisionADC(LibraryEstimatorClassBase):
         -------
         ActionCost: The cost of this action
         """
-        return ActionCost(energy=0.3e-12, throughput=float("inf"), latency=0.0)
+        return self._reference_cost("convert")
 
     @action
     def read(self) -> ActionCost:
@@ -176,11 +117,6 @@ class NeurramVariablePrecisionADC(LibraryEstimatorClassBase):
         return self.convert()
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,voltage,energy,area,  action
-# 130nm,     1e-6,                1.8,    1.2,   350,  read
-# 130nm,     1e-6,                1.8,    0,     350,  leak
-# 130nm,     1e-6,                1.8,    0,     350,  write|update
 class NeurramAnalogSample(LibraryEstimatorClassBase):
     """
     The analog sample unit from the Wan et al. Nature 2022 paper. This unit will sample
@@ -195,40 +131,8 @@ class NeurramAnalogSample(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float, width: int = 1, voltage: float = 1.8):
-        super().__init__(
-            leak_power=1e-8, area=45.0e-12
-        )  # 130nm analog sample static power
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            130e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width, voltage=voltage)
         self._width = width
-        self.width: int = self.scale(
-            "width",
-            width,
-            1,
-            area_scale_function=linear,
-            energy_scale_function=noscale,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=noscale,
-        )
-        self.voltage: float = self.scale(
-            "voltage",
-            voltage,
-            1.8,
-            area_scale_function=quadratic,
-            energy_scale_function=quadratic,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=quadratic,
-        )
 
     @action
     def read(self) -> ActionCost:
@@ -250,14 +154,9 @@ class NeurramAnalogSample(LibraryEstimatorClassBase):
         -------
         ActionCost: The cost of this action
         """
-        return ActionCost(energy=1.2e-12, throughput=float("inf"), latency=0.0)
+        return self._reference_cost("sample")
 
 
-# Original CSV contents:
-# tech_node,n_repeats,global_cycle_period,voltage,energy,area, action
-# 130nm,     1,      1e-6,                 1.8,   0.25,  350,  read
-# 130nm,     1,      1e-6,                1.8,    0,     350,  leak
-# 130nm,     1,      1e-6,                1.8,    0,     350,  write|update
 class NeurramAnalogIntegrator(LibraryEstimatorClassBase):
     """
     The analog integrator unit from the Wan et al. Nature 2022 paper. This unit will
@@ -272,29 +171,7 @@ class NeurramAnalogIntegrator(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float, voltage: float = 1.8):
-        super().__init__(
-            leak_power=5e-9, area=350.0e-12
-        )  # 130nm integrator static power
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            130e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.voltage: float = self.scale(
-            "voltage",
-            voltage,
-            1.8,
-            area_scale_function=quadratic,
-            energy_scale_function=quadratic,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=quadratic,
-        )
+        self._init_from_reference(tech_node=tech_node, voltage=voltage)
 
     @action
     def integrate(self) -> ActionCost:
@@ -305,7 +182,7 @@ class NeurramAnalogIntegrator(LibraryEstimatorClassBase):
         -------
         ActionCost: The cost of this action
         """
-        return ActionCost(energy=0.25e-12, throughput=float("inf"), latency=0.0)
+        return self._reference_cost("integrate")
 
     @action
     def read(self) -> ActionCost:
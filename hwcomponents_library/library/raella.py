@@ -1,7 +1,6 @@
 from hwcomponents import ComponentModel, action, ActionCost
 from hwcomponents_library.library.misc import SmartBufferSRAM
 from hwcomponents_library.library.aladdin import AladdinAdder, AladdinMultiplier
-from hwcomponents.scaling import *
 from hwcomponents_library.base import LibraryEstimatorClassBase
 from hwcomponents_library.library.isaac import IsaacEDRAM
 
@@ -172,14 +171,6 @@ class RaellaFlagRegister(ComponentModel):
             self.flag_buf.read(bits_per_action=1)
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,energy,area,n_instances,action
-# 40nm,1e-9,0.25,0,1,multiply|read,
-# 40nm,1e-9,0,0,1,update|leak|write,
-# # Assuming multiplication energy scales linearly with input, weight, and output energy
-# # Efficient processing of DNNs (Sze, 2020): 8b*8b->16b multiply 0.2pJ
-# # 16b * 8b -> 8b multiply: 0.2 pJ
-# # We do this at the L2 (large) tile level, so area will be negligible
 class RaellaQuantMultiplier(LibraryEstimatorClassBase):
     """
     The quantization & multipliler from the RAELLA paper. This unit will multiply a
@@ -194,27 +185,7 @@ class RaellaQuantMultiplier(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float, width: int = 16):
-        super().__init__(leak_power=0.0, area=0.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            40e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.width: int = self.scale(
-            "resolution",
-            width,
-            16,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width)
 
     @action
     def multiply(self) -> ActionCost:
@@ -225,7 +196,7 @@ class RaellaQuantMultiplier(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.25e-12, throughput=1 / 1e-9, latency=1e-9)
+        return self._reference_cost("multiply")
 
     @action
     def read(self) -> ActionCost:
@@ -236,7 +207,7 @@ class RaellaQuantMultiplier(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.25e-12, throughput=1 / 1e-9, latency=1e-9)
+        return self._reference_cost("read")
 
 
 class RaellaQuantEDRAM(LibraryEstimatorClassBase):
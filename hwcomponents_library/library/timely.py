@@ -11,17 +11,10 @@
 """
 
 from hwcomponents_library.base import LibraryEstimatorClassBase
-from hwcomponents.scaling import *
 from hwcomponents import action, ActionCost
 from .isaac import IsaacChip2ChipLink
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,energy,area,action
-# 65nm,1e-9,0.0368,40,read|add
-# 65nm,1e-9,0,40,write|update|leak
-# # TIMELY says these don't contribute to area
-# # Numbers from paper table II
 class TimelyIAdder(LibraryEstimatorClassBase):
     """
     The current adder from the TIMELY paper. This unit will sum multiple currents into
@@ -34,17 +27,7 @@ class TimelyIAdder(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float):
-        super().__init__(leak_power=0.0, area=40.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            65e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
+        self._init_from_reference(tech_node=tech_node)
 
     @action
     def read(self) -> ActionCost:
@@ -56,7 +39,7 @@ class TimelyIAdder(LibraryEstimatorClassBase):
         (energy, latency): Tuple in (Joules, seconds).
         """
 
-        return ActionCost(energy=0.0368e-12, throughput=1 / 150e-9, latency=150e-9)
+        return self._reference_cost("read")
 
     @action
     def add(self) -> ActionCost:
@@ -68,14 +51,9 @@ class TimelyIAdder(LibraryEstimatorClassBase):
         (energy, latency): Tuple in (Joules, seconds).
         """
 
-        return ActionCost(energy=0.0368e-12, throughput=1 / 150e-9, latency=150e-9)
+        return self._reference_cost("add")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,n_instances,energy,area,action
-# 65nm,1e-9,1,0.0023,5,drive|read|convert
-# 65nm,1e-9,1,0,5,leak|update|write
-# # Numbers from paper table II
 class TimelyPSubBuf(LibraryEstimatorClassBase):
     """
     PSubBuf from the TIMELY paper. This unit will repeat & amplify an input voltage
@@ -88,17 +66,7 @@ class TimelyPSubBuf(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float):
-        super().__init__(leak_power=0.0, area=5.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            65e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
+        self._init_from_reference(tech_node=tech_node)
 
     @action
     def drive(self) -> ActionCost:
@@ -109,7 +77,7 @@ class TimelyPSubBuf(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.0023e-12, throughput=1 / 150e-9, latency=150e-9)
+        return self._reference_cost("drive")
 
     @action
     def read(self) -> ActionCost:
@@ -120,14 +88,9 @@ class TimelyPSubBuf(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.0023e-12, throughput=1 / 150e-9, latency=150e-9)
+        return self._reference_cost("read")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,resolution,energy,area,action
-# 65nm,1e-9,8,0.0375,240,convert|read
-# 65nm,1e-9,8,0,240,write|leak|update
-# # Numbers from paper table II
 class TimelyDTC(LibraryEstimatorClassBase):
     """
     The digital-to-time converter (DTC) from the TIMELY paper. This unit will convert
@@ -142,27 +105,7 @@ class TimelyDTC(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float, resolution: int = 8):
-        super().__init__(leak_power=0.0, area=240.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            65e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.resolution: int = self.scale(
-            "resolution",
-            resolution,
-            8,
-            area_scale_function=pow_base(2),
-            energy_scale_function=pow_base(2),
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=pow_base(2),
-        )
+        self._init_from_reference(tech_node=tech_node, resolution=resolution)
 
     @action
     def convert(self) -> ActionCost:
@@ -173,7 +116,7 @@ class TimelyDTC(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.0375e-12, throughput=1 / 150e-9, latency=150e-9)
+        return self._reference_cost("convert")
 
     @action
     def read(self) -> ActionCost:
@@ -184,13 +127,9 @@ class TimelyDTC(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.0375e-12, throughput=1 / 150e-9, latency=150e-9)
+        return self._reference_cost("read")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,resolution,energy,area,action
-# 65nm,1e-9,8,0.145,310,convert|read
-# 65nm,1e-9,8,0,310,leak|write|update
 class TimelyTDC(LibraryEstimatorClassBase):
     """
     The time-to-digital converter (TDC) from the TIMELY paper. This unit will convert
@@ -205,27 +144,7 @@ class TimelyTDC(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float, resolution: int = 8):
-        super().__init__(leak_power=0.0, area=310.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            65e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.resolution: int = self.scale(
-            "resolution",
-            resolution,
-            8,
-            area_scale_function=pow_base(2),
-            energy_scale_function=pow_base(2),
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=pow_base(2),
-        )
+        self._init_from_reference(tech_node=tech_node, resolution=resolution)
 
     @action
     def convert(self) -> ActionCost:
@@ -236,7 +155,7 @@ class TimelyTDC(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.145e-12, throughput=1 / 150e-9, latency=150e-9)
+        return self._reference_cost("convert")
 
     @action
     def read(self) -> ActionCost:
@@ -247,14 +166,9 @@ class TimelyTDC(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.145e-12, throughput=1 / 150e-9, latency=150e-9)
+        return self._reference_cost("read")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,rows,energy,area,action
-# 65nm,1e-9,1,0.00062,5,read|drive|buffer
-# 65nm,1e-9,1,0,5,leak|write|update
-# # Numbers from paper table II
 class TimelyXSubBuf(LibraryEstimatorClassBase):
     """
     The XSubBuf from the TIMELY paper. This unit will repeat & amplify an input current
@@ -270,27 +184,7 @@ class TimelyXSubBuf(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float, rows: int = 1):
-        super().__init__(leak_power=0.0, area=5.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            65e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.rows: int = self.scale(
-            "rows",
-            rows,
-            1,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
+        self._init_from_reference(tech_node=tech_node, rows=rows)
 
     @action
     def read(self) -> ActionCost:
@@ -301,7 +195,7 @@ class TimelyXSubBuf(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.00062e-12, throughput=1 / 150e-9, latency=150e-9)
+        return self._reference_cost("read")
 
     @action
     def drive(self) -> ActionCost:
@@ -312,14 +206,9 @@ class TimelyXSubBuf(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.00062e-12, throughput=1 / 150e-9, latency=150e-9)
+        return self._reference_cost("drive")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,energy,area,action
-# 65nm,1e-9,0.0417,40,compare|read
-# 65nm,1e-9,0,40,write|update|leak
-# # Numbers from paper table II
 class TimelyChargingComparator(LibraryEstimatorClassBase):
     """
     The charging comparator from the TIMELY paper. This unit will accumulate charge on a
@@ -332,17 +221,7 @@ class TimelyChargingComparator(LibraryEstimatorClassBase):
     """
 
     def __init__(self, tech_node: float):
-        super().__init__(leak_power=0.0, area=40.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            65e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
+        self._init_from_reference(tech_node=tech_node)
 
     @action
     def compare(self) -> ActionCost:
@@ -353,7 +232,7 @@ class TimelyChargingComparator(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.0417e-12, throughput=1 / 150e-9, latency=150e-9)
+        return self._reference_cost("compare")
 
     @action
     def read(self) -> ActionCost:
@@ -364,14 +243,9 @@ class TimelyChargingComparator(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(energy=0.0417e-12, throughput=1 / 150e-9, latency=150e-9)
+        return self._reference_cost("read")
 
 
-# Original CSV contents:
-# tech_node,global_cycle_period,width|datawidth,depth,energy,area,action
-# 65nm,1e-9,128,128,203.776,40,read
-# 65nm,1e-9,128,128,496.624,40,write|update
-# 65nm,1e-9,128,128,0,40,leak
 class TimelyInputOutputBuffer(LibraryEstimatorClassBase):
     """
     The input/output buffers from the TIMELY paper. These digital buffers store inputs and outputs to the CiM arrays.
@@ -408,37 +282,7 @@ class TimelyInputOutputBuffer(LibraryEstimatorClassBase):
             ),
         )
 
-        super().__init__(leak_power=0.0, area=40.0e-12)
-        self.tech_node: float = self.scale(
-            "tech_node",
-            tech_node,
-            65e-9,
-            area_scale_function=tech_node_area,
-            energy_scale_function=tech_node_energy,
-            latency_scale_function=tech_node_latency,
-            throughput_scale_function=tech_node_throughput,
-            leak_power_scale_function=tech_node_leak,
-        )
-        self.width: int = self.scale(
-            "width",
-            width,
-            128,
-            area_scale_function=linear,
-            energy_scale_function=linear,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=linear,
-        )
-        self.depth: int = self.scale(
-            "depth",
-            depth,
-            128,
-            area_scale_function=linear,
-            energy_scale_function=cacti_depth_energy,
-            latency_scale_function=noscale,
-            throughput_scale_function=noscale,
-            leak_power_scale_function=cacti_depth_energy,
-        )
+        self._init_from_reference(tech_node=tech_node, width=width, depth=depth)
         self.size = width * depth
 
     @action(bits_per_action="width")
@@ -455,11 +299,7 @@ class TimelyInputOutputBuffer(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(
-            energy=203.776e-12,
-            throughput=1 / (9.765625e-13 * self.width),
-            latency=9.765625e-13 * self.width,
-        )
+        return self._reference_cost("read")
 
     @action(bits_per_action="width")
     def write(self) -> ActionCost:
@@ -475,11 +315,7 @@ class TimelyInputOutputBuffer(LibraryEstimatorClassBase):
         -------
         (energy, latency): Tuple in (Joules, seconds).
         """
-        return ActionCost(
-            energy=496.624e-12,
-            throughput=1 / (9.765625e-12 * self.width),
-            latency=9.765625e-12 * self.width,
-        )
+        return self._reference_cost("write")
 
 
 class TimelyChip2ChipLink(IsaacChip2ChipLink):
@@ -2,4 +2,4 @@ from math import ceil, log2
 from hwcomponents import ComponentModel, action, ActionCost
 from hwcomponents.scaling import linear, quadratic, reciprocal
 from hwcomponents_library.library.aladdin import AladdinComparator, AladdinCounter
-from hwcomponents_neurosim import FlipFlop
+from hwcomponents_library.library._backends import FlipFlop
@@ -0,0 +1,408 @@
+"""
+Static manifest of the models in this library.
+
+The manifest lists every exported model class with its component names, priority,
+constructor parameters, and actions. It is generated from the source with the `ast`
+module, so building it does not import any model (or any estimator plugin such as
+CACTI or NeuroSim), and reading it only requires loading one JSON file. Name lookups
+can then be resolved to a single library module, which is imported on demand.
+
+The manifest is regenerated when the package is built (see setup.py). To regenerate
+it by hand, or to check that it is up to date, run:
+
+    python -m hwcomponents_library.manifest [--check]
+"""
+
+import argparse
+import ast
+import json
+import sys
+from functools import lru_cache
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable
+
+MANIFEST_VERSION = 1
+MANIFEST_PATH = Path(__file__).parent / "manifest.json"
+_PACKAGE_DIR = Path(__file__).parent
+_PACKAGE = "hwcomponents_library"
+
+# Class attributes of hwcomponents.ComponentModel that the manifest resolves
+_COMPONENT_MODEL_DEFAULTS = {"component_name": None, "priority": 0.5}
+_NOT_LITERAL = object()
+
+
+def _literal(node: ast.AST | None) -> Any:
+    if node is None:
+        return _NOT_LITERAL
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return _NOT_LITERAL
+
+
+def _parameters(func: ast.FunctionDef) -> list[dict]:
+    """Returns the parameters of a function, excluding self."""
+    args = func.args.posonlyargs + func.args.args
+    defaults = [None] * (len(args) - len(func.args.defaults)) + func.args.defaults
+    params = list(zip(args, defaults))[1:]
+    params += list(zip(func.args.kwonlyargs, func.args.kw_defaults))
+
+    parameters = []
+    for arg, default in params:
+        parameter = {"name": arg.arg, "required": default is None}
+        if default is not None:
+            value = _literal(default)
+            if value is _NOT_LITERAL:
+                parameter["default_expression"] = ast.unparse(default)
+            else:
+                parameter["default"] = value
+        parameters.append(parameter)
+    return parameters
+
+
+def _action_decorator(func: ast.FunctionDef) -> dict | None:
+    """Returns the @action bindings of a method, or None if it is not an action."""
+    for decorator in func.decorator_list:
+        if isinstance(decorator, ast.Name) and decorator.id == "action":
+            return {"bits_per_action": None}
+        if (
+            isinstance(decorator, ast.Call)
+            and isinstance(decorator.func, ast.Name)
+            and decorator.func.id == "action"
+        ):
+            bits_per_action = None
+            for keyword in decorator.keywords:
+                if keyword.arg == "bits_per_action":
+                    bits_per_action = _literal(keyword.value)
+            if decorator.args:
+                bits_per_action = _literal(decorator.args[0])
+            if bits_per_action is _NOT_LITERAL:
+                bits_per_action = None
+            return {"bits_per_action": bits_per_action}
+    return None
+
+
+class _ClassInfo:
+    def __init__(self, module: str, node: ast.ClassDef, imports: dict[str, str]):
+        self.module = module
+        self.name = node.name
+        self.bases = [ast.unparse(b) for b in node.bases]
+        self.imports = imports
+        self.attributes: dict[str, Any] = {}
+        self.init: list[dict] | None = None
+        self.actions: dict[str, dict] = {}
+
+        for statement in node.body:
+            if isinstance(statement, (ast.Assign, ast.AnnAssign)):
+                targets = (
+                    statement.targets
+                    if isinstance(statement, ast.Assign)
+                    else [statement.target]
+                )
+                for target in targets:
+                    if isinstance(target, ast.Name) and target.id in (
+                        "component_name",
+                        "priority",
+                    ):
+                        value = _literal(statement.value)
+                        if value is not _NOT_LITERAL:
+                            self.attributes[target.id] = value
+            elif isinstance(statement, ast.FunctionDef):
+                if statement.name == "__init__":
+                    self.init = _parameters(statement)
+                bindings = _action_decorator(statement)
+                if bindings is not None:
+                    self.actions[statement.name] = {
+                        **bindings,
+                        "parameters": _parameters(statement),
+                    }
+
+
+def _parse_module(module: str, path: Path) -> dict[str, _ClassInfo]:
+    tree = ast.parse(path.read_text(), filename=str(path))
+    imports = {}
+    classes = {}
+    for statement in tree.body:
+        if isinstance(statement, ast.ImportFrom) and statement.module is not None:
+            source = statement.module
+            if statement.level:
+                parent = module.rsplit(".", statement.level)[0]
+                source = f"{parent}.{source}"
+            for alias in statement.names:
+                imports[alias.asname or alias.name] = f"{source}.{alias.name}"
+        elif isinstance(statement, ast.ClassDef):
+            # Later definitions shadow earlier ones, as they would at import time
+            classes[statement.name] = _ClassInfo(module, statement, imports)
+    return classes
+
+
+def _parse_package() -> dict[str, _ClassInfo]:
+    """Parses every module in the package, keyed by fully-qualified class name."""
+    classes = {}
+    for path in sorted(_PACKAGE_DIR.rglob("*.py")):
+        relative = path.relative_to(_PACKAGE_DIR).with_suffix("")
+        module = ".".join((_PACKAGE, *relative.parts))
+        if module.endswith(".__init__"):
+            module = module[: -len(".__init__")]
+        for name, info in _parse_module(module, path).items():
+            classes[f"{module}.{name}"] = info
+    return classes
+
+
+def _mro(qualname: str, classes: dict[str, _ClassInfo]) -> list[_ClassInfo | str]:
+    """
+    Returns the parsed classes in the (single-inheritance) MRO of a class. Classes from
+    outside this package are returned as their qualified names and end the chain.
+    """
+    chain = []
+    while qualname in classes:
+        info = classes[qualname]
+        chain.append(info)
+        if not info.bases:
+            return chain
+        base = info.bases[0]
+        if base in info.imports:
+            qualname = info.imports[base]
+        elif f"{info.module}.{base}" in classes:
+            qualname = f"{info.module}.{base}"
+        else:
+            qualname = base
+    chain.append(qualname)
+    return chain
+
+
+def _model_entry(qualname: str, classes: dict[str, _ClassInfo]) -> dict | None:
+    chain = _mro(qualname, classes)
+    if chain[-1] not in ("hwcomponents.ComponentModel", "hwcomponents.model.ComponentModel"):
+        return None
+
+    attributes = dict(_COMPONENT_MODEL_DEFAULTS)
+    init = None
+    actions = {}
+    for info in reversed(chain[:-1]):
+        attributes.update(info.attributes)
+        init = info.init if info.init is not None else init
+        actions.update(info.actions)
+
+    # Classes without their own __init__ inherit the abstract ComponentModel.__init__
+    if init is None:
+        return None
+
+    info = chain[0]
+    component_name = attributes["component_name"]
+    if component_name is None:
+        component_name = [info.name]
+    elif isinstance(component_name, str):
+        component_name = [component_name]
+
+    return {
+        "module": info.module,
+        "class_name": info.name,
+        "component_name": list(component_name),
+        "priority": attributes["priority"],
+        "parameters": init,
+        "actions": dict(sorted(actions.items())),
+    }
+
+
+def build_manifest() -> dict:
+    """
+    Builds the manifest from the package source without importing any models.
+
+    Returns
+    -------
+    dict
+        The manifest. "models" maps each exported class name to its family, module,
+        component names, priority, constructor parameters, and actions.
+    """
+    from hwcomponents_library import _NAME_TO_MODULE
+    from hwcomponents_library.families import FAMILIES
+
+    module_to_family = {
+        f"{_PACKAGE}.library.{module}": family
+        for family, modules in FAMILIES.items()
+        for module in modules
+    }
+    classes = _parse_package()
+    models = {}
+    for name, module in sorted(_NAME_TO_MODULE.items()):
+        entry = _model_entry(f"{module}.{name}", classes)
+        if entry is None:
+            raise ValueError(
+                f"{module}.{name} is exported by {_PACKAGE} but could not be resolved "
+                f"to a concrete ComponentModel subclass."
+            )
+        models[name] = {"family": module_to_family[module], **entry}
+    return {"version": MANIFEST_VERSION, "models": models}
+
+
+def write_manifest(path: Path | str = MANIFEST_PATH) -> dict:
+    """
+    Builds the manifest and writes it to a JSON file.
+
+    Parameters
+    ----------
+    path: Path | str
+        Where to write the manifest. Defaults to the manifest shipped in the package.
+
+    Returns
+    -------
+    dict
+        The manifest that was written.
+    """
+    manifest = build_manifest()
+    Path(path).write_text(json.dumps(manifest, indent=2) + "\n")
+    return manifest
+
+
+@lru_cache(maxsize=1)
+def load_manifest() -> dict:
+    """
+    Loads the manifest shipped in the package. If it is missing (e.g., in a source
+    checkout that was never built), it is built from the source instead.
+
+    Returns
+    -------
+    dict
+        The manifest.
+    """
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text())
+    except FileNotFoundError:
+        return build_manifest()
+    if manifest.get("version") != MANIFEST_VERSION:
+        return build_manifest()
+    return manifest
+
+
+def find_components(name: str) -> list[dict]:
+    """
+    Finds the models that implement a component name, highest priority first. Names
+    are matched case-insensitively, as in hwcomponents.
+
+    Parameters
+    ----------
+    name: str
+        The component name to look up.
+
+    Returns
+    -------
+    list[dict]
+        The manifest entries of the matching models.
+    """
+    name = name.lower()
+    found = [
+        entry
+        for entry in load_manifest()["models"].values()
+        if name in (c.lower() for c in entry["component_name"])
+    ]
+    return sorted(found, key=lambda entry: -entry["priority"])
+
+
+def load_model(class_name: str) -> type:
+    """
+    Imports and returns one model class. Only the module that defines the class is
+    imported.
+
+    Parameters
+    ----------
+    class_name: str
+        The name of the class, as exported by hwcomponents_library.
+
+    Returns
+    -------
+    type
+        The model class.
+    """
+    models = load_manifest()["models"]
+    if class_name not in models:
+        raise ValueError(
+            f"{class_name} is not a model in {_PACKAGE}. Available models are: "
+            f"{', '.join(sorted(models))}"
+        )
+    entry = models[class_name]
+    return getattr(import_module(entry["module"]), entry["class_name"])
+
+
+def _format_call(name: str, parameters: list[dict]) -> str:
+    args = []
+    for p in parameters:
+        if p["required"]:
+            args.append(p["name"])
+        elif "default" in p:
+            args.append(f"{p['name']}={p['default']}")
+        else:
+            args.append(f"{p['name']}={p['default_expression']}")
+    return f"{name}({', '.join(args)})"
+
+
+def list_components(printfunc: Callable[[str], None] = print):
+    """
+    Lists the components in this library, in the same format as `hwc --list`, without
+    importing any models.
+
+    Parameters
+    ----------
+    printfunc: Callable[[str], None]
+        The function to use to print the components.
+    """
+    printfunc("\n")
+    printfunc("Supported Components:")
+
+    entries = []
+    for class_name, model in load_manifest()["models"].items():
+        names = model["component_name"]
+        actions = "\n".join(
+            f"\t{_format_call(a, spec['parameters'])}"
+            for a, spec in model["actions"].items()
+        )
+        entries.append(
+            (
+                names[0],
+                f"{names[0]}{_format_call('', model['parameters'])} from class "
+                f"{class_name} \n{actions}",
+            )
+        )
+        for c in names[1:]:
+            entries.append((c, f"{c}: alias for {class_name} from class {names[0]}"))
+
+    for _, entry in sorted(entries, key=lambda x: x[0].lower()):
+        printfunc(entry)
+
+
+def _main():
+    parser = argparse.ArgumentParser(
+        prog="python -m hwcomponents_library.manifest",
+        description="Regenerate the hwcomponents_library model manifest.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with an error if the shipped manifest is out of date.",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="List all components in the manifest."
+    )
+    args = parser.parse_args()
+
+    if args.list:
+        list_components()
+    elif args.check:
+        try:
+            shipped = json.loads(MANIFEST_PATH.read_text())
+        except FileNotFoundError:
+            shipped = None
+        if shipped != build_manifest():
+            print(
+                f"{MANIFEST_PATH} is out of date. Run "
+                f"`python -m hwcomponents_library.manifest` to regenerate it.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+    else:
+        write_manifest()
+
+
+if __name__ == "__main__":
+    _main()
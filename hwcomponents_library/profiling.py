@@ -0,0 +1,287 @@
+"""
+Profiling of component actions.
+
+While profiling is enabled, every @action of every component model (the models of this
+library, and those of other packages, such as CACTI and NeuroSim, that are used as
+subcomponents) records, per (class, action):
+
+- count: the number of calls.
+- total_time: the cumulative wall time of the calls, in seconds.
+- nested_time: the part of total_time spent in nested actions, such as the actions of
+  subcomponents.
+- self_time: total_time minus nested_time.
+
+    from hwcomponents_library import profiling
+
+    with profiling.profile():
+        run_mapper()
+    print(profiling.report())
+    profiling.write_collapsed_stacks("actions.folded")
+
+The collapsed stacks ("Parent.action;Child.action <microseconds>" lines, with self time
+as the weight) can be rendered with flamegraph.pl, speedscope, or similar tools. Actions
+are keyed by the class of the component that they are called on, so an action that a
+class inherits is reported under that class. Time in helper methods, such as
+_X2XLadderDAC._convert_energy, counts towards the action that calls them.
+
+Profiling wraps the actions of the model classes when it is enabled and unwraps them
+when it is disabled, so it has no overhead while it is disabled. The per-instance
+actions of components with frozen costs or array-valued parameters are recorded too.
+"""
+
+import importlib
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from time import perf_counter
+
+from hwcomponents import ComponentModel
+from hwcomponents_library import base
+
+ActionStats = namedtuple(
+    "ActionStats",
+    ["class_name", "action", "count", "total_time", "nested_time", "self_time"],
+)
+
+_lock = threading.Lock()
+_enabled = False
+# (class, action name) -> the action that profiling replaced
+_originals: dict[tuple[type, str], object] = {}
+_instrumented: set[type] = set()
+# (class name, action name) -> [count, total time, nested time]
+_stats: dict[tuple[str, str], list] = {}
+# Stack of (class name, action name) -> self time
+_stacks: dict[tuple, float] = {}
+_local = threading.local()
+
+
+def _call_stack() -> list:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _record(component, name: str, call, /, *args, **kwargs):
+    """Returns call(*args, **kwargs), recording it as a call of an action."""
+    if not _enabled:
+        return call(*args, **kwargs)
+    for subcomponent in getattr(component, "subcomponents", ()):
+        if type(subcomponent) not in _instrumented:
+            _instrument(type(subcomponent))
+
+    stack = _call_stack()
+    key = (type(component).__name__, name)
+    if stack and stack[-1][0] == key and stack[-1][2] is component:
+        # An override calling super(), or a stand-in calling the action that it
+        # replaces, which is part of the same action
+        return call(*args, **kwargs)
+    # [key, time in nested actions, component]
+    frame = [key, 0.0, component]
+    stack.append(frame)
+    start = perf_counter()
+    try:
+        return call(*args, **kwargs)
+    finally:
+        elapsed = perf_counter() - start
+        stack.pop()
+        nested = frame[1]
+        path = tuple(f[0] for f in stack) + (key,)
+        if stack:
+            stack[-1][1] += elapsed
+        with _lock:
+            stats = _stats.get(key)
+            if stats is None:
+                stats = _stats[key] = [0, 0.0, 0.0]
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] += nested
+            _stacks[path] = _stacks.get(path, 0.0) + elapsed - nested
+
+
+def _profiled(name: str, action):
+    @wraps(action)
+    def profiled(self, *args, **kwargs):
+        return _record(self, name, action, self, *args, **kwargs)
+
+    return profiled
+
+
+def _instrument(cls: type):
+    """Wraps the actions defined by a model class and its bases."""
+    with _lock:
+        if not _enabled:
+            return
+        for klass in cls.__mro__:
+            if klass in _instrumented or not issubclass(klass, ComponentModel):
+                continue
+            _instrumented.add(klass)
+            for name, function in list(klass.__dict__.items()):
+                if getattr(function, "_is_component_action", False):
+                    _originals[(klass, name)] = function
+                    setattr(klass, name, _profiled(name, function))
+
+
+def _model_classes() -> list[type]:
+    classes, pending = [], [ComponentModel]
+    while pending:
+        cls = pending.pop()
+        classes.append(cls)
+        pending.extend(cls.__subclasses__())
+    return classes
+
+
+def enable():
+    """
+    Starts profiling. The library's model modules are imported, and the actions of
+    every model class defined so far are wrapped. Classes defined later are wrapped
+    when one of their instances is a subcomponent of a profiled component.
+    """
+    global _enabled
+    import hwcomponents_library
+
+    for module in set(hwcomponents_library._NAME_TO_MODULE.values()):
+        importlib.import_module(module)
+    with _lock:
+        _enabled = True
+        base._action_hook = _record
+    for cls in _model_classes():
+        _instrument(cls)
+
+
+def disable():
+    """Stops profiling and unwraps the actions. The statistics are kept."""
+    global _enabled
+    with _lock:
+        _enabled = False
+        base._action_hook = None
+        for (cls, name), function in _originals.items():
+            setattr(cls, name, function)
+        _originals.clear()
+        _instrumented.clear()
+
+
+def is_enabled() -> bool:
+    """Returns whether profiling is enabled."""
+    return _enabled
+
+
+def reset():
+    """Drops the statistics recorded so far."""
+    with _lock:
+        _stats.clear()
+        _stacks.clear()
+
+
+@contextmanager
+def profile(reset_stats: bool = True):
+    """
+    Enables profiling for the duration of a with block.
+
+    Parameters
+    ----------
+    reset_stats: bool
+        Whether to drop the statistics recorded before the block.
+    """
+    if reset_stats:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def stats() -> list[ActionStats]:
+    """
+    Returns the statistics of each profiled (class, action), by descending total time.
+
+    Returns
+    -------
+    list[ActionStats]
+        The class name, action name, count, total time, nested time, and self time of
+        each action. Times are in seconds.
+    """
+    with _lock:
+        items = [(key, list(values)) for key, values in _stats.items()]
+    result = [
+        ActionStats(cls, action, count, total, nested, total - nested)
+        for (cls, action), (count, total, nested) in items
+    ]
+    return sorted(result, key=lambda s: -s.total_time)
+
+
+def table() -> dict[str, list]:
+    """
+    Returns the statistics as columns, which can be passed to pandas.DataFrame or
+    pyarrow.table as is.
+
+    Returns
+    -------
+    dict[str, list]
+        One column per field of ActionStats, one row per (class, action).
+    """
+    rows = stats()
+    return {field: [getattr(r, field) for r in rows] for field in ActionStats._fields}
+
+
+def report(limit: int | None = None) -> str:
+    """
+    Formats the statistics as a text table.
+
+    Parameters
+    ----------
+    limit: int | None
+        The maximum number of actions to list, by descending total time.
+
+    Returns
+    -------
+    str
+        The table.
+    """
+    rows = stats()[:limit]
+    names = [f"{r.class_name}.{r.action}" for r in rows]
+    width = max([len("action"), *(len(n) for n in names)])
+    lines = [
+        f"{'action':<{width}} {'count':>10} {'total (s)':>12} {'nested (s)':>12} "
+        f"{'self (s)':>12} {'per call (us)':>14}"
+    ]
+    for name, r in zip(names, rows):
+        lines.append(
+            f"{name:<{width}} {r.count:>10} {r.total_time:>12.6f} "
+            f"{r.nested_time:>12.6f} {r.self_time:>12.6f} "
+            f"{r.total_time / r.count * 1e6:>14.2f}"
+        )
+    return "\n".join(lines)
+
+
+def collapsed_stacks() -> str:
+    """
+    Returns the self time of each stack of nested actions in the collapsed-stack format
+    of flamegraph tools: one "Outer.action;Inner.action <microseconds>" line per stack.
+
+    Returns
+    -------
+    str
+        The collapsed stacks.
+    """
+    with _lock:
+        items = sorted(_stacks.items())
+    return "".join(
+        f"{';'.join(f'{c}.{a}' for c, a in path)} {round(t * 1e6)}\n"
+        for path, t in items
+    )
+
+
+def write_collapsed_stacks(path: Path | str):
+    """
+    Writes the collapsed stacks (see `collapsed_stacks`) to a file.
+
+    Parameters
+    ----------
+    path: Path | str
+        The file to write.
+    """
+    Path(path).write_text(collapsed_stacks())
@@ -0,0 +1,263 @@
+"""
+Reference data of the table-driven models.
+
+Each table-driven model is calibrated to one reference design from a paper: its area
+and leak power, the energy, latency, and throughput of its actions, and how each
+constructor parameter scales these from the reference. This data is stored in one JSON
+table per paper in the `data` directory of this package, keyed by class name:
+
+    {
+      "IsaacADC": {
+        "source": ["tech_node,global_cycle_period,resolution,energy,area,action", ...],
+        "area": 1.2e-09,
+        "leak_power": 0.0,
+        "parameters": [
+          {"name": "tech_node", "default": 3.2e-08, "area": "tech_node_area", ...},
+          {"name": "resolution", "default": 8, "area": "pow_base(2)", ...}
+        ],
+        "actions": {
+          "convert": {"energy": 1.666666667e-12, "latency": "1 / 1.2e9", ...}
+        }
+      }
+    }
+
+"source" holds the original calibration data and notes. Each parameter names the
+hwcomponents.scaling function (or list of composed functions) that scales each of
+"area", "energy", "latency", "throughput", and "leak_power"; costs it does not name are
+not scaled. Action costs are numbers, or arithmetic expressions of the component's
+attributes (e.g., "1e-09 / 36864 / width").
+
+Each table is loaded and compiled the first time one of its models is constructed. The
+scaling functions of all of a model's parameters are fused into one function that
+returns the five scales, and the costs of each action into one function of the
+attributes they use.
+"""
+
+import ast
+import json
+import math
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+from hwcomponents import scaling
+
+DATA_DIR = Path(__file__).parent / "data"
+_LIBRARY_PACKAGE = "hwcomponents_library.library."
+
+# The costs that a parameter can scale, in the order that ComponentModel.scale applies
+# them
+COSTS = ("area", "energy", "latency", "leak_power", "throughput")
+ACTION_COSTS = ("energy", "latency", "throughput")
+
+# Names that expressions may use besides the component's attributes
+_EXPRESSION_NAMESPACE = {"__builtins__": {}, "float": float, "inf": math.inf}
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.operator,
+    ast.unaryop,
+    ast.Constant,
+    ast.Name,
+    ast.Load,
+)
+
+
+def _scale_function(spec: str | list[str]) -> Callable[[float, float], float]:
+    """Resolves a scaling function by name, e.g., "linear" or "pow_base(2)"."""
+    if isinstance(spec, list):
+        functions = [_scale_function(s) for s in spec]
+        first, rest = functions[0], functions[1:]
+
+        def composed(target, scalefrom):
+            # As hwcomponents.model._apply_scale_func composes tuples of functions
+            value = first(target, scalefrom)
+            for function in rest:
+                value = function(value, 1)
+            return value
+
+        return composed
+
+    tree = ast.parse(spec, mode="eval").body
+    if isinstance(tree, ast.Name):
+        return getattr(scaling, tree.id)
+    if (
+        isinstance(tree, ast.Call)
+        and isinstance(tree.func, ast.Name)
+        and not tree.keywords
+    ):
+        args = [ast.literal_eval(a) for a in tree.args]
+        return getattr(scaling, tree.func.id)(*args)
+    raise ValueError(f"Invalid scaling function {spec!r}.")
+
+
+def _expression(value: float | str) -> tuple[str, set[str]]:
+    """
+    Returns the source of a cost expression and the attributes that it uses. Only
+    arithmetic on numbers and attributes is allowed.
+    """
+    if not isinstance(value, str):
+        return repr(value), set()
+    tree = ast.parse(value, mode="eval")
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if node.id not in _EXPRESSION_NAMESPACE:
+                names.add(node.id)
+        elif isinstance(node, ast.Call):
+            # float("inf") and the like
+            if not (isinstance(node.func, ast.Name) and node.func.id == "float"):
+                raise ValueError(f"Invalid cost expression {value!r}.")
+        elif not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Invalid cost expression {value!r}.")
+    return f"({value})", names
+
+
+class ReferenceAction:
+    """
+    The cost of one action of a reference design, compiled into one function of the
+    component attributes that it uses.
+    """
+
+    def __init__(self, name: str, spec: dict):
+        self.name = name
+        sources, attributes = [], set()
+        for cost in ACTION_COSTS:
+            source, names = _expression(spec[cost])
+            sources.append(source)
+            attributes |= names
+        self.attributes: tuple[str, ...] = tuple(sorted(attributes))
+        self.function = eval(
+            f"lambda {', '.join(self.attributes)}: ({', '.join(sources)})",
+            dict(_EXPRESSION_NAMESPACE),
+        )
+
+    def cost(self, component) -> tuple:
+        """Returns the (energy, latency, throughput) of the action for a component."""
+        return self.function(*[getattr(component, a) for a in self.attributes])
+
+
+class ReferenceModel:
+    """
+    The reference data of one table-driven model, compiled for evaluation.
+
+    Attributes
+    ----------
+    name: str
+        The name of the class that the data belongs to.
+    source: tuple[str, ...]
+        The original calibration data and notes.
+    area: float
+        The area of the reference design.
+    leak_power: float
+        The leak power of the reference design.
+    parameters: tuple[str, ...]
+        The names of the scaled parameters, in the order they are applied.
+    defaults: tuple[float, ...]
+        The value of each parameter in the reference design.
+    functions: dict[str, tuple]
+        For each parameter, its (area, energy, latency, leak_power, throughput) scaling
+        functions, None for costs that it does not scale.
+    actions: dict[str, ReferenceAction]
+        The actions of the reference design.
+    """
+
+    def __init__(self, name: str, entry: dict):
+        self.name = name
+        self.source = tuple(entry.get("source", ()))
+        self.area = entry["area"]
+        self.leak_power = entry["leak_power"]
+        self.parameters = tuple(p["name"] for p in entry["parameters"])
+        self.defaults = tuple(p["default"] for p in entry["parameters"])
+        self.functions = {
+            p["name"]: tuple(
+                _scale_function(p[c]) if c in p else None for c in COSTS
+            )
+            for p in entry["parameters"]
+        }
+        self.actions = {
+            action: ReferenceAction(action, spec)
+            for action, spec in entry.get("actions", {}).items()
+        }
+        self.scales = self._fuse()
+
+    def _fuse(self) -> Callable[[tuple], tuple[list, list]]:
+        # For each parameter, the costs that it scales, by index
+        steps = [
+            (
+                i,
+                default,
+                [(c, f) for c, f in enumerate(self.functions[name]) if f is not None],
+            )
+            for i, (name, default) in enumerate(zip(self.parameters, self.defaults))
+        ]
+
+        def scales(values: tuple) -> tuple[list, list]:
+            """
+            Returns the (area, energy, latency, leak_power, throughput) scales for
+            the parameter values, in the order of `parameters`, and the (parameter
+            index, cost index, factor) of each factor in them. Parameters that are
+            None or equal to their default are not scaled. The factors are multiplied
+            in the same order as successive ComponentModel.scale calls would.
+            """
+            result = [1] * len(COSTS)
+            factors = []
+            for i, default, functions in steps:
+                value = values[i]
+                if value is None or value == default:
+                    continue
+                for c, function in functions:
+                    factor = function(value, default)
+                    result[c] = result[c] * factor
+                    factors.append((i, c, factor))
+            return result, factors
+
+        return scales
+
+
+@lru_cache(maxsize=None)
+def load_table(paper: str) -> dict:
+    """
+    Loads the reference data table of one paper.
+
+    Parameters
+    ----------
+    paper: str
+        The name of the table, which is the name of the library module that defines
+        the paper's models (e.g., "isaac").
+
+    Returns
+    -------
+    dict
+        The table, keyed by class name.
+    """
+    return json.loads((DATA_DIR / f"{paper}.json").read_text())
+
+
+@lru_cache(maxsize=None)
+def reference_model(cls: type) -> ReferenceModel:
+    """
+    Returns the compiled reference data of a model class. Subclasses without their own
+    entry use the entry of the closest base class that has one.
+
+    Parameters
+    ----------
+    cls: type
+        The model class.
+
+    Returns
+    -------
+    ReferenceModel
+        The compiled reference data.
+    """
+    for klass in cls.__mro__:
+        if not klass.__module__.startswith(_LIBRARY_PACKAGE):
+            continue
+        paper = klass.__module__[len(_LIBRARY_PACKAGE) :]
+        if not (DATA_DIR / f"{paper}.json").exists():
+            continue
+        entry = load_table(paper).get(klass.__name__)
+        if entry is not None:
+            return ReferenceModel(klass.__name__, entry)
+    raise ValueError(f"No reference data found for {cls.__name__}.")
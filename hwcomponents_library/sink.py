@@ -0,0 +1,259 @@
+"""
+Arrow and Parquet output of evaluation results.
+
+The tables returned by batch.evaluate and yielded by sweep.sweep can be written as they
+are produced, without collecting them first:
+
+    from hwcomponents_library import sink, sweep
+
+    points = sweep.grid(tech_node=[65e-9, 45e-9, 32e-9], resolution=range(4, 13))
+    sink.write_parquet("isaac_adc.parquet", sweep.sweep("IsaacADC", points))
+
+Rows are buffered into record batches of at most `row_group_size` rows, each written as
+one Parquet row group or Arrow IPC record batch, so memory use is bounded by one batch
+however many rows are written. Numbers are stored as Arrow numeric columns, and
+list-valued parameters, such as histograms, as Arrow list columns.
+
+Tables may have different columns, as sweep.sweep yields when points set different
+parameters. The file has the union of the columns, with nulls where a table lacks one,
+and integer columns that later hold fractional values are stored as floats. If a table
+adds a column or widens one after rows were written, those rows are rewritten with the
+wider schema once all tables are read.
+
+Requires pyarrow 14 or later.
+"""
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+import numpy as np
+
+from hwcomponents_library.batch import _columns
+
+if TYPE_CHECKING:
+    import pyarrow
+
+DEFAULT_ROW_GROUP_SIZE = 65536
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Writing Arrow and Parquet files requires pyarrow, but it could not be "
+            "imported. Install it with `pip install pyarrow`."
+        ) from e
+    return pyarrow
+
+
+def _array(pa, column: np.ndarray):
+    if column.dtype == object:
+        # E.g., tuples of list-valued parameters
+        return pa.array(column.tolist())
+    return pa.array(column)
+
+
+def _conform(pa, batch: "pyarrow.RecordBatch", schema: "pyarrow.Schema"):
+    """Casts a record batch to a wider schema, with nulls for the columns it lacks."""
+    arrays = [
+        (
+            batch.column(field.name).cast(field.type)
+            if field.name in batch.schema.names
+            else pa.nulls(batch.num_rows, field.type)
+        )
+        for field in schema
+    ]
+    return pa.record_batch(arrays, schema=schema)
+
+
+def record_batches(
+    tables: Iterable, row_group_size: int = DEFAULT_ROW_GROUP_SIZE
+) -> Iterator["pyarrow.RecordBatch"]:
+    """
+    Converts a stream of tables into Arrow record batches of a bounded size.
+
+    Parameters
+    ----------
+    tables: Iterable[dict | pandas.DataFrame | pyarrow.Table]
+        The tables, e.g., from batch.evaluate or sweep.sweep. A single table may be
+        passed as is.
+    row_group_size: int
+        The number of rows of each record batch. The last batch may be smaller.
+
+    Returns
+    -------
+    Iterator[pyarrow.RecordBatch]
+        The rows of the tables, in order. Each batch has the union of the columns of the
+        tables read so far, with nulls where a table lacks a column, and types promoted
+        to hold the values of every table (e.g., integers to floats). The schema of a
+        batch therefore extends or widens that of the batch before it.
+    """
+    pa = _pyarrow()
+    if row_group_size < 1:
+        raise ValueError(f"row_group_size must be at least 1, got {row_group_size}.")
+    if isinstance(tables, dict) or hasattr(tables, "columns"):
+        tables = [tables]
+
+    schema = None
+    pending: list["pyarrow.Table"] = []
+    n_pending = 0
+
+    def take(n_rows: int):
+        nonlocal schema, pending, n_pending
+        table = pa.concat_tables(pending, promote_options="permissive")
+        # Slices are views, so splitting a large table doesn't copy it per batch
+        batch = table.slice(0, n_rows).combine_chunks().to_batches()[0]
+        pending = [table.slice(n_rows)]
+        n_pending -= n_rows
+        if schema is None:
+            schema = batch.schema
+        else:
+            schema = pa.unify_schemas(
+                [schema, batch.schema], promote_options="permissive"
+            )
+        return _conform(pa, batch, schema)
+
+    for table in tables:
+        columns = _columns(table)
+        table = pa.table({name: _array(pa, c) for name, c in columns.items()})
+        if not table.num_rows:
+            continue
+        pending.append(table)
+        n_pending += table.num_rows
+        while n_pending >= row_group_size:
+            yield take(row_group_size)
+    if n_pending:
+        yield take(n_pending)
+
+
+def _write(
+    path: Path | str,
+    batches: Iterator["pyarrow.RecordBatch"],
+    open_writer: Callable,
+    read_batches: Callable,
+) -> int:
+    """
+    Writes record batches whose schemas only extend or widen (see record_batches) to
+    one file. When the schema changes, the file written so far is set aside and a new
+    one is started. The files set aside are rewritten with the final schema at the end.
+    """
+    pa = _pyarrow()
+    path = Path(path)
+    n_rows = 0
+    writer, schema = None, None
+    set_aside: list[Path] = []
+    try:
+        try:
+            for batch in batches:
+                if writer is not None and not batch.schema.equals(schema):
+                    writer.close()
+                    writer = None
+                    part = path.with_name(f".{path.name}.{len(set_aside)}.part")
+                    os.replace(path, part)
+                    set_aside.append(part)
+                if writer is None:
+                    schema = batch.schema
+                    writer = open_writer(path, schema)
+                writer.write_batch(batch)
+                n_rows += batch.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if set_aside:
+            rewritten = path.with_name(f".{path.name}.tmp")
+            writer = open_writer(rewritten, schema)
+            try:
+                for part in [*set_aside, path]:
+                    for batch in read_batches(part):
+                        writer.write_batch(_conform(pa, batch, schema))
+            finally:
+                writer.close()
+            os.replace(rewritten, path)
+    finally:
+        for part in set_aside:
+            part.unlink(missing_ok=True)
+    return n_rows
+
+
+def write_parquet(
+    path: Path | str,
+    tables: Iterable,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = "zstd",
+) -> int:
+    """
+    Writes a stream of tables to a Parquet file, one row group per record batch.
+
+    Parameters
+    ----------
+    path: Path | str
+        The file to write.
+    tables: Iterable[dict | pandas.DataFrame | pyarrow.Table]
+        The tables, e.g., from batch.evaluate or sweep.sweep. A single table may be
+        passed as is. The file has the columns of every table (see record_batches).
+    row_group_size: int
+        The number of rows of each row group. The last row group may be smaller.
+    compression: str
+        The Parquet compression codec.
+
+    Returns
+    -------
+    int
+        The number of rows written. If it is 0, no file is written.
+    """
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    class Writer(pq.ParquetWriter):
+        def write_batch(self, batch):
+            super().write_batch(batch, row_group_size=row_group_size)
+
+    def read_batches(part: Path):
+        with pq.ParquetFile(part) as f:
+            yield from f.iter_batches(batch_size=row_group_size)
+
+    return _write(
+        path,
+        record_batches(tables, row_group_size),
+        lambda p, schema: Writer(p, schema, compression=compression),
+        read_batches,
+    )
+
+
+def write_arrow(
+    path: Path | str,
+    tables: Iterable,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> int:
+    """
+    Writes a stream of tables to an Arrow IPC (Feather v2) file, one record batch at a
+    time. The file can be memory-mapped with pyarrow.ipc.open_file.
+
+    Parameters
+    ----------
+    path: Path | str
+        The file to write.
+    tables: Iterable[dict | pandas.DataFrame | pyarrow.Table]
+        The tables, e.g., from batch.evaluate or sweep.sweep. A single table may be
+        passed as is. The file has the columns of every table (see record_batches).
+    row_group_size: int
+        The number of rows of each record batch. The last batch may be smaller.
+
+    Returns
+    -------
+    int
+        The number of rows written. If it is 0, no file is written.
+    """
+    pa = _pyarrow()
+
+    def read_batches(part: Path):
+        with pa.ipc.open_file(part) as reader:
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i)
+
+    return _write(
+        path, record_batches(tables, row_group_size), pa.ipc.new_file, read_batches
+    )
@@ -0,0 +1,304 @@
+"""
+Snapshots of constructed components.
+
+Composite components, such as those built on CACTI or NeuroSim, are expensive to
+construct, and carry loggers and subcomponent graphs that make them large and slow to
+pickle. A snapshot stores only what the component resolved to: its area, leak power,
+and the cost of each action, for the component and each of its subcomponents. It
+restores to a ComponentSnapshot, a lightweight stand-in that answers the same queries
+without constructing anything:
+
+    from hwcomponents_library import snapshot
+
+    buffer = SmartBufferSRAM(tech_node=45e-9, width=64, size=2**20)
+    data = snapshot.snapshot(buffer)  # A JSON-compatible dict
+    restored = snapshot.restore(data)
+    restored.area, restored.read(), restored.read(bits_per_action=128)
+
+ComponentSnapshots pickle cheaply, so they can be sent to worker processes. To reuse
+components across runs, `save` and `load` store snapshots in a JSON file.
+
+Actions are snapshotted if they can be called without arguments. As with the @action
+decorator, calling a restored action with bits_per_action scales its energy by, and its
+throughput by the reciprocal of, bits_per_action over the component's nominal bits.
+"""
+
+import inspect
+import json
+from numbers import Number
+from pathlib import Path
+
+from hwcomponents import ActionCost, ComponentModel
+
+from hwcomponents_library.base import _bits_per_action, _takes_no_arguments
+
+SNAPSHOT_VERSION = 1
+_SIMPLE_TYPES = (int, float, str, bool, type(None))
+
+
+def _nominal_bits(component: ComponentModel, action) -> float | None:
+    """Returns the nominal bits per action of an action, or None if it has none."""
+    bits_per_action = _bits_per_action(action)
+    if isinstance(bits_per_action, str):
+        bits_per_action = getattr(component, bits_per_action, None)
+    if isinstance(bits_per_action, Number) and not isinstance(bits_per_action, bool):
+        return float(bits_per_action)
+    return None
+
+
+def _parameters(component: ComponentModel) -> dict:
+    """Returns the constructor parameters that a component stores as attributes."""
+    try:
+        names = list(inspect.signature(type(component).__init__).parameters)[1:]
+    except (TypeError, ValueError):
+        return {}
+    parameters = {}
+    for name in names:
+        if name not in component.__dict__:
+            continue
+        value = component.__dict__[name]
+        if isinstance(value, Number) and hasattr(value, "item"):
+            value = value.item()  # NumPy scalars
+        if isinstance(value, _SIMPLE_TYPES):
+            parameters[name] = value
+    return parameters
+
+
+def snapshot(component: ComponentModel) -> dict:
+    """
+    Takes a snapshot of a constructed component and its subcomponents.
+
+    Parameters
+    ----------
+    component: ComponentModel
+        The component. A ComponentSnapshot is snapshotted again as is.
+
+    Returns
+    -------
+    dict
+        The snapshot, which only holds numbers, strings, lists, and dicts, so it can be
+        stored as JSON.
+    """
+    if isinstance(component, ComponentSnapshot):
+        return component.snapshot()
+
+    cls = type(component)
+    actions = {}
+    for name in sorted(cls.get_action_names()):
+        function = getattr(cls, name)
+        if not _takes_no_arguments(getattr(function, "_original_function", function)):
+            continue
+        # Taking a snapshot is not a use of the component
+        used = (
+            component._energy_used,
+            component._latency_used,
+            component._throughput_used,
+        )
+        cost = getattr(component, name)()
+        component._energy_used, component._latency_used, component._throughput_used = (
+            used
+        )
+        actions[name] = [
+            float(cost.energy),
+            float(cost.latency),
+            float(cost.throughput),
+            _nominal_bits(component, function),
+        ]
+
+    return {
+        "version": SNAPSHOT_VERSION,
+        "class_name": f"{cls.__module__}.{cls.__qualname__}",
+        "component_name": cls.component_name,
+        "priority": cls.priority,
+        "parameters": _parameters(component),
+        "area": float(component.area),
+        "leak_power": float(component.leak_power),
+        "actions": actions,
+        "subcomponents": [snapshot(s) for s in component.subcomponents],
+    }
+
+
+class ComponentSnapshot:
+    """
+    A lightweight stand-in for a constructed component, restored from a snapshot. It
+    has the area, leak power, and action costs of the component it was taken from, and
+    its subcomponents are ComponentSnapshots as well.
+
+    Attributes
+    ----------
+    class_name: str
+        The qualified name of the class of the component.
+    component_name: str | list[str] | None
+        The component name(s) of the class.
+    priority: float
+        The priority of the class.
+    parameters: dict
+        The constructor parameters that the component stored as attributes.
+    area: float
+        The area of the component, including its subcomponents, in m^2.
+    leak_power: float
+        The leak power of the component, including its subcomponents, in Watts.
+    subcomponents: tuple[ComponentSnapshot, ...]
+        The subcomponents of the component.
+    """
+
+    __slots__ = (
+        "class_name",
+        "component_name",
+        "priority",
+        "parameters",
+        "area",
+        "leak_power",
+        "subcomponents",
+        "_actions",
+    )
+
+    def __init__(self, data: dict):
+        version = data.get("version")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version {version}. Expected version "
+                f"{SNAPSHOT_VERSION}."
+            )
+        self.class_name: str = data["class_name"]
+        self.component_name = data["component_name"]
+        self.priority: float = data["priority"]
+        self.parameters: dict = dict(data["parameters"])
+        self.area: float = data["area"]
+        self.leak_power: float = data["leak_power"]
+        self.subcomponents = tuple(ComponentSnapshot(s) for s in data["subcomponents"])
+        self._actions: dict[str, tuple] = {
+            name: tuple(cost) for name, cost in data["actions"].items()
+        }
+
+    def get_action_names(self) -> list[str]:
+        """Returns the names of the snapshotted actions."""
+        return list(self._actions)
+
+    def action(self, name: str, bits_per_action: float | None = None) -> ActionCost:
+        """
+        Returns the cost of an action.
+
+        Parameters
+        ----------
+        name: str
+            The name of the action.
+        bits_per_action: float | None
+            The number of bits per action. If given, energy and throughput are scaled
+            as the @action decorator scales them.
+
+        Returns
+        -------
+        ActionCost
+            The energy, latency, and throughput of the action.
+        """
+        try:
+            energy, latency, throughput, nominal_bits = self._actions[name]
+        except KeyError:
+            raise AttributeError(
+                f"{self.class_name} snapshot has no action {name}. Snapshotted actions "
+                f"are: {', '.join(self._actions)}"
+            ) from None
+        if bits_per_action is not None:
+            if nominal_bits is None:
+                raise ValueError(
+                    f"Action {name} of {self.class_name} does not take bits_per_action."
+                )
+            scale = bits_per_action / nominal_bits
+            energy, throughput = energy * scale, throughput / scale
+        return ActionCost(energy=energy, latency=latency, throughput=throughput)
+
+    def __getattr__(self, name: str):
+        # Only reached for names that aren't slots or methods, e.g., action names
+        if name.startswith("_") or name not in self._actions:
+            raise AttributeError(
+                f"{self.class_name} snapshot has no attribute or action {name}."
+            )
+
+        def action(bits_per_action: float | None = None) -> ActionCost:
+            return self.action(name, bits_per_action=bits_per_action)
+
+        action.__name__ = name
+        return action
+
+    def __getstate__(self) -> dict:
+        return self.snapshot()
+
+    def __setstate__(self, state: dict):
+        self.__init__(state)
+
+    def snapshot(self) -> dict:
+        """Returns the snapshot that this was restored from."""
+        return {
+            "version": SNAPSHOT_VERSION,
+            "class_name": self.class_name,
+            "component_name": self.component_name,
+            "priority": self.priority,
+            "parameters": dict(self.parameters),
+            "area": self.area,
+            "leak_power": self.leak_power,
+            "actions": {name: list(cost) for name, cost in self._actions.items()},
+            "subcomponents": [s.snapshot() for s in self.subcomponents],
+        }
+
+    def __repr__(self) -> str:
+        parameters = ", ".join(f"{k}={v!r}" for k, v in self.parameters.items())
+        return f"ComponentSnapshot({self.class_name}({parameters}))"
+
+
+def restore(data: dict) -> ComponentSnapshot:
+    """
+    Restores a snapshot.
+
+    Parameters
+    ----------
+    data: dict
+        The snapshot, as returned by `snapshot`.
+
+    Returns
+    -------
+    ComponentSnapshot
+        A stand-in for the component that the snapshot was taken of.
+    """
+    return ComponentSnapshot(data)
+
+
+def save(path: Path | str, components: dict[str, ComponentModel]):
+    """
+    Saves snapshots of components to a JSON file.
+
+    Parameters
+    ----------
+    path: Path | str
+        The file to write.
+    components: dict[str, ComponentModel]
+        The components to snapshot, by name. ComponentSnapshots are saved as well.
+    """
+    data = {
+        "version": SNAPSHOT_VERSION,
+        "components": {name: snapshot(c) for name, c in components.items()},
+    }
+    Path(path).write_text(json.dumps(data, separators=(",", ":")))
+
+
+def load(path: Path | str) -> dict[str, ComponentSnapshot]:
+    """
+    Loads snapshots saved with `save`.
+
+    Parameters
+    ----------
+    path: Path | str
+        The file to read.
+
+    Returns
+    -------
+    dict[str, ComponentSnapshot]
+        The restored components, by name.
+    """
+    data = json.loads(Path(path).read_text())
+    if data.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(
+            f"{path} holds snapshots of version {data.get('version')}. Expected "
+            f"version {SNAPSHOT_VERSION}."
+        )
+    return {name: restore(c) for name, c in data["components"].items()}
@@ -0,0 +1,257 @@
+"""
+Parallel design-space sweeps of library models.
+
+`sweep` evaluates a model at many points of its parameter space across a pool of worker
+processes, and yields the results of each chunk of points as soon as it completes:
+
+    from hwcomponents_library import sweep
+
+    points = sweep.grid(
+        tech_node=[65e-9, 45e-9, 32e-9], size=[2**i for i in range(10, 21)]
+    )
+    for table in sweep.sweep("SmartBufferSRAM", points):
+        table["size"], table["area"], table["read.energy"]
+
+Points come from `grid`, the Cartesian product of parameter values, from `sample`,
+random draws of parameter values, or from any iterable of dicts of constructor
+parameters. Each chunk of points is evaluated in one worker with batch.evaluate, so
+table-driven models evaluate a chunk with one component with array-valued parameters.
+Workers keep their imports, reference data, and a flyweight cache of constructed
+components warm across chunks, and models backed by CACTI share the persistent CACTI
+cache (see hwcomponents_library.cacti_cache) across workers.
+"""
+
+import itertools
+import math
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+
+from hwcomponents_library.base import LibraryEstimatorClassBase
+from hwcomponents_library.batch import (
+    _column,
+    _default_actions,
+    _resolve_model,
+    evaluate,
+)
+
+_DEFAULT_CHUNKSIZE = 256
+# Chunks submitted per worker ahead of the results being consumed
+_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+
+def _values(value) -> list:
+    if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+        return [value]
+    return list(value)
+
+
+class _Grid:
+    def __init__(self, parameters: dict[str, Any]):
+        self.parameters = {name: _values(v) for name, v in parameters.items()}
+
+    def __len__(self) -> int:
+        return math.prod(len(v) for v in self.parameters.values())
+
+    def __iter__(self) -> Iterator[dict]:
+        names = list(self.parameters)
+        for values in itertools.product(*self.parameters.values()):
+            yield dict(zip(names, values))
+
+
+class _Sample:
+    def __init__(self, n: int, seed: int | None, parameters: dict[str, Any]):
+        self.n = n
+        self.seed = seed
+        self.parameters = {
+            name: v if callable(v) else _values(v) for name, v in parameters.items()
+        }
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __iter__(self) -> Iterator[dict]:
+        rng = random.Random(self.seed)
+        for _ in range(self.n):
+            yield {
+                name: v(rng) if callable(v) else rng.choice(v)
+                for name, v in self.parameters.items()
+            }
+
+
+def grid(**parameters) -> Iterable[dict]:
+    """
+    Returns every combination of the given parameter values.
+
+    Parameters
+    ----------
+    parameters
+        The values of each parameter. Strings and other non-iterable values are used
+        for every point.
+
+    Returns
+    -------
+    Iterable[dict]
+        The points, each a dict of constructor parameters, with the last parameter
+        varying fastest. The iterable has a length and can be iterated more than once.
+    """
+    return _Grid(parameters)
+
+
+def sample(n: int, seed: int | None = None, **parameters) -> Iterable[dict]:
+    """
+    Returns random points of a parameter space.
+
+    Parameters
+    ----------
+    n: int
+        The number of points.
+    seed: int | None
+        The seed of the random number generator. Iterating a seeded sample always
+        yields the same points.
+    parameters
+        How to draw each parameter: a callable that takes a random.Random and returns a
+        value (e.g., `lambda rng: 2 ** rng.randint(10, 20)`), or values to choose
+        from uniformly. Strings and other non-iterable values are used for every point.
+
+    Returns
+    -------
+    Iterable[dict]
+        The points, each a dict of constructor parameters. The iterable has a length.
+    """
+    if n < 0:
+        raise ValueError(f"n must be non-negative, got {n}.")
+    return _Sample(n, seed, parameters)
+
+
+def _chunks(points: Iterable[dict], chunksize: int) -> Iterator[list[dict]]:
+    iterator = iter(points)
+    while chunk := list(itertools.islice(iterator, chunksize)):
+        yield chunk
+
+
+def _init_worker(model: type, flyweight_cache_size: int):
+    # Unpickling the model imported its module. Load its reference data and cache the
+    # components that later chunks construct again.
+    if not issubclass(model, LibraryEstimatorClassBase):
+        return
+    if flyweight_cache_size and not model._flyweight_cache_size:
+        model.enable_flyweight_cache(flyweight_cache_size)
+    from hwcomponents_library.reference import reference_model
+
+    try:
+        reference_model(model)
+    except ValueError:
+        pass  # Not a table-driven model
+
+
+def _evaluate_chunk(
+    model: type, actions: list[str], points: list[dict]
+) -> list[dict[str, np.ndarray]]:
+    # Points with the same parameters are evaluated as one table
+    groups: dict[tuple, list[dict]] = {}
+    for point in points:
+        groups.setdefault(tuple(point), []).append(point)
+
+    tables = []
+    for names, group in groups.items():
+        columns = {n: [p[n] for p in group] for n in names}
+        if names:
+            costs = evaluate(model, columns, actions)
+        else:
+            costs = evaluate(model, {}, actions)
+            costs = {k: np.repeat(v, len(group)) for k, v in costs.items()}
+        tables.append({**{n: _column(v) for n, v in columns.items()}, **costs})
+    return tables
+
+
+def sweep(
+    class_or_name: type | str,
+    points: Iterable[dict],
+    actions: list[str] | None = None,
+    max_workers: int | None = None,
+    chunksize: int | None = None,
+    flyweight_cache_size: int = 1024,
+) -> Iterator[dict[str, np.ndarray]]:
+    """
+    Evaluates a model at many points across a pool of worker processes, yielding the
+    results of each chunk of points as soon as it completes.
+
+    Parameters
+    ----------
+    class_or_name: type | str
+        The model class, or the name of a model or component in this library. A
+        component name resolves to the highest-priority model that implements it.
+    points: Iterable[dict]
+        The constructor parameters of each point, e.g., from `grid` or `sample`.
+        Parameters that a point doesn't set take their default values. Points are
+        read lazily, so they may come from a generator.
+    actions: list[str] | None
+        The actions to evaluate. Defaults to every action that can be called without
+        arguments.
+    max_workers: int | None
+        The number of worker processes. Defaults to the number of CPUs. With one
+        worker, points are evaluated in this process.
+    chunksize: int | None
+        The number of points sent to a worker at once. Defaults to splitting the points
+        into about four chunks per worker, up to 256 points per chunk.
+    flyweight_cache_size: int
+        The size of the flyweight cache that each worker enables for the model (see
+        LibraryEstimatorClassBase.enable_flyweight_cache), so that workers reuse
+        components that they have already constructed. 0 disables it. Unused if the
+        cache is already enabled in the worker.
+
+    Returns
+    -------
+    Iterator[dict[str, numpy.ndarray]]
+        One table per completed chunk, in the order that chunks complete. Each table
+        has a column for each parameter set by its points, and the cost columns of
+        batch.evaluate: "area", "leak_power", and "<action>.energy",
+        "<action>.latency", and "<action>.throughput" for each action. A chunk whose
+        points set different parameters yields one table per set of parameters.
+    """
+    model = _resolve_model(class_or_name)
+    if actions is None:
+        actions = _default_actions(model)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}.")
+    if chunksize is None:
+        chunksize = _DEFAULT_CHUNKSIZE
+        if hasattr(points, "__len__"):
+            chunksize = min(chunksize, math.ceil(len(points) / (4 * max_workers)))
+        chunksize = max(chunksize, 1)
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}.")
+
+    if max_workers == 1:
+        for chunk in _chunks(points, chunksize):
+            yield from _evaluate_chunk(model, actions, chunk)
+        return
+
+    pool = ProcessPoolExecutor(
+        max_workers,
+        initializer=_init_worker,
+        initargs=(model, flyweight_cache_size),
+    )
+    try:
+        # Keep a bounded number of chunks in flight so that large or lazy point sets
+        # aren't read into memory all at once
+        pending = set()
+        for chunk in _chunks(points, chunksize):
+            if len(pending) >= _CHUNKS_IN_FLIGHT_PER_WORKER * max_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+            pending.add(pool.submit(_evaluate_chunk, model, actions, chunk))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    finally:
+        # Also reached if the caller stops iterating early
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -15,5 +15,17 @@ if hwcomponents_dir.exists() and str(parent_dir) not in sys.path:
     sys.path.insert(0, str(parent_dir))
 
 from setuptools import setup
+from setuptools.command.build_py import build_py
 
-setup()
+
+class BuildPyWithManifest(build_py):
+    """Regenerates the model manifest before the package files are collected."""
+
+    def run(self):
+        from hwcomponents_library.manifest import write_manifest
+
+        write_manifest()
+        super().run()
+
+
+setup(cmdclass={"build_py": BuildPyWithManifest})
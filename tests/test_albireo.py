@@ -0,0 +1,17 @@
+import numpy as np
+import pytest
+
+from hwcomponents_library.library import albireo
+
+CLASSES = [
+    getattr(albireo, name) for name in dir(albireo) if name.startswith("Albireo")
+]
+
+
+@pytest.mark.parametrize("cls", CLASSES, ids=lambda cls: cls.__name__)
+def test_array_tech_node_matches_scalars(cls):
+    tech_nodes = np.array([[7e-9], [22e-9], [65e-9]])
+    component = cls(tech_node=tech_nodes)
+    assert component.area.shape == tech_nodes.shape
+    for tech_node, area in zip(tech_nodes.ravel(), component.area.ravel()):
+        assert area == cls(tech_node=tech_node).area
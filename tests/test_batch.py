@@ -0,0 +1,19 @@
+import numpy as np
+
+from hwcomponents_library import batch
+
+
+def test_empty_table():
+    costs = batch.evaluate("IsaacADC", {"tech_node": []})
+    expected = batch.evaluate("IsaacADC", {"tech_node": [65e-9]})
+    assert list(costs) == list(expected)
+    assert all(column.shape == (0,) for column in costs.values())
+
+
+def test_matches_row_by_row_evaluation():
+    table = {"tech_node": [65e-9, 32e-9, 32e-9], "resolution": [8, 8, 10]}
+    costs = batch.evaluate("IsaacADC", table)
+    for i in range(3):
+        row = batch.evaluate("IsaacADC", {k: v[i] for k, v in table.items()})
+        for name, column in costs.items():
+            np.testing.assert_allclose(column[i], row[name][0], rtol=1e-12)
@@ -0,0 +1,20 @@
+from hwcomponents_library import cacti_cache
+
+
+def key(size):
+    return ("ram", size, 64, size // 64, 32e-9, 1, 1, 1, 0)
+
+
+def values(size):
+    return (1e-12, 2e-12, 1e-6, size * 1e-12, 1e-9, 1e-9)
+
+
+def test_memo_drops_the_least_recently_used(tmp_path):
+    cache = cacti_cache._CactiCache()
+    cache.path = tmp_path / "cache.sqlite"
+    cache.max_entries = 2
+    cache.put(key(1024), values(1024))
+    cache.put(key(2048), values(2048))
+    assert cache.get(key(1024)) == values(1024)
+    cache.put(key(4096), values(4096))
+    assert list(cache.memo) == [key(1024), key(4096)]
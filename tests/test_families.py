@@ -0,0 +1,22 @@
+import logging
+
+from hwcomponents_library import families
+
+
+def test_unknown_families_are_ignored_with_a_warning(monkeypatch, caplog):
+    monkeypatch.setenv(families.FAMILIES_ENV_VAR, "isaac, bogus")
+    with caplog.at_level(logging.WARNING):
+        assert families.selected_families() == ["isaac"]
+    assert "bogus" in caplog.text
+
+
+def test_families_of_other_distributions_can_be_selected(monkeypatch):
+    registered = {**families.discover_families(), "other": "other_package.family"}
+    monkeypatch.setattr(families, "discover_families", lambda: registered)
+    monkeypatch.setenv(families.FAMILIES_ENV_VAR, "other,albireo")
+    assert families.selected_families() == ["other", "albireo"]
+
+
+def test_no_selection(monkeypatch):
+    monkeypatch.delenv(families.FAMILIES_ENV_VAR, raising=False)
+    assert families.selected_families() is None
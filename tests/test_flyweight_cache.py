@@ -0,0 +1,29 @@
+import pytest
+
+from hwcomponents_library import IsaacADC
+from hwcomponents_library.base import LibraryEstimatorClassBase
+
+
+@pytest.fixture(autouse=True)
+def no_flyweight_cache():
+    LibraryEstimatorClassBase.disable_flyweight_cache()
+    yield
+    LibraryEstimatorClassBase.disable_flyweight_cache()
+
+
+def test_disabling_a_base_class_disables_subclasses():
+    IsaacADC.enable_flyweight_cache(4)
+    assert IsaacADC(tech_node=32e-9) is IsaacADC(tech_node=32e-9)
+
+    LibraryEstimatorClassBase.disable_flyweight_cache()
+    assert IsaacADC._flyweight_cache_size == 0
+    assert IsaacADC(tech_node=32e-9) is not IsaacADC(tech_node=32e-9)
+
+
+def test_enabling_a_base_class_enables_subclasses():
+    IsaacADC.enable_flyweight_cache(4)
+    IsaacADC.disable_flyweight_cache()
+
+    LibraryEstimatorClassBase.enable_flyweight_cache(8)
+    assert IsaacADC._flyweight_cache_size == 8
+    assert IsaacADC(tech_node=32e-9) is IsaacADC(tech_node=32e-9)
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from hwcomponents_library import C2CLadderDAC, DualSidedR2RLadderDAC, R2RLadderDAC
+
+DACS = {
+    C2CLadderDAC: dict(unit_capacitance=1e-15),
+    R2RLadderDAC: dict(unit_resistance=1e4),
+    DualSidedR2RLadderDAC: dict(unit_resistance=1e4),
+}
+
+
+@pytest.mark.parametrize("cls", DACS, ids=lambda cls: cls.__name__)
+@pytest.mark.parametrize("resolution", range(4, 13))
+@pytest.mark.parametrize("length", ["2", "3", "7", "half", "full"])
+def test_moments_match_codes(cls, resolution, length):
+    n = {"half": 2 ** (resolution - 1) + 1, "full": 2**resolution}.get(length)
+    n = int(length) if n is None else n
+    hist = np.random.default_rng(resolution * n).random(n).tolist()
+    dac = cls(
+        resolution=resolution, voltage=0.8, tech_node=32e-9, hist=hist, **DACS[cls]
+    )
+    energy, probabilities = dac._expected_energy_from_codes()
+    moments_energy, moments_probabilities = dac._expected_energy_from_moments()
+    assert moments_energy == pytest.approx(energy, rel=1e-12)
+    np.testing.assert_allclose(moments_probabilities, probabilities, rtol=0, atol=1e-12)
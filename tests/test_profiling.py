@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from hwcomponents_library import IsaacADC, profiling
+
+
+@pytest.fixture(autouse=True)
+def no_profiling():
+    yield
+    profiling.disable()
+    profiling.reset()
+
+
+def counts():
+    return {(s.class_name, s.action): s.count for s in profiling.stats()}
+
+
+def test_frozen_costs_are_profiled():
+    component = IsaacADC(tech_node=32e-9)
+    component.freeze_costs()
+    with profiling.profile():
+        component.read()
+        component.read()
+    assert counts() == {("IsaacADC", "read"): 2}
+
+
+def test_array_parameters_are_profiled():
+    component = IsaacADC(tech_node=np.array([65e-9, 32e-9]))
+    with profiling.profile():
+        component.read()
+    assert counts() == {("IsaacADC", "read"): 1}
+
+
+def test_stand_ins_are_not_profiled_after_disabling():
+    component = IsaacADC(tech_node=32e-9)
+    with profiling.profile():
+        component.freeze_costs()
+    profiling.reset()
+    component.read()
+    assert counts() == {}
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from hwcomponents_library import sink, sweep
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+TABLES = [
+    {"x": np.array([1, 2]), "y": np.array([1.0, 2.0])},
+    {"x": np.array([1.5]), "z": np.array([7])},
+    {"x": np.array([3])},
+]
+EXPECTED = {
+    "x": [1.0, 2.0, 1.5, 3.0],
+    "y": [1.0, 2.0, None, None],
+    "z": [None, None, 7, None],
+}
+
+
+def read_arrow(path):
+    with pa.ipc.open_file(path) as reader:
+        return reader.read_all()
+
+
+@pytest.mark.parametrize("row_group_size", [1, 2, 100])
+@pytest.mark.parametrize(
+    "write, read", [(sink.write_parquet, pq.read_table), (sink.write_arrow, read_arrow)]
+)
+def test_tables_with_different_columns_and_types(tmp_path, write, read, row_group_size):
+    path = tmp_path / "out"
+    assert write(path, iter(TABLES), row_group_size=row_group_size) == 4
+    table = read(path)
+    assert table.to_pydict() == EXPECTED
+    assert table.schema.field("x").type == pa.float64()
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_sweep_with_different_parameters(tmp_path):
+    points = [{"tech_node": 65e-9}, {"tech_node": 32e-9, "resolution": 4}]
+    path = tmp_path / "isaac_adc.parquet"
+    tables = sweep.sweep("IsaacADC", points, max_workers=1)
+    assert sink.write_parquet(path, tables) == 2
+    assert pq.read_table(path).column("resolution").to_pylist() == [None, 4]